@@ -1,16 +1,24 @@
 """Пакет прикладного слоя: use cases, порты (интерфейсы), DTO."""
 
+from .queries import TaskQueries
 from .repositories import (
     CategoryRepository,
     ProductRepository,
+    ProductSetRepository,
     TaskRepository,
     UserRepository,
 )
+from .unit_of_work import UnitOfWork
+from .versions import EntityVersion
 
 __all__ = [
     "UserRepository",
     "TaskRepository",
     "ProductRepository",
+    "ProductSetRepository",
     "CategoryRepository",
+    "UnitOfWork",
+    "EntityVersion",
+    "TaskQueries",
 ]
 
@@ -0,0 +1,63 @@
+"""Курсорная (keyset) пагинация списков."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """Ключ сортировки последней строки страницы: (created_at, id)."""
+
+    created_at: datetime
+    id: str
+
+
+@dataclass
+class Page(Generic[T]):
+    """Страница списка с курсором на следующую страницу."""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(keyset: Keyset) -> str:
+    """Закодировать ключ в непрозрачный курсор."""
+    payload = json.dumps([keyset.created_at.isoformat(), keyset.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Keyset:
+    """Раскодировать курсор, полученный от клиента."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return Keyset(created_at=datetime.fromisoformat(created_at), id=str(item_id))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Некорректный курсор пагинации")
+
+
+def make_page(items: List[T], limit: int) -> Page[T]:
+    """Собрать страницу из limit + 1 загруженных элементов.
+
+    Лишний элемент только сообщает, что следующая страница существует.
+    Элементы должны иметь поля id (value object или строка) и created_at —
+    атрибутами или, у строк read model, ключами словаря.
+    """
+    if len(items) <= limit:
+        return Page(items=items)
+    items = items[:limit]
+    last = items[-1]
+    if isinstance(last, dict):
+        keyset = Keyset(created_at=last["created_at"], id=last["id"])
+    else:
+        keyset = Keyset(created_at=last.created_at, id=getattr(last.id, "value", last.id))
+    return Page(items=items, next_cursor=encode_cursor(keyset))
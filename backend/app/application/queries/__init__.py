@@ -0,0 +1,12 @@
+"""Интерфейсы запросов чтения (read model).
+
+В отличие от репозиториев, запросы возвращают не доменные сущности,
+а готовые для ответа словари: списки только читаются, и собирать для
+них сущности с value objects незачем.
+"""
+
+from .task_queries import TaskQueries
+
+__all__ = [
+    "TaskQueries",
+]
@@ -0,0 +1,29 @@
+"""Интерфейс запросов чтения задач."""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ...domain.value_objects import UserId
+from ..pagination import Keyset
+
+
+class TaskQueries(ABC):
+    """Списки задач в виде словарей с полями ответа.
+
+    Ключи словаря: id, title, description, status, priority, category_id,
+    assignee_id, creator_id, deadline, created_at, updated_at, completed_at,
+    completion_photos, completion_comment, project_id. ID — строки,
+    статус и приоритет — перечисления домена.
+    """
+
+    @abstractmethod
+    async def list_rows(
+        self,
+        assignee_id: Optional[UserId] = None,
+        creator_id: Optional[UserId] = None,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[dict]:
+        """Получить задачи, подходящие под все заданные фильтры, от новых к старым."""
+        pass
@@ -2,6 +2,7 @@
 
 from .category_repository import CategoryRepository
 from .product_repository import ProductRepository
+from .product_set_repository import ProductSetRepository
 from .task_repository import TaskRepository
 from .user_repository import UserRepository
 
@@ -9,6 +10,7 @@ __all__ = [
     "UserRepository",
     "TaskRepository",
     "ProductRepository",
+    "ProductSetRepository",
     "CategoryRepository",
 ]
 
@@ -1,14 +1,20 @@
 """Интерфейс репозитория товаров."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
 from ...domain.product import Product
 from ...domain.value_objects import ProductId
+from ..pagination import Keyset
 
 
 class ProductRepository(ABC):
-    """Интерфейс для работы с товарами."""
+    """Интерфейс для работы с товарами.
+
+    Списки отсортированы в порядке добавления по (created_at, id). Параметры
+    limit и after задают размер страницы и ключ последней строки предыдущей.
+    """
 
     @abstractmethod
     async def create(self, product: Product) -> Product:
@@ -20,38 +26,94 @@ class ProductRepository(ABC):
         """Получить товар по ID."""
         pass
 
+    @abstractmethod
+    async def list_by_ids(self, product_ids: List[ProductId]) -> List[Product]:
+        """Получить товары по списку ID одним запросом."""
+        pass
+
+    @abstractmethod
+    async def list_by_ids_or_barcodes(self, keys: List[str], project_id: Optional[str] = None) -> List[Product]:
+        """Получить товары проекта, у которых ID или штрих-код входит в keys, одним запросом."""
+        pass
+
     @abstractmethod
     async def update(self, product: Product) -> Product:
         """Обновить товар."""
         pass
 
+    @abstractmethod
+    async def adjust_quantity(self, product_id: ProductId, delta: int, updated_at: datetime) -> Optional[Product]:
+        """Изменить остаток на delta (списание — отрицательное delta), если его хватает.
+
+        Проверка остатка, запись и пересчёт статуса OUT_OF_STOCK/ACTIVE
+        выполняются атомарно. Возвращает обновлённый товар или None, если
+        товар не найден или остатка не хватает.
+        """
+        pass
+
+    @abstractmethod
+    async def subtract_many(
+        self, amounts: Dict[ProductId, int], updated_at: datetime, project_id: Optional[str] = None
+    ) -> int:
+        """Списать несколько товаров проекта одним пакетным запросом.
+
+        Каждый товар списывается, только если он относится к проекту
+        project_id (без него — товары вне проектов) и его остатка хватает
+        (как в adjust_quantity). Возвращает число списанных товаров: если
+        оно меньше len(amounts), вызывающий откатывает транзакцию.
+        """
+        pass
+
+    @abstractmethod
+    async def set_quantities(self, quantities: Dict[ProductId, int], updated_at: datetime) -> None:
+        """Установить остатки нескольких товаров одним пакетным запросом.
+
+        Статус OUT_OF_STOCK/ACTIVE пересчитывается так же, как в adjust_quantity.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, product_id: ProductId) -> None:
         """Удалить товар."""
         pass
 
     @abstractmethod
-    async def list_all(self, project_id: Optional[str] = None) -> List[Product]:
+    async def list_all(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[Product]:
         """Получить список всех товаров."""
         pass
 
     @abstractmethod
-    async def list_low_stock(self, threshold: int = 10, project_id: Optional[str] = None) -> List[Product]:
+    async def list_low_stock(
+        self,
+        threshold: int = 10,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[Product]:
         """Получить список товаров с низким остатком."""
         pass
 
     @abstractmethod
-    async def list_out_of_stock(self, project_id: Optional[str] = None) -> List[Product]:
+    async def list_out_of_stock(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[Product]:
         """Получить список товаров, которых нет в наличии."""
         pass
 
     @abstractmethod
-    async def search_by_name(self, name: str, project_id: Optional[str] = None) -> List[Product]:
-        """Поиск товаров по названию."""
+    async def search_by_name(
+        self, name: str, project_id: Optional[str] = None, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Product]:
+        """Поиск товаров по названию и описанию, от более релевантных к менее.
+
+        Последнее слово запроса ищется по началу (запрос набирается по буквам).
+        """
         pass
 
     @abstractmethod
     async def get_by_barcode(self, barcode: str, project_id: Optional[str] = None) -> Optional[Product]:
-        """Получить товар по штрих-коду."""
+        """Получить товар проекта по штрих-коду (штрих-код уникален в пределах проекта)."""
         pass
 
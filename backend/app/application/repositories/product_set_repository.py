@@ -0,0 +1,25 @@
+"""Интерфейс репозитория комплектов товаров."""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ...domain.task_template import ProductSet
+
+
+class ProductSetRepository(ABC):
+    """Интерфейс для работы с комплектами товаров."""
+
+    @abstractmethod
+    async def create(self, product_set: ProductSet) -> ProductSet:
+        """Создать комплект вместе с позициями."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, product_set_id: str) -> Optional[ProductSet]:
+        """Получить комплект с позициями по ID."""
+        pass
+
+    @abstractmethod
+    async def list_by_ids(self, product_set_ids: List[str]) -> List[ProductSet]:
+        """Получить комплекты с позициями по списку ID одним запросом."""
+        pass
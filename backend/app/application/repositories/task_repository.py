@@ -5,27 +5,70 @@ from datetime import datetime
 from typing import List, Optional
 
 from ...domain.task import Task
-from ...domain.value_objects import TaskId, UserId
+from ...domain.value_objects import Comment, PhotoUrl, TaskId, UserId
+from ..pagination import Keyset
+from ..versions import EntityVersion
 
 
 class TaskRepository(ABC):
-    """Интерфейс для работы с задачами."""
+    """Интерфейс для работы с задачами.
+
+    Списки отсортированы от новых к старым по (created_at, id). Параметры
+    limit и after задают размер страницы и ключ последней строки предыдущей.
+    """
 
     @abstractmethod
     async def create(self, task: Task) -> Task:
         """Создать задачу."""
         pass
 
+    @abstractmethod
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        """Создать несколько задач в одной транзакции."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, task_id: TaskId) -> Optional[Task]:
         """Получить задачу по ID."""
         pass
 
+    @abstractmethod
+    async def get_version(self, task_id: TaskId) -> Optional[EntityVersion]:
+        """Получить версию задачи, не загружая её целиком."""
+        pass
+
+    @abstractmethod
+    async def list_versions(
+        self,
+        assignee_id: Optional[UserId] = None,
+        creator_id: Optional[UserId] = None,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[EntityVersion]:
+        """Получить версии задач, подходящих под все заданные фильтры, в порядке списков."""
+        pass
+
     @abstractmethod
     async def update(self, task: Task) -> Task:
         """Обновить задачу."""
         pass
 
+    @abstractmethod
+    async def complete(
+        self,
+        task_id: TaskId,
+        completed_at: datetime,
+        comment: Optional[Comment] = None,
+        photos: Optional[List[PhotoUrl]] = None,
+    ) -> Optional[Task]:
+        """Отметить задачу выполненной, если она ещё не выполнена.
+
+        Проверка статуса и запись выполняются атомарно. Возвращает
+        обновлённую задачу или None, если задача не найдена или уже выполнена.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, task_id: TaskId) -> None:
         """Удалить задачу."""
@@ -33,20 +76,30 @@ class TaskRepository(ABC):
 
     @abstractmethod
     async def list_by_assignee(
-        self, assignee_id: UserId, project_id: Optional[str] = None
+        self,
+        assignee_id: UserId,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
     ) -> List[Task]:
         """Получить список задач по исполнителю."""
         pass
 
     @abstractmethod
     async def list_by_creator(
-        self, creator_id: UserId, project_id: Optional[str] = None
+        self,
+        creator_id: UserId,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
     ) -> List[Task]:
         """Получить список задач по создателю."""
         pass
 
     @abstractmethod
-    async def list_by_project(self, project_id: str) -> List[Task]:
+    async def list_by_project(
+        self, project_id: str, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[Task]:
         """Получить список всех задач проекта."""
         pass
 
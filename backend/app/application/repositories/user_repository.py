@@ -5,10 +5,16 @@ from typing import List, Optional
 
 from ...domain.user import User
 from ...domain.value_objects import UserId
+from ..pagination import Keyset
+from ..versions import EntityVersion
 
 
 class UserRepository(ABC):
-    """Интерфейс для работы с пользователями."""
+    """Интерфейс для работы с пользователями.
+
+    Списки отсортированы в порядке регистрации по (created_at, id). Параметры
+    limit и after задают размер страницы и ключ последней строки предыдущей.
+    """
 
     @abstractmethod
     async def create(self, user: User) -> User:
@@ -20,11 +26,32 @@ class UserRepository(ABC):
         """Получить пользователя по ID."""
         pass
 
+    @abstractmethod
+    async def list_by_ids(self, user_ids: List[UserId]) -> List[User]:
+        """Получить пользователей по списку ID одним запросом."""
+        pass
+
     @abstractmethod
     async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         """Получить пользователя по Telegram ID."""
         pass
 
+    @abstractmethod
+    async def get_version(self, user_id: UserId) -> Optional[EntityVersion]:
+        """Получить версию пользователя, не загружая его целиком."""
+        pass
+
+    @abstractmethod
+    async def list_versions(
+        self,
+        project_id: Optional[str] = None,
+        active_only: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[EntityVersion]:
+        """Получить версии пользователей в порядке списков."""
+        pass
+
     @abstractmethod
     async def update(self, user: User) -> User:
         """Обновить пользователя."""
@@ -36,12 +63,16 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_all(self, project_id: Optional[str] = None) -> List[User]:
+    async def list_all(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[User]:
         """Получить список всех пользователей."""
         pass
 
     @abstractmethod
-    async def list_active(self, project_id: Optional[str] = None) -> List[User]:
+    async def list_active(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[User]:
         """Получить список активных пользователей."""
         pass
 
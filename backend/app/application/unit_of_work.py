@@ -0,0 +1,35 @@
+"""Интерфейс единицы работы (Unit of Work)."""
+
+from abc import ABC, abstractmethod
+
+from .repositories import ProductRepository, ProductSetRepository, TaskRepository, UserRepository
+
+
+class UnitOfWork(ABC):
+    """Репозитории, работающие в одной транзакции.
+
+    Репозитории единицы работы не фиксируют изменения сами: все записи
+    use case попадают в одну транзакцию и фиксируются одним commit().
+    Выход из блока ``async with`` без commit() откатывает изменения.
+    """
+
+    tasks: TaskRepository
+    users: UserRepository
+    products: ProductRepository
+    product_sets: ProductSetRepository
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        await self.rollback()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Зафиксировать все изменения."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Отменить незафиксированные изменения."""
+        pass
@@ -1,15 +1,48 @@
 """Use cases для бизнес-логики."""
 
-from .task_use_cases import CompleteTaskUseCase, CreateTaskUseCase, GetTaskUseCase, ListTasksUseCase
+from .inventory_use_cases import (
+    Discrepancy,
+    InventoryCount,
+    InventorySummary,
+    ReconcileInventoryUseCase,
+)
+from .product_use_cases import (
+    CreateProductSetUseCase,
+    CreateProductUseCase,
+    GetProductSetUseCase,
+    GetProductUseCase,
+    ListProductsUseCase,
+    WriteOffProductUseCase,
+)
+from .task_use_cases import (
+    CompleteTaskUseCase,
+    CreateTasksBatchUseCase,
+    CreateTaskUseCase,
+    GetTaskUseCase,
+    ListTasksUseCase,
+    NewTask,
+)
 from .user_use_cases import CreateUserUseCase, GetUserUseCase, ListUsersUseCase
 
 __all__ = [
     "CreateTaskUseCase",
+    "CreateTasksBatchUseCase",
+    "NewTask",
     "GetTaskUseCase",
     "CompleteTaskUseCase",
     "ListTasksUseCase",
     "CreateUserUseCase",
     "GetUserUseCase",
     "ListUsersUseCase",
+    "CreateProductUseCase",
+    "GetProductUseCase",
+    "ListProductsUseCase",
+    "WriteOffProductUseCase",
+    "CreateProductSetUseCase",
+    "GetProductSetUseCase",
+    "ReconcileInventoryUseCase",
+    "InventoryCount",
+    "Discrepancy",
+    "InventorySummary",
 ]
 
@@ -0,0 +1,141 @@
+"""Use cases для инвентаризации."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterable, Callable, Dict, List, Optional
+
+from ...domain.product import Product
+from ...domain.value_objects import ProductId
+from ..unit_of_work import UnitOfWork
+
+# Сколько строк пересчёта сверяется за один запрос с IN
+INVENTORY_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryCount:
+    """Строка пересчёта: товар (ID или штрих-код) и фактический остаток."""
+
+    line: int
+    key: str
+    counted: int
+
+    def __post_init__(self):
+        """Валидация строки."""
+        if self.counted < 0:
+            raise ValueError(f"Строка {self.line}: остаток не может быть отрицательным")
+
+
+@dataclass(frozen=True, slots=True)
+class Discrepancy:
+    """Расхождение пересчёта с учётом; product_id None — товар не найден."""
+
+    line: int
+    key: str
+    counted: int
+    product_id: Optional[str] = None
+    name: Optional[str] = None
+    expected: Optional[int] = None
+
+    @property
+    def difference(self) -> Optional[int]:
+        """Излишек (больше нуля) или недостача (меньше нуля)."""
+        return None if self.expected is None else self.counted - self.expected
+
+
+@dataclass(slots=True)
+class InventorySummary:
+    """Итоги инвентаризации."""
+
+    rows: int = 0
+    matched: int = 0
+    corrected: int = 0
+    unknown: int = 0
+
+
+class ReconcileInventoryUseCase:
+    """Use case для сверки пересчёта склада с учётными остатками."""
+
+    def __init__(self, uow: UnitOfWork, chunk_size: int = INVENTORY_CHUNK_SIZE):
+        self.uow = uow
+        self.chunk_size = chunk_size
+
+    async def execute(
+        self,
+        counts: AsyncIterable[InventoryCount],
+        report: Callable[[Discrepancy], None],
+        project_id: Optional[str] = None,
+    ) -> InventorySummary:
+        """Сверить пересчёт и исправить остатки: всё или ничего.
+
+        Строки читаются и сверяются порциями по chunk_size: товары порции
+        находятся одним запросом с IN. Остатки до конца пересчёта не
+        меняются, поэтому каждая строка сверяется с учётным остатком. Если
+        товар встречается в пересчёте несколько раз, действует последняя
+        строка: исправление пишется, только если она расходится с учётом,
+        и в отчёт попадает только её расхождение. Отчёт передаётся в report,
+        а исправления пишутся одним пакетным UPDATE после последней строки.
+        Память зависит от числа расхождений, а не от размера пересчёта. Все
+        исправления фиксируются одной транзакцией; ошибка в любой строке
+        откатывает их целиком.
+        """
+        summary = InventorySummary()
+        # Итоговое расхождение по товару на весь пересчёт и строки с неизвестными товарами
+        corrections: Dict[ProductId, Discrepancy] = {}
+        unknown: List[Discrepancy] = []
+        async with self.uow:
+            chunk: List[InventoryCount] = []
+            async for count in counts:
+                chunk.append(count)
+                if len(chunk) == self.chunk_size:
+                    await self._reconcile(chunk, project_id, corrections, unknown, summary)
+                    chunk = []
+            if chunk:
+                await self._reconcile(chunk, project_id, corrections, unknown, summary)
+            for discrepancy in sorted([*unknown, *corrections.values()], key=lambda discrepancy: discrepancy.line):
+                report(discrepancy)
+            summary.corrected = len(corrections)
+            await self.uow.products.set_quantities(
+                {product_id: discrepancy.counted for product_id, discrepancy in corrections.items()},
+                datetime.utcnow(),
+            )
+            await self.uow.commit()
+        return summary
+
+    async def _reconcile(
+        self,
+        chunk: List[InventoryCount],
+        project_id: Optional[str],
+        corrections: Dict[ProductId, Discrepancy],
+        unknown: List[Discrepancy],
+        summary: InventorySummary,
+    ) -> None:
+        """Сверить одну порцию строк."""
+        products = await self.uow.products.list_by_ids_or_barcodes([count.key for count in chunk], project_id)
+        by_key: Dict[str, Product] = {}
+        for product in products:
+            if product.barcode:
+                by_key[product.barcode.value] = product
+        # ID важнее штрих-кода, если строка совпала и с тем и с другим
+        by_key.update((product.id.value, product) for product in products)
+
+        for count in chunk:
+            summary.rows += 1
+            product = by_key.get(count.key)
+            if product is None:
+                summary.unknown += 1
+                unknown.append(Discrepancy(line=count.line, key=count.key, counted=count.counted))
+                continue
+            summary.matched += 1
+            if product.quantity.value == count.counted:
+                # Повтор строки с учётным остатком отменяет исправление из предыдущей
+                corrections.pop(product.id, None)
+            else:
+                corrections[product.id] = Discrepancy(
+                    line=count.line,
+                    key=count.key,
+                    counted=count.counted,
+                    product_id=product.id.value,
+                    name=product.name,
+                    expected=product.quantity.value,
+                )
@@ -0,0 +1,201 @@
+"""Use cases для работы с товарами."""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from ...domain.enums import ProductStatus
+from ...domain.identifiers import new_id
+from ...domain.product import Product
+from ...domain.task_template import ProductSet
+from ...domain.value_objects import Barcode, CategoryId, PhotoUrl, ProductId, Quantity
+from ..pagination import DEFAULT_PAGE_SIZE, Page, decode_cursor, make_page
+from ..repositories import ProductRepository, ProductSetRepository
+
+# Порог «заканчивающегося» товара по умолчанию (как в Product.is_low_stock)
+DEFAULT_LOW_STOCK_THRESHOLD = 10
+# Результатов поиска на странице: поиск идёт по мере набора запроса
+DEFAULT_SEARCH_PAGE_SIZE = 20
+
+
+class CreateProductUseCase:
+    """Use case для создания товара."""
+
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(
+        self,
+        name: str,
+        quantity: int = 0,
+        description: Optional[str] = None,
+        category_id: Optional[CategoryId] = None,
+        photo_url: Optional[str] = None,
+        barcode: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ) -> Product:
+        """Создать новый товар.
+
+        Штрих-код уникален в пределах проекта (и среди товаров вне проектов).
+        Проверка заранее даёт понятную ошибку в обычном случае; одновременное
+        добавление того же штрих-кода отсекает уникальный индекс при вставке.
+        """
+        if barcode and await self.product_repository.get_by_barcode(barcode, project_id):
+            raise ValueError("Товар с таким штрих-кодом уже существует")
+
+        now = datetime.utcnow()
+        product = Product(
+            id=ProductId(value=new_id()),
+            name=name,
+            quantity=Quantity(quantity),
+            description=description,
+            category_id=category_id,
+            photo_url=PhotoUrl(photo_url) if photo_url else None,
+            barcode=Barcode(barcode) if barcode else None,
+            status=ProductStatus.OUT_OF_STOCK if quantity == 0 else ProductStatus.ACTIVE,
+            created_at=now,
+            updated_at=now,
+            project_id=project_id,
+        )
+        return await self.product_repository.create(product)
+
+
+class GetProductUseCase:
+    """Use case для получения товара."""
+
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, product_id: ProductId) -> Optional[Product]:
+        """Получить товар по ID."""
+        return await self.product_repository.get_by_id(product_id)
+
+    async def execute_by_barcode(self, barcode: str, project_id: Optional[str] = None) -> Optional[Product]:
+        """Получить товар проекта по штрих-коду."""
+        return await self.product_repository.get_by_barcode(barcode, project_id)
+
+
+class WriteOffProductUseCase:
+    """Use case для списания товара со склада."""
+
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, product_id: ProductId, amount: int) -> Product:
+        """Списать amount единиц товара.
+
+        Списание не читает остаток заранее: проверка и запись выполняются
+        одним запросом (см. ProductRepository.adjust_quantity), поэтому
+        одновременные списания одного товара не теряются и не уводят
+        остаток в минус.
+        """
+        if amount <= 0:
+            raise ValueError("Количество должно быть положительным")
+
+        product = await self.product_repository.adjust_quantity(product_id, -amount, datetime.utcnow())
+        if product:
+            return product
+
+        # Причину отказа выясняем только на редком пути неудачи
+        if not await self.product_repository.get_by_id(product_id):
+            raise ValueError("Товар не найден")
+        raise ValueError("Недостаточно товара на складе")
+
+
+class ListProductsUseCase:
+    """Use case для получения списков товаров."""
+
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(
+        self, project_id: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None
+    ) -> Page[Product]:
+        """Получить страницу списка товаров проекта."""
+        after = decode_cursor(cursor) if cursor else None
+        # Запрашиваем на один товар больше, чтобы узнать о следующей странице
+        return make_page(await self.product_repository.list_all(project_id, limit + 1, after), limit)
+
+    async def low_stock(
+        self,
+        project_id: Optional[str] = None,
+        threshold: int = DEFAULT_LOW_STOCK_THRESHOLD,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[Product]:
+        """Получить страницу заканчивающихся товаров проекта."""
+        after = decode_cursor(cursor) if cursor else None
+        return make_page(await self.product_repository.list_low_stock(threshold, project_id, limit + 1, after), limit)
+
+    async def out_of_stock(
+        self, project_id: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None
+    ) -> Page[Product]:
+        """Получить страницу товаров проекта, которых нет в наличии."""
+        after = decode_cursor(cursor) if cursor else None
+        return make_page(await self.product_repository.list_out_of_stock(project_id, limit + 1, after), limit)
+
+    async def search(
+        self,
+        query: str,
+        project_id: Optional[str] = None,
+        limit: int = DEFAULT_SEARCH_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[Product]:
+        """Найти товары проекта по названию и описанию (от более релевантных).
+
+        Результаты упорядочены по релевантности, ключа для keyset-пагинации
+        у них нет, поэтому курсор — смещение следующей страницы.
+        """
+        offset = _decode_offset(cursor)
+        products = await self.product_repository.search_by_name(query, project_id, limit + 1, offset)
+        if len(products) <= limit:
+            return Page(items=products)
+        return Page(items=products[:limit], next_cursor=str(offset + limit))
+
+
+class CreateProductSetUseCase:
+    """Use case для создания комплекта товаров."""
+
+    def __init__(self, product_set_repository: ProductSetRepository, product_repository: ProductRepository):
+        self.product_set_repository = product_set_repository
+        self.product_repository = product_repository
+
+    async def execute(
+        self,
+        name: str,
+        products: Dict[str, int],
+        description: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ) -> ProductSet:
+        """Создать комплект из товаров с количествами."""
+        product_set = ProductSet(id=new_id(), name=name, description=description, project_id=project_id)
+        for product_id, quantity in products.items():
+            product_set.add_product(product_id, quantity)
+
+        # Все товары комплекта проверяются одним запросом
+        product_ids = [ProductId(value=product_id) for product_id in product_set.products]
+        found = {product.id.value for product in await self.product_repository.list_by_ids(product_ids)}
+        missing = sorted(set(product_set.products) - found)
+        if missing:
+            raise ValueError(f"Товар не найден: {', '.join(missing)}")
+
+        return await self.product_set_repository.create(product_set)
+
+
+class GetProductSetUseCase:
+    """Use case для получения комплекта товаров."""
+
+    def __init__(self, product_set_repository: ProductSetRepository):
+        self.product_set_repository = product_set_repository
+
+    async def execute(self, product_set_id: str) -> Optional[ProductSet]:
+        """Получить комплект по ID."""
+        return await self.product_set_repository.get_by_id(product_set_id)
+
+
+def _decode_offset(cursor: Optional[str]) -> int:
+    """Смещение из курсора поиска."""
+    if not cursor:
+        return 0
+    if not cursor.isdigit():
+        raise ValueError("Некорректный курсор пагинации")
+    return int(cursor)
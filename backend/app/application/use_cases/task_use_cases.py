@@ -1,20 +1,53 @@
 """Use cases для работы с задачами."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
+from ...domain.identifiers import new_id
 from ...domain.task import Task
+from ...domain.task_template import ProductSet
+from ...domain.user import User
 from ...domain.enums import TaskPriority, TaskStatus
-from ...domain.value_objects import CategoryId, Deadline, TaskId, UserId
-from ..repositories import TaskRepository, UserRepository
+from ...domain.value_objects import CategoryId, Comment, Deadline, PhotoUrl, TaskId, UserId
+from ..pagination import DEFAULT_PAGE_SIZE, Page, decode_cursor, make_page
+from ..queries import TaskQueries
+from ..repositories import ProductSetRepository, TaskRepository, UserRepository
+from ..unit_of_work import UnitOfWork
+from ..versions import EntityVersion
+from ..write_off import ProductSetWriteOff
+
+
+def _check_product_sets(
+    product_sets: Iterable[ProductSet], product_set_ids: Iterable[str], project_id: Optional[str]
+) -> None:
+    """Проверить, что комплекты задач существуют, включены и относятся к проекту задач.
+
+    Внешний ключ tasks.product_set_id не проверяется в SQLite, а ошибочный
+    комплект при выполнении задачи просто не списался бы, поэтому он
+    отклоняется при создании. Комплект чужого проекта считается не найденным.
+    """
+    found = {product_set.id: product_set for product_set in product_sets if product_set.project_id == project_id}
+    missing = sorted(set(product_set_ids) - set(found))
+    if missing:
+        raise ValueError(f"Комплект товаров не найден: {', '.join(missing)}")
+    inactive = sorted(product_set_id for product_set_id, product_set in found.items() if not product_set.is_active)
+    if inactive:
+        raise ValueError(f"Комплект товаров отключён: {', '.join(inactive)}")
 
 
 class CreateTaskUseCase:
     """Use case для создания задачи."""
 
-    def __init__(self, task_repository: TaskRepository, user_repository: UserRepository):
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        user_repository: UserRepository,
+        product_set_repository: Optional[ProductSetRepository] = None,
+    ):
         self.task_repository = task_repository
         self.user_repository = user_repository
+        self.product_set_repository = product_set_repository
 
     async def execute(
         self,
@@ -26,21 +59,41 @@ class CreateTaskUseCase:
         assignee_id: Optional[UserId] = None,
         deadline: Optional[Deadline] = None,
         project_id: Optional[str] = None,
+        creator: Optional[User] = None,
+        product_set_id: Optional[str] = None,
+        creator_verified: bool = False,
     ) -> Task:
-        """Создать новую задачу."""
+        """Создать новую задачу в проекте project_id (по умолчанию — в проекте создателя).
+
+        Если создатель уже загружен (например, при авторизации), его можно
+        передать в creator, и повторного запроса к БД не будет.
+        creator_verified означает, что существование создателя уже
+        подтверждено (например, токеном сессии) и проверять его не нужно.
+        """
         # Проверка существования пользователя
-        creator = await self.user_repository.get_by_id(creator_id)
-        if not creator:
-            raise ValueError("Пользователь-создатель не найден")
+        if not creator_verified:
+            if creator is None or creator.id != creator_id:
+                creator = await self.user_repository.get_by_id(creator_id)
+            if not creator:
+                raise ValueError("Пользователь-создатель не найден")
+            if project_id is None:
+                project_id = creator.project_id
 
-        if assignee_id:
+        if product_set_id:
+            if self.product_set_repository is None:
+                raise RuntimeError("CreateTaskUseCase создан без ProductSetRepository")
+            product_set = await self.product_set_repository.get_by_id(product_set_id)
+            _check_product_sets([product_set] if product_set else [], [product_set_id], project_id)
+
+        if assignee_id and assignee_id != creator_id:
             assignee = await self.user_repository.get_by_id(assignee_id)
             if not assignee:
                 raise ValueError("Исполнитель не найден")
 
         # Создание задачи
+        now = datetime.utcnow()
         task = Task(
-            id=TaskId(value=str(datetime.utcnow().timestamp())),
+            id=TaskId(value=new_id()),
             title=title,
             description=description,
             status=TaskStatus.PENDING,
@@ -49,14 +102,95 @@ class CreateTaskUseCase:
             assignee_id=assignee_id,
             creator_id=creator_id,
             deadline=deadline,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
             project_id=project_id,
+            product_set_id=product_set_id,
         )
 
         return await self.task_repository.create(task)
 
 
+@dataclass
+class NewTask:
+    """Данные одной задачи для пакетного создания."""
+
+    title: str
+    description: Optional[str] = None
+    priority: TaskPriority = TaskPriority.MEDIUM
+    category_id: Optional[CategoryId] = None
+    assignee_id: Optional[UserId] = None
+    deadline: Optional[Deadline] = None
+    product_set_id: Optional[str] = None
+
+
+class CreateTasksBatchUseCase:
+    """Use case для пакетного создания задач (например, чек-лист открытия смены)."""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(
+        self,
+        creator_id: UserId,
+        items: List[NewTask],
+        project_id: Optional[str] = None,
+        creator_project_id: Optional[str] = None,
+        creator_verified: bool = False,
+    ) -> List[Task]:
+        """Создать задачи в проекте создателя: все или ни одной.
+
+        Проект берётся, как и в CreateTaskUseCase, из creator_project_id,
+        если создатель и его проект заверены (creator_verified, например
+        токеном сессии), иначе — у загруженного создателя. Указанный в
+        project_id другой проект отклоняется.
+        """
+        # Создатель и все исполнители проверяются одним запросом
+        user_ids = {creator_id} | {item.assignee_id for item in items if item.assignee_id}
+        found = {user.id: user for user in await self.uow.users.list_by_ids(list(user_ids))}
+        if creator_id not in found:
+            raise ValueError("Пользователь-создатель не найден")
+        missing = sorted(user_id.value for user_id in user_ids - set(found))
+        if missing:
+            raise ValueError(f"Исполнитель не найден: {', '.join(missing)}")
+
+        if not creator_verified:
+            creator_project_id = found[creator_id].project_id
+        if project_id is not None and project_id != creator_project_id:
+            raise ValueError("Нельзя создавать задачи в чужом проекте")
+        project_id = creator_project_id
+
+        # Комплекты всех задач пакета — тоже одним запросом
+        product_set_ids = {item.product_set_id for item in items if item.product_set_id}
+        if product_set_ids:
+            product_sets = await self.uow.product_sets.list_by_ids(list(product_set_ids))
+            _check_product_sets(product_sets, product_set_ids, project_id)
+
+        now = datetime.utcnow()
+        tasks = [
+            Task(
+                id=TaskId(value=new_id()),
+                title=item.title,
+                description=item.description,
+                status=TaskStatus.PENDING,
+                priority=item.priority,
+                category_id=item.category_id,
+                assignee_id=item.assignee_id,
+                creator_id=creator_id,
+                deadline=item.deadline,
+                created_at=now,
+                updated_at=now,
+                project_id=project_id,
+                product_set_id=item.product_set_id,
+            )
+            for item in items
+        ]
+        async with self.uow:
+            created = await self.uow.tasks.create_many(tasks)
+            await self.uow.commit()
+        return created
+
+
 class GetTaskUseCase:
     """Use case для получения задачи."""
 
@@ -67,44 +201,126 @@ class GetTaskUseCase:
         """Получить задачу по ID."""
         return await self.task_repository.get_by_id(task_id)
 
+    async def version(self, task_id: TaskId) -> Optional[EntityVersion]:
+        """Получить версию задачи без загрузки всей задачи."""
+        return await self.task_repository.get_version(task_id)
+
 
 class CompleteTaskUseCase:
     """Use case для выполнения задачи."""
 
-    def __init__(self, task_repository: TaskRepository):
-        self.task_repository = task_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     async def execute(
         self, task_id: TaskId, comment: Optional[str] = None, photos: Optional[List[str]] = None
     ) -> Task:
-        """Отметить задачу как выполненную."""
-        task = await self.task_repository.get_by_id(task_id)
-        if not task:
-            raise ValueError("Задача не найдена")
+        """Отметить задачу как выполненную.
+
+        Правило «выполненную задачу нельзя выполнить повторно» проверяется
+        в том же запросе, что и запись, поэтому гонка двух исполнителей
+        невозможна: выигрывает ровно один.
 
-        task.mark_as_completed(comment=comment, photos=photos)
-        return await self.task_repository.update(task)
+        Если к задаче привязан активный комплект товаров, он списывается в
+        той же транзакции: при нехватке товара задача остаётся невыполненной.
+        """
+        async with self.uow:
+            task = await self.uow.tasks.complete(
+                task_id,
+                completed_at=datetime.utcnow(),
+                comment=Comment(comment) if comment else None,
+                photos=[PhotoUrl(photo) for photo in photos] if photos else None,
+            )
+            if task:
+                if task.product_set_id:
+                    await self._write_off(task)
+                await self.uow.commit()
+                return task
+
+            # Причину отказа выясняем только на редком пути неудачи
+            if not await self.uow.tasks.get_by_id(task_id):
+                raise ValueError("Задача не найдена")
+            raise ValueError("Задача уже выполнена")
+
+    async def _write_off(self, task: Task) -> None:
+        """Списать комплект товаров задачи (удалённый или отключённый комплект пропускается)."""
+        product_set = await self.uow.product_sets.get_by_id(task.product_set_id)
+        if product_set and product_set.is_active:
+            await ProductSetWriteOff(self.uow.products).apply(product_set, task.completed_at, task.project_id)
 
 
 class ListTasksUseCase:
     """Use case для получения списка задач."""
 
-    def __init__(self, task_repository: TaskRepository):
+    def __init__(self, task_repository: TaskRepository, task_queries: Optional[TaskQueries] = None):
         self.task_repository = task_repository
+        self.task_queries = task_queries
 
     async def execute(
         self,
         assignee_id: Optional[UserId] = None,
         creator_id: Optional[UserId] = None,
         project_id: Optional[str] = None,
-    ) -> List[Task]:
-        """Получить список задач."""
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[Task]:
+        """Получить страницу списка задач."""
+        after = decode_cursor(cursor) if cursor else None
+        # Запрашиваем на одну задачу больше, чтобы узнать о следующей странице
         if assignee_id:
-            return await self.task_repository.list_by_assignee(assignee_id, project_id)
+            tasks = await self.task_repository.list_by_assignee(assignee_id, project_id, limit + 1, after)
         elif creator_id:
-            return await self.task_repository.list_by_creator(creator_id, project_id)
+            tasks = await self.task_repository.list_by_creator(creator_id, project_id, limit + 1, after)
         elif project_id:
-            return await self.task_repository.list_by_project(project_id)
+            tasks = await self.task_repository.list_by_project(project_id, limit + 1, after)
         else:
-            return []
+            tasks = []
+        return make_page(tasks, limit)
+
+    async def rows(
+        self,
+        assignee_id: Optional[UserId] = None,
+        creator_id: Optional[UserId] = None,
+        project_id: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[dict]:
+        """Получить ту же страницу, что execute(), строками read model (см. TaskQueries)."""
+        if self.task_queries is None:
+            raise RuntimeError("ListTasksUseCase создан без TaskQueries")
+        after = decode_cursor(cursor) if cursor else None
+        filters = self._filters(assignee_id, creator_id, project_id)
+        if filters is None:
+            return Page()
+        rows = await self.task_queries.list_rows(limit=limit + 1, after=after, **filters)
+        return make_page(rows, limit)
+
+    async def versions(
+        self,
+        assignee_id: Optional[UserId] = None,
+        creator_id: Optional[UserId] = None,
+        project_id: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[EntityVersion]:
+        """Получить версии задач той же страницы, что вернул бы execute()."""
+        after = decode_cursor(cursor) if cursor else None
+        filters = self._filters(assignee_id, creator_id, project_id)
+        if filters is None:
+            return Page()
+        versions = await self.task_repository.list_versions(limit=limit + 1, after=after, **filters)
+        return make_page(versions, limit)
+
+    @staticmethod
+    def _filters(
+        assignee_id: Optional[UserId], creator_id: Optional[UserId], project_id: Optional[str]
+    ) -> Optional[dict]:
+        """Фильтры с тем же приоритетом, что и в execute(); None — список пуст."""
+        if assignee_id:
+            return {"assignee_id": assignee_id, "project_id": project_id}
+        if creator_id:
+            return {"creator_id": creator_id, "project_id": project_id}
+        if project_id:
+            return {"project_id": project_id}
+        return None
 
@@ -1,11 +1,13 @@
 """Use cases для работы с пользователями."""
 
-from typing import List, Optional
+from typing import Optional
 
 from ...domain.user import User
 from ...domain.enums import UserRole
 from ...domain.value_objects import UserId
+from ..pagination import DEFAULT_PAGE_SIZE, Page, decode_cursor, make_page
 from ..repositories import UserRepository
+from ..versions import EntityVersion
 
 
 class CreateUserUseCase:
@@ -21,11 +23,15 @@ class CreateUserUseCase:
         full_name: str,
         role: str,
         project_id: Optional[str] = None,
+        known_new: bool = False,
     ) -> User:
-        """Создать нового пользователя."""
+        """Создать нового пользователя.
+
+        known_new означает, что вызывающий уже убедился в отсутствии
+        пользователя с таким Telegram ID, и повторная проверка не нужна.
+        """
         # Проверка существования пользователя с таким Telegram ID
-        existing_user = await self.user_repository.get_by_telegram_id(telegram_id)
-        if existing_user:
+        if not known_new and await self.user_repository.get_by_telegram_id(telegram_id):
             raise ValueError("Пользователь с таким Telegram ID уже существует")
 
         from datetime import datetime
@@ -55,6 +61,10 @@ class GetUserUseCase:
         """Получить пользователя по ID."""
         return await self.user_repository.get_by_id(user_id)
 
+    async def version(self, user_id: UserId) -> Optional[EntityVersion]:
+        """Получить версию пользователя без загрузки всего пользователя."""
+        return await self.user_repository.get_version(user_id)
+
     async def execute_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         """Получить пользователя по Telegram ID."""
         return await self.user_repository.get_by_telegram_id(telegram_id)
@@ -66,9 +76,31 @@ class ListUsersUseCase:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    async def execute(self, project_id: Optional[str] = None, active_only: bool = False) -> List[User]:
-        """Получить список пользователей."""
+    async def execute(
+        self,
+        project_id: Optional[str] = None,
+        active_only: bool = False,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[User]:
+        """Получить страницу списка пользователей."""
+        after = decode_cursor(cursor) if cursor else None
+        # Запрашиваем на одного пользователя больше, чтобы узнать о следующей странице
         if active_only:
-            return await self.user_repository.list_active(project_id)
-        return await self.user_repository.list_all(project_id)
+            users = await self.user_repository.list_active(project_id, limit + 1, after)
+        else:
+            users = await self.user_repository.list_all(project_id, limit + 1, after)
+        return make_page(users, limit)
+
+    async def versions(
+        self,
+        project_id: Optional[str] = None,
+        active_only: bool = False,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[EntityVersion]:
+        """Получить версии пользователей той же страницы, что вернул бы execute()."""
+        after = decode_cursor(cursor) if cursor else None
+        versions = await self.user_repository.list_versions(project_id, active_only, limit + 1, after)
+        return make_page(versions, limit)
 
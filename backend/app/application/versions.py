@@ -0,0 +1,27 @@
+"""Версии сущностей для условных запросов."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class EntityVersion:
+    """Версия сущности: ID, ключ сортировки и момент последнего изменения.
+
+    Загружается отдельным лёгким запросом, чтобы понять, изменилось ли
+    что-нибудь, не собирая сущности целиком.
+    """
+
+    id: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def of(cls, entity) -> "EntityVersion":
+        """Версия загруженной сущности (с полями id, created_at, updated_at)."""
+        return cls(id=entity.id.value, created_at=entity.created_at, updated_at=entity.updated_at)
+
+    @classmethod
+    def of_row(cls, row: dict) -> "EntityVersion":
+        """Версия строки read model (словаря с ключами id, created_at, updated_at)."""
+        return cls(id=row["id"], created_at=row["created_at"], updated_at=row["updated_at"])
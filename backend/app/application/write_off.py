@@ -0,0 +1,50 @@
+"""Списание комплектов товаров со склада."""
+
+from datetime import datetime
+from typing import Optional
+
+from ..domain.task_template import ProductSet
+from ..domain.value_objects import ProductId
+from .repositories import ProductRepository
+
+
+class ProductSetWriteOff:
+    """Списание всех товаров комплекта в текущей транзакции.
+
+    Остатки проверяются одним запросом с IN, а списываются одним пакетным
+    UPDATE, поэтому число запросов не зависит от размера комплекта. Если
+    хоть одного товара не хватает, выбрасывается ValueError, и единица
+    работы откатывает весь комплект вместе с остальными изменениями.
+    Списываются только товары проекта задачи: товар другого проекта
+    считается не найденным.
+    """
+
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def apply(self, product_set: ProductSet, at: datetime, project_id: Optional[str] = None) -> None:
+        """Списать комплект со склада проекта project_id."""
+        amounts = {ProductId(value=product_id): quantity for product_id, quantity in product_set.products.items()}
+        if not amounts:
+            return
+
+        found = {
+            product.id: product
+            for product in await self.product_repository.list_by_ids(list(amounts))
+            if product.project_id == project_id
+        }
+        missing = sorted(product_id.value for product_id in amounts if product_id not in found)
+        if missing:
+            raise ValueError(f"Товар комплекта не найден: {', '.join(missing)}")
+        short = sorted(
+            found[product_id].name
+            for product_id, quantity in amounts.items()
+            if found[product_id].quantity.value < quantity
+        )
+        if short:
+            raise ValueError(f"Недостаточно товара на складе: {', '.join(short)}")
+
+        # Между проверкой и записью остаток могли списать параллельно: условие
+        # в UPDATE не пускает его в минус, а неполное списание откатывается
+        if await self.product_repository.subtract_many(amounts, at, project_id) != len(amounts):
+            raise ValueError("Недостаточно товара на складе")
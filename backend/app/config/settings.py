@@ -1,4 +1,6 @@
 from functools import lru_cache
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -6,6 +8,71 @@ class Settings(BaseSettings):
     app_version: str = "0.1.0"
     env: str = "development"
     telegram_bot_token: str = ""
+    # Сколько секунд initData действителен после auth_date; 0 — без ограничения
+    telegram_auth_max_age_seconds: int = 86400
+    # Кэш уже проверенных строк initData: размер и время жизни записи
+    telegram_auth_cache_size: int = 10000
+    telegram_auth_cache_ttl_seconds: int = 300
+    # Токены сессии (POST /api/v1/auth/session). Без секрета ключ
+    # выводится из токена бота; без того и другого токены не выпускаются
+    session_token_secret: str = ""
+    session_token_ttl_seconds: int = 3600
+
+    # Кэш чтений репозиториев: memory (в процессе), redis или none
+    cache_backend: str = "memory"
+    cache_url: str = "redis://localhost:6379/0"
+    cache_ttl_seconds: int = 30
+    # Размер кэша в памяти процесса (для redis вытеснение настраивается на сервере)
+    cache_max_entries: int = 10000
+
+    # Быстрая отдача JSON: ответы собираются из доменных сущностей без
+    # повторной проверки Pydantic и кодируются orjson (если установлен)
+    fast_json: bool = False
+
+    # Сжатие ответов (brotli, если установлен, иначе gzip). Ответы короче
+    # порога и типы не из списка (фотографии и т.п.) отдаются как есть
+    compression_enabled: bool = True
+    compression_minimum_size: int = 500
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    # Типы содержимого через запятую
+    compression_content_types: str = (
+        "application/json,application/javascript,application/x-ndjson,image/svg+xml,"
+        "text/css,text/csv,text/html,text/javascript,text/plain"
+    )
+
+    # База данных: SQLite по умолчанию, в продакшене можно указать PostgreSQL
+    database_url: str = "sqlite:///./store_todo.db"
+    # Асинхронный режим: запросы к БД не блокируют event loop
+    database_async: bool = False
+    # URL для асинхронного драйвера; если пуст, выводится из database_url
+    database_async_url: str = ""
+    # Реплика для чтения. Без неё SQLite читается через отдельное
+    # read-only соединение к тому же файлу, другие СУБД — через основное
+    database_read_url: str = ""
+    database_async_read_url: str = ""
+    # Сколько секунд после записи клиент читает из основной БД (только при реплике)
+    read_your_writes_seconds: int = 5
+
+    # Пул соединений (одинаковый для движков записи и чтения).
+    # Значения по умолчанию совпадают с умолчаниями SQLAlchemy; подбирать
+    # их стоит по метрикам db_pool_* (см. /api/v1/metrics)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    # Через сколько секунд пересоздавать соединение; -1 — не пересоздавать
+    db_pool_recycle: int = -1
+    # Проверять соединение перед выдачей (нужно для сетевых СУБД за балансировщиком)
+    db_pool_pre_ping: bool = False
+
+    # Профиль SQLite: PRAGMA применяются к каждому новому соединению.
+    # Пустое значение (или None) оставляет настройку SQLite по умолчанию.
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: Optional[int] = 5000
+    sqlite_cache_size: Optional[int] = -64000  # отрицательное значение — размер в КиБ
+    sqlite_mmap_size: Optional[int] = 268435456
+    sqlite_temp_store: str = "MEMORY"
 
     class Config:
         env_file = ".env"
@@ -16,5 +83,3 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     # Кэширование исключает повторное чтение переменных окружения
     return Settings()
-
-
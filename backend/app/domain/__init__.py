@@ -1,7 +1,13 @@
-"""Пакет доменной модели: сущности и бизнес-правила."""
+"""Пакет доменной модели: сущности и бизнес-правила.
+
+Все доменные классы объявлены со slots, value objects ещё и неизменяемы:
+экземпляр без __dict__ заметно меньше, а отчёты держат в памяти сотни
+тысяч задач (см. benchmarks/bench_domain_memory.py).
+"""
 
 from .category import Category
 from .enums import ProductStatus, TaskPriority, TaskStatus, UserRole
+from .identifiers import new_id
 from .product import Product
 from .task import Task
 from .task_template import ProductSet, TaskTemplate
@@ -19,6 +25,8 @@ from .value_objects import (
 )
 
 __all__ = [
+    # Identifiers
+    "new_id",
     # Enums
     "TaskStatus",
     "TaskPriority",
@@ -7,7 +7,7 @@ from typing import Optional
 from .value_objects import CategoryId
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     """Категория для задач и товаров."""
 
@@ -0,0 +1,70 @@
+"""Генерация идентификаторов сущностей."""
+
+import os
+import threading
+import time
+
+# Алфавит Crockford base32: лексикографический порядок строк совпадает с числовым
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+
+class IdGenerator:
+    """Монотонный генератор идентификаторов в формате ULID.
+
+    Идентификатор — 26 символов: 48 бит времени в миллисекундах и 80 бит
+    случайности. Строки сортируются по времени создания, поэтому новые
+    записи добавляются в конец B-дерева первичного ключа.
+
+    В пределах одной миллисекунды случайная часть увеличивается на единицу,
+    так что идентификаторы процесса строго возрастают. Разные процессы
+    (воркеры) начинают каждую миллисекунду со своего случайного значения;
+    после fork состояние сбрасывается, чтобы потомок не повторял родителя.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def reset(self) -> None:
+        """Забыть последнее выданное значение."""
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new_id(self) -> str:
+        """Выдать новый идентификатор."""
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._last_random = int.from_bytes(os.urandom(10), "big")
+            else:
+                # Та же миллисекунда (или часы сдвинулись назад): продолжаем последовательность
+                self._last_random += 1
+                if self._last_random > _RANDOM_MAX:
+                    self._last_ms += 1
+                    self._last_random = int.from_bytes(os.urandom(10), "big") >> 1
+            value = (self._last_ms << _RANDOM_BITS) | self._last_random
+        return _encode(value)
+
+
+def _encode(value: int) -> str:
+    """Закодировать 128-битное число в 26 символов base32."""
+    chars = []
+    for _ in range(26):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+_generator = IdGenerator()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_generator.reset)
+
+
+def new_id() -> str:
+    """Новый сортируемый по времени идентификатор сущности."""
+    return _generator.new_id()
@@ -8,7 +8,7 @@ from .enums import ProductStatus
 from .value_objects import Barcode, CategoryId, PhotoUrl, ProductId, Quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """Товар на складе."""
 
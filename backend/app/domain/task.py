@@ -8,7 +8,7 @@ from .enums import TaskPriority, TaskStatus
 from .value_objects import CategoryId, Comment, Deadline, PhotoUrl, TaskId, UserId
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Задача для выполнения."""
 
@@ -27,6 +27,7 @@ class Task:
     completion_photos: List[PhotoUrl] = field(default_factory=list)
     completion_comment: Optional[Comment] = None
     project_id: Optional[str] = None
+    product_set_id: Optional[str] = None  # Комплект товаров, списываемый при выполнении
 
     def __post_init__(self):
         """Валидация задачи."""
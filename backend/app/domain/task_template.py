@@ -8,7 +8,7 @@ from .enums import TaskPriority
 from .value_objects import CategoryId, TaskId, UserId
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskTemplate:
     """Шаблон для создания задач."""
 
@@ -71,7 +71,7 @@ class TaskTemplate:
         self.updated_at = datetime.utcnow()
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductSet:
     """Комплект товаров для автоматического списания."""
 
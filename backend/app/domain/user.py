@@ -8,7 +8,7 @@ from .enums import UserRole
 from .value_objects import UserId
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Пользователь системы."""
 
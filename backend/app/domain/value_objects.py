@@ -5,35 +5,35 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskId:
     """Идентификатор задачи."""
 
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserId:
     """Идентификатор пользователя."""
 
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProductId:
     """Идентификатор товара."""
 
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryId:
     """Идентификатор категории."""
 
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhotoUrl:
     """URL фотографии."""
 
@@ -45,7 +45,7 @@ class PhotoUrl:
             raise ValueError("URL фотографии не может быть пустым")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Barcode:
     """Штрих-код товара."""
 
@@ -57,7 +57,7 @@ class Barcode:
             raise ValueError("Штрих-код не может быть пустым")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Quantity:
     """Количество товара."""
 
@@ -69,7 +69,7 @@ class Quantity:
             raise ValueError("Количество не может быть отрицательным")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Deadline:
     """Срок выполнения задачи."""
 
@@ -81,7 +81,7 @@ class Deadline:
             raise ValueError("Срок выполнения обязателен")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comment:
     """Комментарий к задаче."""
 
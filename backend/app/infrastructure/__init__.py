@@ -3,6 +3,7 @@
 from .database import Base, SessionLocal, engine, get_db
 from .models import CategoryModel, ProductModel, TaskModel, UserModel
 from .repositories import TaskRepositoryImpl, UserRepositoryImpl
+from .unit_of_work import SqlAlchemyUnitOfWork
 
 __all__ = [
     "Base",
@@ -15,5 +16,6 @@ __all__ = [
     "CategoryModel",
     "UserRepositoryImpl",
     "TaskRepositoryImpl",
+    "SqlAlchemyUnitOfWork",
 ]
 
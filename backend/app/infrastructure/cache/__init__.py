@@ -0,0 +1,62 @@
+"""Кэш чтений между use cases и базой данных."""
+
+from functools import lru_cache
+from typing import Optional
+
+from ...application.repositories import CategoryRepository, TaskRepository, UserRepository
+from ...config.settings import get_settings
+from .backends import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from .repositories import CachedCategoryRepository, CachedRepository, CachedTaskRepository, CachedUserRepository
+
+
+@lru_cache(maxsize=1)
+def get_cache_backend() -> Optional[CacheBackend]:
+    """Хранилище кэша процесса по настройкам (None, если кэш выключен)."""
+    settings = get_settings()
+    backend = settings.cache_backend.lower()
+    if backend == "memory":
+        return InMemoryCacheBackend(max_entries=settings.cache_max_entries)
+    if backend == "redis":
+        return RedisCacheBackend(settings.cache_url)
+    if backend in ("", "none"):
+        return None
+    raise ValueError(f"Неизвестное хранилище кэша: {settings.cache_backend}")
+
+
+def cached_tasks(repository: TaskRepository, defer_invalidation: bool = False) -> TaskRepository:
+    """Обернуть репозиторий задач кэшем, если он включён."""
+    backend = get_cache_backend()
+    if backend is None:
+        return repository
+    return CachedTaskRepository(repository, backend, get_settings().cache_ttl_seconds, defer_invalidation)
+
+
+def cached_users(repository: UserRepository, defer_invalidation: bool = False) -> UserRepository:
+    """Обернуть репозиторий пользователей кэшем, если он включён."""
+    backend = get_cache_backend()
+    if backend is None:
+        return repository
+    return CachedUserRepository(repository, backend, get_settings().cache_ttl_seconds, defer_invalidation)
+
+
+def cached_categories(repository: CategoryRepository, defer_invalidation: bool = False) -> CategoryRepository:
+    """Обернуть репозиторий категорий кэшем, если он включён."""
+    backend = get_cache_backend()
+    if backend is None:
+        return repository
+    return CachedCategoryRepository(repository, backend, get_settings().cache_ttl_seconds, defer_invalidation)
+
+
+__all__ = [
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "CachedRepository",
+    "CachedTaskRepository",
+    "CachedUserRepository",
+    "CachedCategoryRepository",
+    "get_cache_backend",
+    "cached_tasks",
+    "cached_users",
+    "cached_categories",
+]
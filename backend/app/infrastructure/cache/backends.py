@@ -0,0 +1,233 @@
+"""Хранилища кэша: в памяти процесса и Redis."""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Хранилище кэша: байтовые значения со временем жизни и счётчики.
+
+    Ошибки хранилища не должны ломать запрос: реализация при сбое
+    возвращает промах и пишет предупреждение в лог.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Получить значение или None."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Сохранить значение на ttl_seconds секунд."""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Удалить значения."""
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Увеличить счётчик на 1 и вернуть новое значение."""
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Кэш в памяти процесса с LRU-вытеснением.
+
+    Значения хранятся сериализованными: каждый промах и попадание отдают
+    новый объект, и изменение сущности вызывающим кодом не портит кэш.
+    Счётчики не вытесняются, иначе сброс счётчика вернул бы к жизни
+    устаревшие записи, построенные на его старом значении.
+    """
+
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key]).encode()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if not self._max_entries:
+            return
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self) -> None:
+        """Очистить кэш."""
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+class RedisError(Exception):
+    """Ошибка, возвращённая сервером Redis."""
+
+
+class RedisCacheBackend(CacheBackend):
+    """Кэш в Redis (или совместимом сервере) по протоколу RESP.
+
+    Минимальный клиент на asyncio без внешних зависимостей: GET, SET PX,
+    DEL и INCR. На каждый event loop открывается одно соединение, команды
+    по нему идут последовательно. Вытеснение настраивается на сервере
+    (maxmemory-policy).
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", timeout_seconds: float = 1.0):
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", ""):
+            raise ValueError(f"Неподдерживаемая схема кэша: {parsed.scheme}")
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._timeout = timeout_seconds
+        # Соединение привязано к своему event loop; закрытые циклы не удерживаются
+        self._connections: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[asyncio.StreamReader, asyncio.StreamWriter, asyncio.Lock]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._safe_command(None, "GET", key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self._safe_command(None, "SET", key, value, "PX", max(int(ttl_seconds * 1000), 1))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._safe_command(None, "DEL", *keys)
+
+    async def incr(self, key: str) -> int:
+        # Без ответа сервера возвращаем значение, не совпадающее ни с одним
+        # выданным, чтобы записи со старым значением не использовались
+        return await self._safe_command(time.time_ns(), "INCR", key)
+
+    async def close(self) -> None:
+        """Закрыть соединение текущего event loop."""
+        connection = self._connections.pop(asyncio.get_running_loop(), None)
+        if connection is not None:
+            connection[1].close()
+
+    async def _safe_command(self, default, *args):
+        try:
+            return await self._command(*args)
+        except (OSError, EOFError, asyncio.TimeoutError, RedisError, ValueError) as error:
+            logger.warning("Кэш Redis недоступен: %s", error)
+            await self._drop_connection()
+            return default
+
+    async def _command(self, *args):
+        reader, writer, lock = await self._connection()
+        async with lock:
+            writer.write(_encode_command(args))
+            await writer.drain()
+            return await asyncio.wait_for(_read_reply(reader), self._timeout)
+
+    async def _connection(self):
+        loop = asyncio.get_running_loop()
+        connection = self._connections.get(loop)
+        if connection is None:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(self._host, self._port), self._timeout)
+            for command in self._handshake():
+                writer.write(_encode_command(command))
+                await writer.drain()
+                await asyncio.wait_for(_read_reply(reader), self._timeout)
+            # Пока шло подключение, его могла открыть другая корутина
+            if loop in self._connections:
+                writer.close()
+                return self._connections[loop]
+            connection = (reader, writer, asyncio.Lock())
+            self._connections[loop] = connection
+        return connection
+
+    def _handshake(self) -> List[tuple]:
+        commands = []
+        if self._password:
+            commands.append(("AUTH", self._password))
+        if self._db:
+            commands.append(("SELECT", self._db))
+        return commands
+
+    async def _drop_connection(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        connection = self._connections.pop(loop, None)
+        if connection is not None:
+            connection[1].close()
+
+
+def _encode_command(args) -> bytes:
+    """Закодировать команду массивом bulk-строк RESP."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            data = arg
+        else:
+            data = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader):
+    """Прочитать один ответ RESP."""
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Соединение с Redis закрыто")
+    prefix, payload = line[:1], line[1:-2]
+    if prefix == b"+":
+        return payload.decode()
+    if prefix == b"-":
+        raise RedisError(payload.decode())
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise RedisError(f"Неизвестный ответ Redis: {line!r}")
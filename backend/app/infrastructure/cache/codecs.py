@@ -0,0 +1,151 @@
+"""Сериализация доменных сущностей для кэша."""
+
+import json
+from datetime import datetime
+from typing import List, Optional
+
+from ...domain.category import Category
+from ...domain.enums import TaskPriority, TaskStatus, UserRole
+from ...domain.task import Task
+from ...domain.user import User
+from ...domain.value_objects import CategoryId, Comment, Deadline, PhotoUrl, TaskId, UserId
+
+
+def _dump_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _load_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _encode(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def task_to_dict(task: Task) -> dict:
+    """Преобразовать задачу в словарь JSON-совместимых значений."""
+    return {
+        "id": task.id.value,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status.value,
+        "priority": task.priority.value,
+        "category_id": task.category_id.value if task.category_id else None,
+        "assignee_id": task.assignee_id.value if task.assignee_id else None,
+        "creator_id": task.creator_id.value,
+        "deadline": _dump_datetime(task.deadline.value) if task.deadline else None,
+        "created_at": _dump_datetime(task.created_at),
+        "updated_at": _dump_datetime(task.updated_at),
+        "completed_at": _dump_datetime(task.completed_at),
+        "completion_photos": [photo.value for photo in task.completion_photos],
+        "completion_comment": task.completion_comment.value if task.completion_comment else None,
+        "project_id": task.project_id,
+        "product_set_id": task.product_set_id,
+    }
+
+
+def task_from_dict(data: dict) -> Task:
+    """Восстановить задачу из словаря."""
+    return Task(
+        id=TaskId(value=data["id"]),
+        title=data["title"],
+        description=data["description"],
+        status=TaskStatus(data["status"]),
+        priority=TaskPriority(data["priority"]),
+        category_id=CategoryId(value=data["category_id"]) if data["category_id"] else None,
+        assignee_id=UserId(value=data["assignee_id"]) if data["assignee_id"] else None,
+        creator_id=UserId(value=data["creator_id"]),
+        deadline=Deadline(value=_load_datetime(data["deadline"])) if data["deadline"] else None,
+        created_at=_load_datetime(data["created_at"]),
+        updated_at=_load_datetime(data["updated_at"]),
+        completed_at=_load_datetime(data["completed_at"]),
+        completion_photos=[PhotoUrl(value=photo) for photo in data["completion_photos"]],
+        completion_comment=Comment(value=data["completion_comment"]) if data["completion_comment"] else None,
+        project_id=data["project_id"],
+        # Записи кэша, сохранённые до появления комплектов, поля не содержат
+        product_set_id=data.get("product_set_id"),
+    )
+
+
+def user_to_dict(user: User) -> dict:
+    """Преобразовать пользователя в словарь JSON-совместимых значений."""
+    return {
+        "id": user.id.value,
+        "telegram_id": user.telegram_id,
+        "username": user.username,
+        "full_name": user.full_name,
+        "role": user.role.value,
+        "created_at": _dump_datetime(user.created_at),
+        "updated_at": _dump_datetime(user.updated_at),
+        "is_active": user.is_active,
+        "project_id": user.project_id,
+    }
+
+
+def user_from_dict(data: dict) -> User:
+    """Восстановить пользователя из словаря."""
+    return User(
+        id=UserId(value=data["id"]),
+        telegram_id=data["telegram_id"],
+        username=data["username"],
+        full_name=data["full_name"],
+        role=UserRole(data["role"]),
+        created_at=_load_datetime(data["created_at"]),
+        updated_at=_load_datetime(data["updated_at"]),
+        is_active=data["is_active"],
+        project_id=data["project_id"],
+    )
+
+
+def category_to_dict(category: Category) -> dict:
+    """Преобразовать категорию в словарь JSON-совместимых значений."""
+    return {
+        "id": category.id.value,
+        "name": category.name,
+        "description": category.description,
+        "color": category.color,
+        "created_at": _dump_datetime(category.created_at),
+        "updated_at": _dump_datetime(category.updated_at),
+        "is_active": category.is_active,
+        "project_id": category.project_id,
+    }
+
+
+def category_from_dict(data: dict) -> Category:
+    """Восстановить категорию из словаря."""
+    return Category(
+        id=CategoryId(value=data["id"]),
+        name=data["name"],
+        description=data["description"],
+        color=data["color"],
+        created_at=_load_datetime(data["created_at"]),
+        updated_at=_load_datetime(data["updated_at"]),
+        is_active=data["is_active"],
+        project_id=data["project_id"],
+    )
+
+
+class EntityCodec:
+    """Пара функций сериализации сущности одного типа."""
+
+    def __init__(self, to_dict, from_dict):
+        self._to_dict = to_dict
+        self._from_dict = from_dict
+
+    def dumps(self, entity) -> bytes:
+        return _encode(self._to_dict(entity))
+
+    def loads(self, data: bytes):
+        return self._from_dict(json.loads(data))
+
+    def dumps_list(self, entities: List) -> bytes:
+        return _encode([self._to_dict(entity) for entity in entities])
+
+    def loads_list(self, data: bytes) -> List:
+        return [self._from_dict(item) for item in json.loads(data)]
+
+
+TASK_CODEC = EntityCodec(task_to_dict, task_from_dict)
+USER_CODEC = EntityCodec(user_to_dict, user_from_dict)
+CATEGORY_CODEC = EntityCodec(category_to_dict, category_from_dict)
@@ -0,0 +1,292 @@
+"""Кэширующие декораторы репозиториев.
+
+Чтения по ID и списки пользователей и категорий проекта берутся из кэша;
+запись проходит в исходный репозиторий и сбрасывает затронутые ключи.
+Списки не сбрасываются поштучно: ключ списка содержит номер поколения,
+который увеличивается при любой записи сущностей этого типа.
+Если чтение из БД обгоняет параллельную запись, устаревшая запись
+живёт не дольше времени жизни кэша.
+"""
+
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional
+
+from ...application.pagination import Keyset, encode_cursor
+from ...application.repositories import CategoryRepository, TaskRepository, UserRepository
+from ...application.versions import EntityVersion
+from ...domain.category import Category
+from ...domain.task import Task
+from ...domain.user import User
+from ...domain.value_objects import CategoryId, Comment, PhotoUrl, TaskId, UserId
+from .backends import CacheBackend
+from .codecs import CATEGORY_CODEC, TASK_CODEC, USER_CODEC, EntityCodec
+
+# Версия формата записей: при изменении кодеков старые записи просто не читаются
+KEY_PREFIX = "v1"
+
+
+class CachedRepository:
+    """Общая часть кэширующих репозиториев.
+
+    Внутри единицы работы (defer_invalidation=True) ключи сбрасываются
+    только после фиксации транзакции: иначе параллельный запрос мог бы
+    успеть закэшировать ещё не зафиксированное состояние.
+    """
+
+    def __init__(self, inner, backend: CacheBackend, ttl_seconds: float, defer_invalidation: bool = False):
+        self.inner = inner
+        self._backend = backend
+        self._ttl = ttl_seconds
+        self._defer = defer_invalidation
+        self._pending_keys: set = set()
+        self._pending_generations: set = set()
+
+    async def _cached(self, key: str, codec: EntityCodec, load: Callable):
+        """Получить сущность из кэша или загрузить и запомнить (None не кэшируется)."""
+        data = await self._backend.get(key)
+        if data is not None:
+            return codec.loads(data)
+        entity = await load()
+        if entity is not None:
+            await self._backend.set(key, codec.dumps(entity), self._ttl)
+        return entity
+
+    async def _cached_list(self, key: str, codec: EntityCodec, load: Callable) -> List:
+        """Получить список из кэша или загрузить и запомнить."""
+        data = await self._backend.get(key)
+        if data is not None:
+            return codec.loads_list(data)
+        entities = await load()
+        await self._backend.set(key, codec.dumps_list(entities), self._ttl)
+        return entities
+
+    async def _generation(self, name: str) -> str:
+        """Текущее поколение списков сущностей одного типа."""
+        value = await self._backend.get(f"{KEY_PREFIX}:gen:{name}")
+        return value.decode() if value is not None else "0"
+
+    async def _invalidate(self, keys: Iterable[str] = (), generations: Iterable[str] = ()) -> None:
+        """Сбросить ключи и поколения списков (внутри единицы работы — после commit)."""
+        if self._defer:
+            self._pending_keys.update(keys)
+            self._pending_generations.update(generations)
+            return
+        await self._apply(set(keys), set(generations))
+
+    async def apply_invalidations(self) -> None:
+        """Сбросить ключи, накопленные в единице работы."""
+        keys, generations = self._pending_keys, self._pending_generations
+        self._pending_keys, self._pending_generations = set(), set()
+        await self._apply(keys, generations)
+
+    def discard_invalidations(self) -> None:
+        """Забыть накопленные ключи после отката: данные в БД не изменились."""
+        self._pending_keys.clear()
+        self._pending_generations.clear()
+
+    async def _apply(self, keys: set, generations: set) -> None:
+        if keys:
+            await self._backend.delete(*keys)
+        for name in generations:
+            await self._backend.incr(f"{KEY_PREFIX}:gen:{name}")
+
+
+def _page_key(limit: Optional[int], after: Optional[Keyset]) -> str:
+    return f"{limit or ''}:{encode_cursor(after) if after else ''}"
+
+
+class CachedTaskRepository(CachedRepository, TaskRepository):
+    """Репозиторий задач с кэшем задач по ID.
+
+    Списки задач не кэшируются: они постранично читаются по индексам
+    и меняются при каждой записи.
+    """
+
+    inner: TaskRepository
+
+    @staticmethod
+    def _key(task_id: str) -> str:
+        return f"{KEY_PREFIX}:task:{task_id}"
+
+    async def create(self, task: Task) -> Task:
+        return await self.inner.create(task)
+
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        return await self.inner.create_many(tasks)
+
+    async def get_by_id(self, task_id: TaskId) -> Optional[Task]:
+        return await self._cached(self._key(task_id.value), TASK_CODEC, lambda: self.inner.get_by_id(task_id))
+
+    async def get_version(self, task_id: TaskId) -> Optional[EntityVersion]:
+        return await self.inner.get_version(task_id)
+
+    async def list_versions(
+        self,
+        assignee_id: Optional[UserId] = None,
+        creator_id: Optional[UserId] = None,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[EntityVersion]:
+        return await self.inner.list_versions(assignee_id, creator_id, project_id, limit, after)
+
+    async def update(self, task: Task) -> Task:
+        updated = await self.inner.update(task)
+        await self._invalidate([self._key(task.id.value)])
+        return updated
+
+    async def complete(
+        self,
+        task_id: TaskId,
+        completed_at: datetime,
+        comment: Optional[Comment] = None,
+        photos: Optional[List[PhotoUrl]] = None,
+    ) -> Optional[Task]:
+        task = await self.inner.complete(task_id, completed_at, comment, photos)
+        if task is not None:
+            await self._invalidate([self._key(task_id.value)])
+        return task
+
+    async def delete(self, task_id: TaskId) -> None:
+        await self.inner.delete(task_id)
+        await self._invalidate([self._key(task_id.value)])
+
+    async def list_by_assignee(
+        self,
+        assignee_id: UserId,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[Task]:
+        return await self.inner.list_by_assignee(assignee_id, project_id, limit, after)
+
+    async def list_by_creator(
+        self,
+        creator_id: UserId,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[Task]:
+        return await self.inner.list_by_creator(creator_id, project_id, limit, after)
+
+    async def list_by_project(
+        self, project_id: str, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[Task]:
+        return await self.inner.list_by_project(project_id, limit, after)
+
+    async def list_overdue(self, project_id: Optional[str] = None) -> List[Task]:
+        return await self.inner.list_overdue(project_id)
+
+    async def list_by_date_range(
+        self, start_date: datetime, end_date: datetime, project_id: Optional[str] = None
+    ) -> List[Task]:
+        return await self.inner.list_by_date_range(start_date, end_date, project_id)
+
+
+class CachedUserRepository(CachedRepository, UserRepository):
+    """Репозиторий пользователей с кэшем по ID, по Telegram ID и списков проекта."""
+
+    inner: UserRepository
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"{KEY_PREFIX}:user:{user_id}"
+
+    @staticmethod
+    def _telegram_key(telegram_id: int) -> str:
+        return f"{KEY_PREFIX}:user:tg:{telegram_id}"
+
+    async def create(self, user: User) -> User:
+        created = await self.inner.create(user)
+        await self._invalidate(generations=["users"])
+        return created
+
+    async def get_by_id(self, user_id: UserId) -> Optional[User]:
+        return await self._cached(self._key(user_id.value), USER_CODEC, lambda: self.inner.get_by_id(user_id))
+
+    async def list_by_ids(self, user_ids: List[UserId]) -> List[User]:
+        return await self.inner.list_by_ids(user_ids)
+
+    async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
+        # По Telegram ID хранится только ID пользователя: сброс записи
+        # по ID автоматически делает недействительным и этот ключ
+        pointer = await self._backend.get(self._telegram_key(telegram_id))
+        if pointer is not None:
+            user = await self.get_by_id(UserId(value=pointer.decode()))
+            if user is not None and user.telegram_id == telegram_id:
+                return user
+        user = await self.inner.get_by_telegram_id(telegram_id)
+        if user is not None:
+            await self._backend.set(self._telegram_key(telegram_id), user.id.value.encode(), self._ttl)
+            await self._backend.set(self._key(user.id.value), USER_CODEC.dumps(user), self._ttl)
+        return user
+
+    async def get_version(self, user_id: UserId) -> Optional[EntityVersion]:
+        return await self.inner.get_version(user_id)
+
+    async def list_versions(
+        self,
+        project_id: Optional[str] = None,
+        active_only: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[EntityVersion]:
+        return await self.inner.list_versions(project_id, active_only, limit, after)
+
+    async def update(self, user: User) -> User:
+        updated = await self.inner.update(user)
+        await self._invalidate([self._key(user.id.value)], ["users"])
+        return updated
+
+    async def delete(self, user_id: UserId) -> None:
+        await self.inner.delete(user_id)
+        await self._invalidate([self._key(user_id.value)], ["users"])
+
+    async def list_all(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[User]:
+        key = f"{KEY_PREFIX}:users:{await self._generation('users')}:all:{project_id or ''}:{_page_key(limit, after)}"
+        return await self._cached_list(key, USER_CODEC, lambda: self.inner.list_all(project_id, limit, after))
+
+    async def list_active(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[User]:
+        key = f"{KEY_PREFIX}:users:{await self._generation('users')}:active:{project_id or ''}:{_page_key(limit, after)}"
+        return await self._cached_list(key, USER_CODEC, lambda: self.inner.list_active(project_id, limit, after))
+
+
+class CachedCategoryRepository(CachedRepository, CategoryRepository):
+    """Репозиторий категорий с кэшем по ID и списков проекта."""
+
+    inner: CategoryRepository
+
+    @staticmethod
+    def _key(category_id: str) -> str:
+        return f"{KEY_PREFIX}:category:{category_id}"
+
+    async def create(self, category: Category) -> Category:
+        created = await self.inner.create(category)
+        await self._invalidate(generations=["categories"])
+        return created
+
+    async def get_by_id(self, category_id: CategoryId) -> Optional[Category]:
+        return await self._cached(
+            self._key(category_id.value), CATEGORY_CODEC, lambda: self.inner.get_by_id(category_id)
+        )
+
+    async def update(self, category: Category) -> Category:
+        updated = await self.inner.update(category)
+        await self._invalidate([self._key(category.id.value)], ["categories"])
+        return updated
+
+    async def delete(self, category_id: CategoryId) -> None:
+        await self.inner.delete(category_id)
+        await self._invalidate([self._key(category_id.value)], ["categories"])
+
+    async def list_all(self, project_id: Optional[str] = None) -> List[Category]:
+        key = f"{KEY_PREFIX}:categories:{await self._generation('categories')}:all:{project_id or ''}"
+        return await self._cached_list(key, CATEGORY_CODEC, lambda: self.inner.list_all(project_id))
+
+    async def list_active(self, project_id: Optional[str] = None) -> List[Category]:
+        key = f"{KEY_PREFIX}:categories:{await self._generation('categories')}:active:{project_id or ''}"
+        return await self._cached_list(key, CATEGORY_CODEC, lambda: self.inner.list_active(project_id))
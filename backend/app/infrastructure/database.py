@@ -1,19 +1,184 @@
 """Конфигурация базы данных."""
 
-from sqlalchemy import create_engine
+import os
+from typing import AsyncIterator, Callable, List, Optional, Union
+
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from ..config.settings import get_settings
+from ..config.settings import Settings, get_settings
+from .pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, register_pool_gauges
 
 settings = get_settings()
 
 # SQLite для начала, потом можно заменить на PostgreSQL
-DATABASE_URL = "sqlite:///./store_todo.db"
+DATABASE_URL = settings.database_url
+
+# Асинхронные драйверы, подставляемые вместо синхронных
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+# Сессия любого из двух режимов: репозитории работают с обеими
+DbSession = Union[Session, AsyncSession]
+
+
+def to_async_url(url: str) -> str:
+    """Получить URL асинхронного драйвера по URL синхронного подключения."""
+    scheme, separator, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    if dialect not in _ASYNC_DRIVERS:
+        raise ValueError(f"Нет асинхронного драйвера для диалекта {dialect}")
+    return f"{_ASYNC_DRIVERS[dialect]}{separator}{rest}"
+
+
+# Допустимые значения строковых PRAGMA: значения подставляются в SQL как есть
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+def sqlite_pragmas(config: Settings, read_only: bool = False) -> List[str]:
+    """Собрать PRAGMA профиля SQLite из настроек.
+
+    Режим журнала хранится в самом файле БД, поэтому read-only соединения
+    его не меняют.
+    """
+    pragmas = []
+
+    def choice(name: str, value: str, allowed: set) -> None:
+        if not value:
+            return
+        value = value.upper()
+        if value not in allowed:
+            raise ValueError(f"Недопустимое значение PRAGMA {name}: {value}")
+        pragmas.append(f"PRAGMA {name}={value}")
+
+    def number(name: str, value) -> None:
+        if value is not None:
+            pragmas.append(f"PRAGMA {name}={int(value)}")
+
+    # busy_timeout первым: следующие PRAGMA уже ждут блокировку, а не падают
+    number("busy_timeout", config.sqlite_busy_timeout_ms)
+    if not read_only:
+        choice("journal_mode", config.sqlite_journal_mode, _JOURNAL_MODES)
+    choice("synchronous", config.sqlite_synchronous, _SYNCHRONOUS_LEVELS)
+    number("cache_size", config.sqlite_cache_size)
+    number("mmap_size", config.sqlite_mmap_size)
+    choice("temp_store", config.sqlite_temp_store, _TEMP_STORES)
+    return pragmas
+
+
+def install_sqlite_pragmas(target_engine, pragmas: List[str]) -> None:
+    """Применять PRAGMA к каждому новому соединению движка."""
+
+    @event.listens_for(target_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def read_only_sqlite_url(url: str) -> Optional[str]:
+    """URL read-only подключения к тому же файлу SQLite (None для БД в памяти)."""
+    parsed = make_url(url)
+    if not parsed.database or parsed.database == ":memory:":
+        return None
+    parsed = parsed.set(database=f"file:{os.path.abspath(parsed.database)}")
+    parsed = parsed.update_query_dict({"mode": "ro", "uri": "true"})
+    return parsed.render_as_string(hide_password=False)
+
+
+def _connect_args(url: str) -> dict:
+    """Аргументы подключения, зависящие от диалекта."""
+    if url.startswith("sqlite"):
+        return {"check_same_thread": False}
+    return {}
+
+
+def _pool_options(url: str, label: str, is_async: bool = False) -> dict:
+    """Параметры пула из настроек.
+
+    Пул заменяется только там, где диалект сам выбрал бы QueuePool. Для
+    SQLite в памяти (одно общее соединение) и aiosqlite (NullPool: его
+    соединения — потоки, которые не дали бы процессу завершиться) остаётся
+    пул SQLAlchemy по умолчанию.
+    """
+    parsed = make_url(url)
+    if not issubclass(parsed.get_dialect().get_pool_class(parsed), QueuePool):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_logging_name": label,
+    }
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+
+def _make_engine(url: str, label: str, read_only: bool = False):
+    """Создать синхронный движок с пулом и PRAGMA из настроек."""
+    pool_options = _pool_options(url, label)
+    new_engine = create_engine(url, connect_args=_connect_args(url), **pool_options)
+    if pool_options:
+        register_pool_gauges(new_engine, label)
+    if new_engine.dialect.name == "sqlite":
+        install_sqlite_pragmas(new_engine, sqlite_pragmas(settings, read_only=read_only))
+    return new_engine
+
+
+def _make_async_engine(url: str, label: str, read_only: bool = False):
+    """Создать асинхронный движок с пулом и PRAGMA из настроек."""
+    pool_options = _pool_options(url, label, is_async=True)
+    new_engine = create_async_engine(url, connect_args=_connect_args(url), **pool_options)
+    if pool_options:
+        register_pool_gauges(new_engine.sync_engine, label)
+    if new_engine.dialect.name == "sqlite":
+        install_sqlite_pragmas(new_engine.sync_engine, sqlite_pragmas(settings, read_only=read_only))
+    return new_engine
+
+
+engine = _make_engine(DATABASE_URL, "write")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Асинхронный движок создаётся только в асинхронном режиме,
+# чтобы не требовать aiosqlite/asyncpg там, где они не нужны
+async_engine = None
+AsyncSessionLocal = None
+if settings.database_async:
+    ASYNC_DATABASE_URL = settings.database_async_url or to_async_url(DATABASE_URL)
+    async_engine = _make_async_engine(ASYNC_DATABASE_URL, "async_write")
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# Движки для чтения: реплика или read-only соединение SQLite, чтобы чтения
+# (их примерно в 20 раз больше) не занимали соединения записи
+READ_DATABASE_URL = settings.database_read_url
+if not READ_DATABASE_URL and engine.dialect.name == "sqlite":
+    READ_DATABASE_URL = read_only_sqlite_url(DATABASE_URL)
+
+read_engine = None
+ReadSessionLocal = None
+if READ_DATABASE_URL:
+    read_engine = _make_engine(READ_DATABASE_URL, "read", read_only=True)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+async_read_engine = None
+AsyncReadSessionLocal = None
+if settings.database_async and READ_DATABASE_URL:
+    ASYNC_READ_DATABASE_URL = settings.database_async_read_url or to_async_url(READ_DATABASE_URL)
+    async_read_engine = _make_async_engine(ASYNC_READ_DATABASE_URL, "async_read", read_only=True)
+    AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -25,3 +190,83 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Получить асинхронную сессию базы данных."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Асинхронный режим БД выключен (DATABASE_ASYNC=false)")
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+class SessionRouter:
+    """Сессии одного запроса: запись в основную БД, чтение с реплики.
+
+    Сессии создаются при первом обращении. После первой записи в запросе
+    (или если клиент недавно писал) чтение тоже идёт через сессию записи,
+    чтобы клиент видел собственные изменения.
+    """
+
+    def __init__(
+        self,
+        write_factory: Callable[[], DbSession],
+        read_factory: Optional[Callable[[], DbSession]] = None,
+        sticky: bool = False,
+        on_write: Optional[Callable[[], None]] = None,
+    ):
+        self._write_factory = write_factory
+        self._read_factory = read_factory
+        self._on_write = on_write
+        self._writer: Optional[DbSession] = None
+        self._reader: Optional[DbSession] = None
+        self.wrote = sticky
+
+    @property
+    def writer(self) -> DbSession:
+        """Сессия основной БД."""
+        if self._writer is None:
+            self._writer = self._write_factory()
+            self._track_writes(self._writer)
+        return self._writer
+
+    @property
+    def reader(self) -> DbSession:
+        """Сессия для чтения."""
+        if self.wrote or self._read_factory is None:
+            return self.writer
+        if self._reader is None:
+            self._reader = self._read_factory()
+        return self._reader
+
+    def _track_writes(self, session: DbSession) -> None:
+        """Отмечать запись при flush ORM и при выполнении INSERT/UPDATE/DELETE."""
+        sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+
+        def mark_written() -> None:
+            self.wrote = True
+            if self._on_write is not None:
+                self._on_write()
+
+        @event.listens_for(sync_session, "after_flush")
+        def _after_flush(flushed_session, flush_context):
+            mark_written()
+
+        @event.listens_for(sync_session, "do_orm_execute")
+        def _on_execute(execute_state):
+            if execute_state.is_insert or execute_state.is_update or execute_state.is_delete:
+                mark_written()
+
+    async def close(self) -> None:
+        """Закрыть открытые сессии."""
+        for session in (self._reader, self._writer):
+            if isinstance(session, AsyncSession):
+                await session.close()
+            elif session is not None:
+                session.close()
+
+
+def create_session_router(sticky: bool = False, on_write: Optional[Callable[[], None]] = None) -> SessionRouter:
+    """Создать маршрутизатор сессий в режиме, выбранном в настройках."""
+    if AsyncSessionLocal is not None:
+        return SessionRouter(AsyncSessionLocal, AsyncReadSessionLocal, sticky=sticky, on_write=on_write)
+    return SessionRouter(SessionLocal, ReadSessionLocal, sticky=sticky, on_write=on_write)
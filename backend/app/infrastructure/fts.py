@@ -0,0 +1,47 @@
+"""Полнотекстовый поиск товаров (SQLite FTS5).
+
+Индекс products_fts создаётся миграциями 0004 и 0007 и поддерживается
+триггерами на таблице products; с товарами он связан по ID (product_id). Если SQLite собран без FTS5 или БД другая, таблицы
+нет, и репозиторий ищет обычным LIKE.
+"""
+
+import re
+from typing import List, Optional
+
+PRODUCTS_FTS = "products_fts"
+
+# Вес совпадения в названии относительно описания при ранжировании bm25
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def is_search_table(name: str) -> bool:
+    """Таблица индекса FTS5 или одна из его служебных таблиц."""
+    return name == PRODUCTS_FTS or name.startswith(f"{PRODUCTS_FTS}_")
+
+
+def include_name(name: Optional[str], type_: str, parent_names: dict) -> bool:
+    """Фильтр Alembic: индекс поиска не описан в моделях и не сравнивается с ними."""
+    return not (type_ == "table" and name is not None and is_search_table(name))
+
+
+def search_terms(query: str) -> List[str]:
+    """Слова поискового запроса без знаков препинания и операторов."""
+    return _TERM.findall(query)
+
+
+def match_expression(query: str) -> Optional[str]:
+    """Выражение MATCH: все слова запроса, последнее — как префикс.
+
+    Пользователь набирает запрос по буквам, поэтому недописанное последнее
+    слово ищется по началу. Слова берутся в кавычки, и синтаксис FTS5
+    (AND, NEAR, *, -) из ввода не интерпретируется.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
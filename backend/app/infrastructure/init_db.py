@@ -1,14 +1,47 @@
 """Инициализация базы данных."""
 
-from .database import Base, engine
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from .database import engine
+
+MIGRATIONS_PATH = Path(__file__).parent / "migrations"
+
+# Ревизия, соответствующая схеме, которую создавал Base.metadata.create_all
+BASELINE_REVISION = "0001"
+
+
+def _alembic_config() -> Config:
+    """Конфигурация Alembic без ini-файла."""
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_PATH))
+    return config
+
+
+def run_migrations(bind=engine) -> None:
+    """Привести схему БД к последней версии.
+
+    БД, созданные до появления миграций, не содержат таблицы alembic_version:
+    их схема совпадает с исходной ревизией, поэтому она только помечается
+    как применённая, а дальше выполняются обычные миграции.
+    """
+    config = _alembic_config()
+    with bind.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = set(inspect(connection).get_table_names())
+        if "alembic_version" not in tables and "tasks" in tables:
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, "head")
 
 
 def init_db():
     """Создать все таблицы в базе данных."""
-    Base.metadata.create_all(bind=engine)
+    run_migrations()
     print("База данных инициализирована успешно")
 
 
 if __name__ == "__main__":
     init_db()
-
@@ -1,2 +1,10 @@
 """Middleware для приложения."""
 
+from .compression import DEFAULT_CONTENT_TYPES, CompressionMiddleware, accepted_encodings, preferred_encoding
+
+__all__ = [
+    "CompressionMiddleware",
+    "DEFAULT_CONTENT_TYPES",
+    "accepted_encodings",
+    "preferred_encoding",
+]
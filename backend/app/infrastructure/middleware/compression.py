@@ -0,0 +1,205 @@
+"""Сжатие ответов gzip и brotli."""
+
+import zlib
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # без brotli отдаём только gzip
+    brotli = None
+
+# Текстовые форматы, которые хорошо сжимаются. Фотографии, архивы и
+# прочие уже сжатые форматы сюда не входят и отдаются как есть
+DEFAULT_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/x-ndjson",
+    "image/svg+xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+)
+
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Кодировки из Accept-Encoding и их веса (q; 0 — клиент отказывается)."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name] = quality
+    return accepted
+
+
+def preferred_encoding(accept_encoding: str, supported: Sequence[str]) -> Optional[str]:
+    """Кодировка из supported с наибольшим весом у клиента (None — без сжатия).
+
+    Кодировки, не названные клиентом, получают вес «*». При равных весах
+    выигрывает стоящая в supported раньше.
+    """
+    accepted = accepted_encodings(accept_encoding)
+    default = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in supported:
+        quality = accepted.get(encoding, default)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """Сжимает текстовые ответы brotli (если сервер умеет) или gzip — что клиент предпочитает по q.
+
+    Ответ короче minimum_size байт отдаётся без сжатия: выигрыш меньше
+    накладных расходов. Потоковые ответы сжимаются по частям, и каждая
+    часть сразу уходит клиенту. Сильный ETag сжатого ответа становится
+    слабым: байты на проводе уже не совпадают с исходными.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        content_types: Iterable[str] = DEFAULT_CONTENT_TYPES,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = frozenset(content_type.lower() for content_type in content_types)
+        # При равных весах brotli: при той же скорости он сжимает плотнее
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = preferred_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, status: int, headers: Headers) -> bool:
+        """Можно ли сжимать ответ с таким статусом и заголовками."""
+        if status < 200 or status in (204, 304):
+            return False
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        return content_type in self.content_types
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        """Сжать тело, известное целиком."""
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        # wbits=31: формат gzip с заголовком и контрольной суммой
+        stream = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+        return stream.compress(body) + stream.flush()
+
+    def compressor(self, encoding: str) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        """Пара функций: сжать часть с выталкиванием и завершить поток."""
+        if encoding == "br":
+            stream = brotli.Compressor(quality=self.brotli_quality)
+            return (lambda chunk: stream.process(chunk) + stream.flush()), stream.finish
+        stream = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+        return (lambda chunk: stream.compress(chunk) + stream.flush(zlib.Z_SYNC_FLUSH)), stream.flush
+
+
+class _CompressingResponder:
+    """Обёртка send одного ответа: копит начало тела, пока не ясно, сжимать ли."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: Optional[str], send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.inner_send = send
+        self.start: Optional[Message] = None
+        self.buffer = b""
+        # None — решение ещё не принято; identity — без сжатия; stream — сжатие по частям
+        self.mode: Optional[str] = None
+        self.process: Optional[Callable[[bytes], bytes]] = None
+        self.finish: Optional[Callable[[], bytes]] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.inner_send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.mode == "identity":
+            await self.inner_send(message)
+            return
+        if self.mode == "stream":
+            chunk = self.process(body) if body else b""
+            if not more_body:
+                chunk += self.finish()
+            await self.inner_send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        if self.mode is None:
+            headers = MutableHeaders(scope=self.start)
+            compressible = self.middleware.is_compressible(self.start["status"], headers)
+            if compressible:
+                # Кэши между сервером и клиентом должны различать варианты ответа
+                headers.add_vary_header("Accept-Encoding")
+            if not compressible or self.encoding is None:
+                self.mode = "identity"
+                await self.inner_send(self.start)
+                await self.inner_send(message)
+                return
+            self.mode = "buffer"
+
+        self.buffer += body
+        if not more_body:
+            await self._send_whole(self.buffer)
+        elif len(self.buffer) >= self.middleware.minimum_size:
+            await self._start_stream()
+
+    async def _send_whole(self, body: bytes) -> None:
+        """Отправить ответ, тело которого уже известно целиком."""
+        if len(body) < self.middleware.minimum_size:
+            await self.inner_send(self.start)
+            await self.inner_send({"type": "http.response.body", "body": body})
+            return
+        compressed = self.middleware.compress(self.encoding, body)
+        headers = self._encoded_headers()
+        headers["content-length"] = str(len(compressed))
+        await self.inner_send(self.start)
+        await self.inner_send({"type": "http.response.body", "body": compressed})
+
+    async def _start_stream(self) -> None:
+        """Начать потоковое сжатие с накопленного начала тела."""
+        self.mode = "stream"
+        self.process, self.finish = self.middleware.compressor(self.encoding)
+        headers = self._encoded_headers()
+        del headers["content-length"]
+        await self.inner_send(self.start)
+        await self.inner_send({"type": "http.response.body", "body": self.process(self.buffer), "more_body": True})
+        self.buffer = b""
+
+    def _encoded_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(scope=self.start)
+        headers["content-encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+        return headers
@@ -0,0 +1,58 @@
+"""Окружение Alembic для миграций схемы БД."""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+
+from app.infrastructure import models  # noqa: F401  регистрирует модели в metadata
+from app.infrastructure.database import DATABASE_URL, Base
+from app.infrastructure.fts import include_name
+
+config = context.config
+target_metadata = Base.metadata
+
+# Логирование из alembic.ini нужно только при запуске из командной строки
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name)
+
+
+def _configure(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite не умеет ALTER для большинства изменений: пересоздаём таблицу
+        render_as_batch=connection.dialect.name == "sqlite",
+        # Индекс полнотекстового поиска создаётся миграцией вручную
+        include_name=include_name,
+    )
+
+
+def run_migrations_offline() -> None:
+    """Сгенерировать SQL без подключения к БД."""
+    context.configure(url=DATABASE_URL, target_metadata=target_metadata, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Применить миграции к БД."""
+    # Приложение передаёт готовое соединение (см. init_db.run_migrations)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    engine = create_engine(DATABASE_URL)
+    with engine.connect() as connection:
+        _configure(connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
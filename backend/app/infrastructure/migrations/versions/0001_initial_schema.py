@@ -0,0 +1,101 @@
+"""Исходная схема: пользователи, категории, задачи, товары.
+
+Совпадает со схемой, которую раньше создавал Base.metadata.create_all,
+поэтому существующие БД помечаются этой ревизией без изменений.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TASK_STATUS = sa.Enum("PENDING", "IN_PROGRESS", "COMPLETED", "ARCHIVED", name="taskstatus")
+TASK_PRIORITY = sa.Enum("LOW", "MEDIUM", "HIGH", "URGENT", name="taskpriority")
+USER_ROLE = sa.Enum("OWNER", "ADMIN", "MANAGER", "EMPLOYEE", name="userrole")
+PRODUCT_STATUS = sa.Enum("ACTIVE", "OUT_OF_STOCK", "ARCHIVED", name="productstatus")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("telegram_id", sa.Integer(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("full_name", sa.String(), nullable=False),
+        sa.Column("role", USER_ROLE, nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("project_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_telegram_id", "users", ["telegram_id"], unique=True)
+
+    op.create_table(
+        "categories",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("color", sa.String(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("project_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", TASK_STATUS, nullable=False),
+        sa.Column("priority", TASK_PRIORITY, nullable=False),
+        sa.Column("category_id", sa.String(), nullable=True),
+        sa.Column("assignee_id", sa.String(), nullable=True),
+        sa.Column("creator_id", sa.String(), nullable=False),
+        sa.Column("deadline", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("completion_photos", sa.JSON(), nullable=True),
+        sa.Column("completion_comment", sa.Text(), nullable=True),
+        sa.Column("project_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["assignee_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.ForeignKeyConstraint(["creator_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "products",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.String(), nullable=True),
+        sa.Column("photo_url", sa.String(), nullable=True),
+        sa.Column("barcode", sa.String(), nullable=True),
+        sa.Column("status", PRODUCT_STATUS, nullable=False),
+        sa.Column("project_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("barcode"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("products")
+    op.drop_table("tasks")
+    op.drop_table("categories")
+    op.drop_index("ix_users_telegram_id", table_name="users")
+    op.drop_table("users")
@@ -0,0 +1,44 @@
+"""Индексы для списков задач.
+
+Покрывают фильтры list_by_assignee, list_by_creator, list_by_project,
+list_overdue и list_by_date_range; частичный индекс по дедлайну содержит
+только невыполненные задачи.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+OPEN_TASKS = sa.text("status != 'COMPLETED'")
+
+
+def upgrade() -> None:
+    op.create_index("ix_tasks_project_assignee_status", "tasks", ["project_id", "assignee_id", "status"])
+    op.create_index("ix_tasks_project_created_at", "tasks", ["project_id", "created_at"])
+    op.create_index("ix_tasks_assignee_created_at", "tasks", ["assignee_id", "created_at"])
+    op.create_index("ix_tasks_creator_created_at", "tasks", ["creator_id", "created_at"])
+    op.create_index("ix_tasks_created_at", "tasks", ["created_at"])
+    op.create_index(
+        "ix_tasks_open_deadline",
+        "tasks",
+        ["deadline"],
+        sqlite_where=OPEN_TASKS,
+        postgresql_where=OPEN_TASKS,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_open_deadline", table_name="tasks")
+    op.drop_index("ix_tasks_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_creator_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_assignee_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_project_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_project_assignee_status", table_name="tasks")
@@ -0,0 +1,46 @@
+"""Штрих-код товара уникален в пределах проекта; индекс остатков.
+
+Глобальная уникальность barcode заменяется уникальностью пары
+(project_id, barcode): один и тот же товар продаётся в разных магазинах.
+Индекс (project_id, status, quantity) покрывает списки заканчивающихся
+и отсутствующих товаров.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# Исходное ограничение UNIQUE (barcode) создано без имени. В SQLite таблица
+# пересоздаётся, и имя ему даёт соглашение об именах; в PostgreSQL у него
+# имя по умолчанию
+SQLITE_NAMING = {"uq": "uq_%(table_name)s_%(column_0_name)s"}
+POSTGRESQL_BARCODE_UNIQUE = "products_barcode_key"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        with op.batch_alter_table("products", naming_convention=SQLITE_NAMING) as batch:
+            batch.drop_constraint("uq_products_barcode", type_="unique")
+            batch.create_unique_constraint("uq_products_project_barcode", ["project_id", "barcode"])
+    else:
+        op.drop_constraint(POSTGRESQL_BARCODE_UNIQUE, "products", type_="unique")
+        op.create_unique_constraint("uq_products_project_barcode", "products", ["project_id", "barcode"])
+    op.create_index("ix_products_project_status_quantity", "products", ["project_id", "status", "quantity"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_project_status_quantity", table_name="products")
+    if op.get_bind().dialect.name == "sqlite":
+        with op.batch_alter_table("products", naming_convention=SQLITE_NAMING) as batch:
+            batch.drop_constraint("uq_products_project_barcode", type_="unique")
+            batch.create_unique_constraint("uq_products_barcode", ["barcode"])
+    else:
+        op.drop_constraint("uq_products_project_barcode", "products", type_="unique")
+        op.create_unique_constraint(POSTGRESQL_BARCODE_UNIQUE, "products", ["barcode"])
@@ -0,0 +1,89 @@
+"""Полнотекстовый индекс товаров (SQLite FTS5).
+
+Таблица products_fts хранит только индекс по name и description
+(content='products'), строки связаны по rowid. Триггеры обновляют индекс
+при вставке, удалении и изменении названия или описания; изменение
+остатков индекс не трогает. На других СУБД и в SQLite без FTS5 миграция
+ничего не делает — поиск работает через LIKE.
+
+Пересоздание таблицы products (batch-миграции SQLite) удаляет триггеры
+и меняет rowid: такая миграция должна пересоздать триггеры и выполнить
+INSERT INTO products_fts(products_fts) VALUES('rebuild').
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.exc import OperationalError
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+CREATE_TABLE = """
+CREATE VIRTUAL TABLE products_fts USING fts5(
+    name,
+    description,
+    content='products',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+)
+"""
+
+TRIGGERS = {
+    "products_fts_ai": """
+CREATE TRIGGER products_fts_ai AFTER INSERT ON products BEGIN
+    INSERT INTO products_fts(rowid, name, description) VALUES (new.rowid, new.name, new.description);
+END
+""",
+    "products_fts_ad": """
+CREATE TRIGGER products_fts_ad AFTER DELETE ON products BEGIN
+    INSERT INTO products_fts(products_fts, rowid, name, description)
+    VALUES ('delete', old.rowid, old.name, old.description);
+END
+""",
+    "products_fts_au": """
+CREATE TRIGGER products_fts_au AFTER UPDATE OF name, description ON products BEGIN
+    INSERT INTO products_fts(products_fts, rowid, name, description)
+    VALUES ('delete', old.rowid, old.name, old.description);
+    INSERT INTO products_fts(rowid, name, description) VALUES (new.rowid, new.name, new.description);
+END
+""",
+}
+
+
+def _fts5_available(bind) -> bool:
+    """Собран ли SQLite с FTS5 (пробная таблица в точке сохранения)."""
+    savepoint = bind.begin_nested()
+    try:
+        bind.execute(sa.text("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(value)"))
+    except OperationalError:
+        savepoint.rollback()
+        return False
+    bind.execute(sa.text("DROP TABLE temp.fts5_probe"))
+    savepoint.commit()
+    return True
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite" or not _fts5_available(bind):
+        return
+    op.execute(CREATE_TABLE)
+    for ddl in TRIGGERS.values():
+        op.execute(ddl)
+    # Индекс для уже существующих товаров
+    op.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DROP TABLE IF EXISTS products_fts")
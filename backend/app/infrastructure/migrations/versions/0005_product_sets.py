@@ -0,0 +1,60 @@
+"""Комплекты товаров и их списание при выполнении задачи.
+
+Комплект (product_sets) и его позиции (product_set_items) описывают,
+сколько единиц каких товаров расходует задача; tasks.product_set_id
+связывает задачу с комплектом.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "product_sets",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("project_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "product_set_items",
+        sa.Column("product_set_id", sa.String(), nullable=False),
+        sa.Column("product_id", sa.String(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["product_set_id"], ["product_sets.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("product_set_id", "product_id"),
+    )
+    if op.get_bind().dialect.name == "sqlite":
+        # SQLite умеет добавить колонку со ссылкой без пересоздания таблицы
+        # (при пересоздании пришлось бы заново описывать частичный индекс
+        # ix_tasks_open_deadline), но Alembic так её не добавляет
+        op.execute("ALTER TABLE tasks ADD COLUMN product_set_id VARCHAR REFERENCES product_sets (id)")
+    else:
+        op.add_column("tasks", sa.Column("product_set_id", sa.String(), nullable=True))
+        op.create_foreign_key("fk_tasks_product_set_id", "tasks", "product_sets", ["product_set_id"], ["id"])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        # Ссылка без имени: SQLite удаляет колонку вместе с ней (3.35+)
+        op.execute("ALTER TABLE tasks DROP COLUMN product_set_id")
+    else:
+        op.drop_constraint("fk_tasks_product_set_id", "tasks", type_="foreignkey")
+        op.drop_column("tasks", "product_set_id")
+    op.drop_table("product_set_items")
+    op.drop_table("product_sets")
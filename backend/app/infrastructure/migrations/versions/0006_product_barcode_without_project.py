@@ -0,0 +1,42 @@
+"""Уникальный штрих-код у товаров вне проектов; индекс страниц товаров.
+
+UNIQUE (project_id, barcode) не ограничивает строки с project_id IS NULL:
+NULL не равен NULL, и товары вне проектов могли получить одинаковый
+штрих-код. Частичный уникальный индекс по barcode для таких строк
+закрывает этот пробел. Индекс (project_id, created_at) обслуживает
+постраничные списки товаров проекта.
+
+Если в БД уже есть товары вне проектов с одинаковым штрих-кодом,
+миграция не применится: дубликаты нужно исправить вручную.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+WITHOUT_PROJECT = sa.text("project_id IS NULL")
+
+
+def upgrade() -> None:
+    op.create_index(
+        "uq_products_barcode_without_project",
+        "products",
+        ["barcode"],
+        unique=True,
+        sqlite_where=WITHOUT_PROJECT,
+        postgresql_where=WITHOUT_PROJECT,
+    )
+    op.create_index("ix_products_project_created_at", "products", ["project_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_project_created_at", table_name="products")
+    op.drop_index("uq_products_barcode_without_project", table_name="products")
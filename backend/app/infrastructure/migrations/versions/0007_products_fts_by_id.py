@@ -0,0 +1,131 @@
+"""Индекс поиска товаров, связанный по ID товара, а не по rowid.
+
+Таблица products_fts из миграции 0004 ссылалась на товары по rowid
+(content_rowid='rowid'). У products первичный ключ VARCHAR, поэтому rowid
+неявный и не постоянен: VACUUM может перенумеровать строки, и индекс
+молча указывал бы на другие товары. Теперь индекс хранит свою копию
+названия и описания и ID товара в неиндексируемом столбце product_id;
+поиск соединяет его с products по ID.
+
+Удаление и изменение товара ищут строку индекса по product_id полным
+просмотром индекса; это редкие операции, а вставка и поиск его не требуют.
+
+Пересоздание таблицы products (batch-миграции SQLite) удаляет триггеры:
+такая миграция должна пересоздать их (см. TRIGGERS).
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.exc import OperationalError
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+CREATE_TABLE = """
+CREATE VIRTUAL TABLE products_fts USING fts5(
+    name,
+    description,
+    product_id UNINDEXED,
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+)
+"""
+
+TRIGGERS = {
+    "products_fts_ai": """
+CREATE TRIGGER products_fts_ai AFTER INSERT ON products BEGIN
+    INSERT INTO products_fts(name, description, product_id) VALUES (new.name, new.description, new.id);
+END
+""",
+    "products_fts_ad": """
+CREATE TRIGGER products_fts_ad AFTER DELETE ON products BEGIN
+    DELETE FROM products_fts WHERE product_id = old.id;
+END
+""",
+    "products_fts_au": """
+CREATE TRIGGER products_fts_au AFTER UPDATE OF id, name, description ON products BEGIN
+    UPDATE products_fts SET name = new.name, description = new.description, product_id = new.id
+    WHERE product_id = old.id;
+END
+""",
+}
+
+# Индекс из миграции 0004 — для отката
+ROWID_TABLE = """
+CREATE VIRTUAL TABLE products_fts USING fts5(
+    name,
+    description,
+    content='products',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+)
+"""
+
+ROWID_TRIGGERS = {
+    "products_fts_ai": """
+CREATE TRIGGER products_fts_ai AFTER INSERT ON products BEGIN
+    INSERT INTO products_fts(rowid, name, description) VALUES (new.rowid, new.name, new.description);
+END
+""",
+    "products_fts_ad": """
+CREATE TRIGGER products_fts_ad AFTER DELETE ON products BEGIN
+    INSERT INTO products_fts(products_fts, rowid, name, description)
+    VALUES ('delete', old.rowid, old.name, old.description);
+END
+""",
+    "products_fts_au": """
+CREATE TRIGGER products_fts_au AFTER UPDATE OF name, description ON products BEGIN
+    INSERT INTO products_fts(products_fts, rowid, name, description)
+    VALUES ('delete', old.rowid, old.name, old.description);
+    INSERT INTO products_fts(rowid, name, description) VALUES (new.rowid, new.name, new.description);
+END
+""",
+}
+
+
+def _fts5_available(bind) -> bool:
+    """Собран ли SQLite с FTS5 (пробная таблица в точке сохранения)."""
+    savepoint = bind.begin_nested()
+    try:
+        bind.execute(sa.text("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(value)"))
+    except OperationalError:
+        savepoint.rollback()
+        return False
+    bind.execute(sa.text("DROP TABLE temp.fts5_probe"))
+    savepoint.commit()
+    return True
+
+
+def _drop() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DROP TABLE IF EXISTS products_fts")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite" or not _fts5_available(bind):
+        return
+    _drop()
+    op.execute(CREATE_TABLE)
+    for ddl in TRIGGERS.values():
+        op.execute(ddl)
+    op.execute("INSERT INTO products_fts(name, description, product_id) SELECT name, description, id FROM products")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite" or not _fts5_available(bind):
+        return
+    _drop()
+    op.execute(ROWID_TABLE)
+    for ddl in ROWID_TRIGGERS.values():
+        op.execute(ddl)
+    op.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Index, UniqueConstraint, literal_column, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.sqlite import JSON
 
@@ -57,10 +58,31 @@ class TaskModel(Base):
     completed_at = Column(DateTime, nullable=True)
     completion_photos = Column(JSON, nullable=True)  # Список URL фотографий
     completion_comment = Column(Text, nullable=True)
+    product_set_id = Column(String, ForeignKey("product_sets.id"), nullable=True)  # Списывается при выполнении
     project_id = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Индексы создаются миграцией 0002; здесь они описаны для согласованности metadata
+    __table_args__ = (
+        Index("ix_tasks_project_assignee_status", "project_id", "assignee_id", "status"),
+        Index("ix_tasks_project_created_at", "project_id", "created_at"),
+        Index("ix_tasks_assignee_created_at", "assignee_id", "created_at"),
+        Index("ix_tasks_creator_created_at", "creator_id", "created_at"),
+        Index("ix_tasks_created_at", "created_at"),
+        Index(
+            "ix_tasks_open_deadline",
+            "deadline",
+            sqlite_where=text("status != 'COMPLETED'"),
+            postgresql_where=text("status != 'COMPLETED'"),
+        ),
+    )
+
+
+# Условие «задача не выполнена» записано литералом, а не параметром:
+# только так планировщик сопоставляет запрос с частичным индексом ix_tasks_open_deadline
+TASK_IS_OPEN = TaskModel.status != literal_column("'COMPLETED'")
+
 
 class ProductModel(Base):
     """Модель товара в БД."""
@@ -73,9 +95,51 @@ class ProductModel(Base):
     quantity = Column(Integer, nullable=False, default=0)
     category_id = Column(String, ForeignKey("categories.id"), nullable=True)
     photo_url = Column(String, nullable=True)
-    barcode = Column(String, nullable=True, unique=True)
+    barcode = Column(String, nullable=True)
     status = Column(SQLEnum(ProductStatus), nullable=False)
     project_id = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Создаются миграциями 0003 и 0006. Штрих-код уникален в пределах проекта, и
+    # уникальный индекс по (project_id, barcode) обслуживает поиск при сканировании;
+    # у товаров вне проектов (NULL в project_id) уникальность держит частичный индекс.
+    # (project_id, status, quantity) — списки заканчивающихся и отсутствующих товаров,
+    # (project_id, created_at) — постраничный список товаров проекта
+    __table_args__ = (
+        UniqueConstraint("project_id", "barcode", name="uq_products_project_barcode"),
+        Index(
+            "uq_products_barcode_without_project",
+            "barcode",
+            unique=True,
+            sqlite_where=text("project_id IS NULL"),
+            postgresql_where=text("project_id IS NULL"),
+        ),
+        Index("ix_products_project_status_quantity", "project_id", "status", "quantity"),
+        Index("ix_products_project_created_at", "project_id", "created_at"),
+    )
+
+
+
+class ProductSetModel(Base):
+    """Модель комплекта товаров в БД."""
+
+    __tablename__ = "product_sets"
+
+    id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    is_active = Column(Boolean, default=True)
+    project_id = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ProductSetItemModel(Base):
+    """Позиция комплекта: сколько единиц товара списывается."""
+
+    __tablename__ = "product_set_items"
+
+    product_set_id = Column(String, ForeignKey("product_sets.id", ondelete="CASCADE"), primary_key=True)
+    product_id = Column(String, ForeignKey("products.id"), primary_key=True)
+    quantity = Column(Integer, nullable=False)
@@ -0,0 +1,89 @@
+"""Пул соединений с метриками выдачи соединений."""
+
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .metrics import REGISTRY
+
+POOL_CHECKOUTS = REGISTRY.counter(
+    "db_pool_checkouts_total", "Выдано соединений из пула", ["pool"]
+)
+POOL_CHECKOUT_TIMEOUTS = REGISTRY.counter(
+    "db_pool_checkout_timeouts_total", "Соединение не получено за pool_timeout", ["pool"]
+)
+POOL_CHECKOUT_SECONDS = REGISTRY.histogram(
+    "db_pool_checkout_seconds", "Время получения соединения из пула, с", ["pool"]
+)
+POOL_CONNECTIONS_CREATED = REGISTRY.counter(
+    "db_pool_connections_created_total", "Открыто новых соединений с БД", ["pool"]
+)
+POOL_CONNECTIONS_IN_USE = REGISTRY.gauge(
+    "db_pool_connections_in_use", "Соединения, выданные из пула", ["pool"]
+)
+POOL_CONNECTIONS_IDLE = REGISTRY.gauge(
+    "db_pool_connections_idle", "Свободные соединения в пуле", ["pool"]
+)
+POOL_OVERFLOW = REGISTRY.gauge(
+    "db_pool_overflow", "Соединения сверх pool_size (отрицательное — ещё не открытые)", ["pool"]
+)
+POOL_SIZE = REGISTRY.gauge("db_pool_size", "Настроенный размер пула", ["pool"])
+
+
+class _InstrumentedPoolMixin:
+    """Считает выдачи соединений и время ожидания.
+
+    Метка пула берётся из pool_logging_name движка: она переживает
+    пересоздание пула при engine.dispose().
+    """
+
+    @property
+    def metrics_label(self) -> str:
+        return self._orig_logging_name or "default"
+
+    def connect(self):
+        label = self.metrics_label
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(pool=label)
+            raise
+        finally:
+            POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start, pool=label)
+        POOL_CHECKOUTS.inc(pool=label)
+        return connection
+
+    def _create_connection(self):
+        connection = super()._create_connection()
+        POOL_CONNECTIONS_CREATED.inc(pool=self.metrics_label)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool с метриками."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """Пул асинхронного движка с метриками."""
+
+
+def register_pool_gauges(target_engine, label: str) -> None:
+    """Снимать состояние пула движка при экспорте метрик.
+
+    Функции обращаются к engine.pool при каждом вызове, поэтому
+    продолжают работать после пересоздания пула.
+    """
+
+    def reader(method: str):
+        def read():
+            pool = target_engine.pool
+            return getattr(pool, method)() if isinstance(pool, QueuePool) else None
+
+        return read
+
+    POOL_CONNECTIONS_IN_USE.set_function(reader("checkedout"), pool=label)
+    POOL_CONNECTIONS_IDLE.set_function(reader("checkedin"), pool=label)
+    POOL_OVERFLOW.set_function(reader("overflow"), pool=label)
+    POOL_SIZE.set_function(reader("size"), pool=label)
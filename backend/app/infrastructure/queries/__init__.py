@@ -0,0 +1,7 @@
+"""Реализации запросов чтения."""
+
+from .task_queries_impl import TaskQueriesImpl
+
+__all__ = [
+    "TaskQueriesImpl",
+]
@@ -0,0 +1,58 @@
+"""Реализация запросов чтения задач."""
+
+from typing import List, Optional
+
+from sqlalchemy import select
+
+from ...application.pagination import Keyset
+from ...application.queries.task_queries import TaskQueries
+from ...domain.value_objects import UserId
+from ..models import TaskModel
+from ..repositories.base import SqlAlchemyRepository
+
+# Колонки, которые попадают в ответ списка
+_COLUMNS = (
+    TaskModel.id,
+    TaskModel.title,
+    TaskModel.description,
+    TaskModel.status,
+    TaskModel.priority,
+    TaskModel.category_id,
+    TaskModel.assignee_id,
+    TaskModel.creator_id,
+    TaskModel.deadline,
+    TaskModel.created_at,
+    TaskModel.updated_at,
+    TaskModel.completed_at,
+    TaskModel.completion_photos,
+    TaskModel.completion_comment,
+    TaskModel.project_id,
+    TaskModel.product_set_id,
+)
+
+
+class TaskQueriesImpl(SqlAlchemyRepository, TaskQueries):
+    """Списки задач одним запросом по нужным колонкам, без ORM-объектов и сущностей."""
+
+    async def list_rows(
+        self,
+        assignee_id: Optional[UserId] = None,
+        creator_id: Optional[UserId] = None,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[dict]:
+        """Получить задачи, подходящие под все заданные фильтры, от новых к старым."""
+        query = select(*_COLUMNS)
+        if assignee_id:
+            query = query.where(TaskModel.assignee_id == assignee_id.value)
+        if creator_id:
+            query = query.where(TaskModel.creator_id == creator_id.value)
+        if project_id:
+            query = query.where(TaskModel.project_id == project_id)
+        result = await self._execute(self._paginate(query, TaskModel, limit, after, descending=True))
+        rows = [dict(row) for row in result.mappings()]
+        for row in rows:
+            # Пустой список фотографий в ответе — null, как у одиночной задачи
+            row["completion_photos"] = row["completion_photos"] or None
+        return rows
@@ -1,10 +1,14 @@
 """Реализации репозиториев."""
 
+from .product_repository_impl import ProductRepositoryImpl
+from .product_set_repository_impl import ProductSetRepositoryImpl
 from .task_repository_impl import TaskRepositoryImpl
 from .user_repository_impl import UserRepositoryImpl
 
 __all__ = [
     "UserRepositoryImpl",
     "TaskRepositoryImpl",
+    "ProductRepositoryImpl",
+    "ProductSetRepositoryImpl",
 ]
 
@@ -0,0 +1,89 @@
+"""Базовый класс репозиториев на SQLAlchemy."""
+
+from typing import Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...application.pagination import Keyset
+from ..database import DbSession
+
+
+class SqlAlchemyRepository:
+    """Общая основа репозиториев для синхронной и асинхронной сессий.
+
+    Запросы строятся в стиле SQLAlchemy 2.0 (select/insert/update/delete),
+    поэтому один и тот же код работает и с Session, и с AsyncSession.
+    С асинхронной сессией обращения к БД не блокируют event loop.
+    """
+
+    def __init__(self, db: DbSession, autocommit: bool = True):
+        self.db = db
+        self._is_async = isinstance(db, AsyncSession)
+        # Внутри единицы работы фиксацию выполняет она сама (см. SqlAlchemyUnitOfWork)
+        self._autocommit = autocommit
+
+    async def _execute(self, statement, params=None):
+        """Выполнить запрос."""
+        if self._is_async:
+            return await self.db.execute(statement, params)
+        return self.db.execute(statement, params)
+
+    @property
+    def _dialect(self):
+        """Диалект БД, к которой привязана сессия."""
+        return self.db.get_bind().dialect
+
+    async def _commit(self) -> None:
+        """Зафиксировать транзакцию или, внутри единицы работы, только сбросить изменения в БД."""
+        if self._is_async:
+            await (self.db.commit() if self._autocommit else self.db.flush())
+        elif self._autocommit:
+            self.db.commit()
+        else:
+            self.db.flush()
+
+    async def _rollback(self) -> None:
+        """Откатить транзакцию после ошибки записи.
+
+        Внутри единицы работы откат остаётся за ней: откат сессии отменил бы
+        и все её предыдущие изменения, а ошибка и так прерывает её целиком.
+        """
+        if not self._autocommit:
+            return
+        if self._is_async:
+            await self.db.rollback()
+        else:
+            self.db.rollback()
+
+    async def _refresh(self, instance) -> None:
+        """Перечитать объект из БД."""
+        if self._is_async:
+            await self.db.refresh(instance)
+        else:
+            self.db.refresh(instance)
+
+    @staticmethod
+    def _paginate(query, model, limit: Optional[int], after: Optional[Keyset], descending: bool = False):
+        """Отсортировать по (created_at, id) и продолжить после ключа after.
+
+        Условие раскрыто в OR, а не записано сравнением кортежей,
+        которое поддерживают не все диалекты.
+        """
+        created_at, row_id = model.created_at, model.id
+        if after is not None:
+            if descending:
+                query = query.where(
+                    or_(created_at < after.created_at, and_(created_at == after.created_at, row_id < after.id))
+                )
+            else:
+                query = query.where(
+                    or_(created_at > after.created_at, and_(created_at == after.created_at, row_id > after.id))
+                )
+        if descending:
+            query = query.order_by(created_at.desc(), row_id.desc())
+        else:
+            query = query.order_by(created_at, row_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
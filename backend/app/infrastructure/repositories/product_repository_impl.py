@@ -0,0 +1,338 @@
+"""Реализация репозитория товаров."""
+
+import weakref
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, bindparam, case, column, delete, literal, or_, select, table, text, update
+from sqlalchemy.exc import IntegrityError
+
+from ...application.pagination import Keyset
+from ...application.repositories.product_repository import ProductRepository
+from ...domain.enums import ProductStatus
+from ...domain.product import Product
+from ...domain.value_objects import Barcode, CategoryId, PhotoUrl, ProductId, Quantity
+from ..fts import DESCRIPTION_WEIGHT, NAME_WEIGHT, PRODUCTS_FTS, match_expression, search_terms
+from ..models import ProductModel
+from .base import SqlAlchemyRepository
+
+
+_FTS = table(PRODUCTS_FTS, column("product_id"))
+
+# Есть ли в БД движка индекс полнотекстового поиска (проверяется один раз)
+_fts_available: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class ProductRepositoryImpl(SqlAlchemyRepository, ProductRepository):
+    """Реализация репозитория товаров.
+
+    Поиск по штрих-коду идёт по уникальному индексу (project_id, barcode),
+    списки остатков — по индексу (project_id, status, quantity), поиск по
+    названию — по индексу FTS5 (см. infrastructure/fts.py).
+    """
+
+    async def create(self, product: Product) -> Product:
+        """Создать товар.
+
+        Raises:
+            ValueError: Товар с таким штрих-кодом в проекте уже есть
+                (например, его одновременно добавил другой запрос)
+        """
+        product_model = ProductModel(**self._to_row(product))
+        self.db.add(product_model)
+        try:
+            await self._commit()
+        except IntegrityError:
+            await self._rollback()
+            raise ValueError("Товар с таким штрих-кодом уже существует")
+        await self._refresh(product_model)
+        return self._to_domain(product_model)
+
+    async def get_by_id(self, product_id: ProductId) -> Optional[Product]:
+        """Получить товар по ID."""
+        product_model = await self._first(select(ProductModel).where(ProductModel.id == product_id.value))
+        return self._to_domain(product_model) if product_model else None
+
+    async def list_by_ids(self, product_ids: List[ProductId]) -> List[Product]:
+        """Получить товары по списку ID одним запросом."""
+        if not product_ids:
+            return []
+        ids = {product_id.value for product_id in product_ids}
+        return await self._list(select(ProductModel).where(ProductModel.id.in_(ids)))
+
+    async def list_by_ids_or_barcodes(self, keys: List[str], project_id: Optional[str] = None) -> List[Product]:
+        """Получить товары проекта по ID или штрих-кодам одним запросом.
+
+        Как и в get_by_barcode, без project_id ищутся товары вне проектов:
+        штрих-код уникален только в пределах проекта.
+        """
+        if not keys:
+            return []
+        keys = set(keys)
+        query = select(ProductModel).where(
+            ProductModel.project_id.is_(None) if project_id is None else ProductModel.project_id == project_id,
+            or_(ProductModel.id.in_(keys), ProductModel.barcode.in_(keys)),
+        )
+        return await self._list(query)
+
+    async def update(self, product: Product) -> Product:
+        """Обновить товар."""
+        product_model = await self._first(select(ProductModel).where(ProductModel.id == product.id.value))
+        if not product_model:
+            raise ValueError("Товар не найден")
+
+        for field_name, value in self._to_row(product).items():
+            if field_name not in ("id", "created_at"):
+                setattr(product_model, field_name, value)
+
+        await self._commit()
+        await self._refresh(product_model)
+        return self._to_domain(product_model)
+
+    async def adjust_quantity(self, product_id: ProductId, delta: int, updated_at: datetime) -> Optional[Product]:
+        """Изменить остаток одним условным UPDATE.
+
+        Остаток меняется выражением quantity + delta на стороне БД и только
+        при quantity >= -delta, поэтому одновременные списания не теряют
+        друг друга и не уводят остаток в минус: без блокировок и повторов
+        каждое либо применяется целиком, либо получает None. Статус
+        пересчитывается тем же запросом; архивные товары статус не меняют.
+        """
+        quantity = ProductModel.quantity + delta
+        statement = (
+            update(ProductModel)
+            .where(ProductModel.id == product_id.value, ProductModel.quantity >= -delta)
+            .values(quantity=quantity, status=self._stock_status(quantity), updated_at=updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        if self._dialect.update_returning:
+            result = await self._execute(statement.returning(*ProductModel.__table__.columns))
+            row = result.first()
+            await self._commit()
+            return self._to_domain(row) if row else None
+
+        result = await self._execute(statement)
+        await self._commit()
+        if result.rowcount != 1:
+            return None
+        return await self.get_by_id(product_id)
+
+    async def subtract_many(
+        self, amounts: Dict[ProductId, int], updated_at: datetime, project_id: Optional[str] = None
+    ) -> int:
+        """Списать товары проекта одним UPDATE, выполненным через executemany.
+
+        Как и в list_by_ids_or_barcodes, без project_id списываются только
+        товары вне проектов. Условие и пересчёт статуса те же, что в
+        adjust_quantity; драйвер получает один запрос и список параметров.
+        Суммарное число изменённых строк надёжно не у всех драйверов: где
+        его нет, строки списываются по одной.
+        """
+        if not amounts:
+            return 0
+        products = ProductModel.__table__
+        quantity = products.c.quantity - bindparam("amount")
+        statement = (
+            update(products)
+            .where(
+                products.c.id == bindparam("product_id"),
+                products.c.project_id.is_(None) if project_id is None else products.c.project_id == project_id,
+                products.c.quantity >= bindparam("amount"),
+            )
+            .values(quantity=quantity, status=self._stock_status(quantity, products.c.status), updated_at=updated_at)
+        )
+        params = [{"product_id": product_id.value, "amount": amount} for product_id, amount in amounts.items()]
+        if self._dialect.supports_sane_multi_rowcount:
+            result = await self._execute(statement, params)
+            written = result.rowcount
+        else:
+            written = 0
+            for row in params:
+                written += (await self._execute(statement, row)).rowcount
+        await self._commit()
+        return written
+
+    async def set_quantities(self, quantities: Dict[ProductId, int], updated_at: datetime) -> None:
+        """Установить остатки одним UPDATE, выполненным через executemany."""
+        if not quantities:
+            return
+        products = ProductModel.__table__
+        quantity = bindparam("counted", type_=products.c.quantity.type)
+        statement = (
+            update(products)
+            .where(products.c.id == bindparam("product_id"))
+            .values(quantity=quantity, status=self._stock_status(quantity, products.c.status), updated_at=updated_at)
+        )
+        params = [{"product_id": product_id.value, "counted": counted} for product_id, counted in quantities.items()]
+        await self._execute(statement, params)
+        await self._commit()
+
+    @staticmethod
+    def _stock_status(quantity, status=ProductModel.status):
+        """Статус товара после изменения остатка до quantity.
+
+        Товар без остатка становится OUT_OF_STOCK, пополненный — снова ACTIVE;
+        архивные товары статус не меняют.
+        """
+        # Тип колонки у литералов: в БД статус хранится именем элемента перечисления
+        active = literal(ProductStatus.ACTIVE, ProductModel.status.type)
+        out_of_stock = literal(ProductStatus.OUT_OF_STOCK, ProductModel.status.type)
+        return case(
+            (and_(quantity == 0, status == ProductStatus.ACTIVE), out_of_stock),
+            (and_(quantity > 0, status == ProductStatus.OUT_OF_STOCK), active),
+            else_=status,
+        )
+
+    async def delete(self, product_id: ProductId) -> None:
+        """Удалить товар."""
+        await self._execute(delete(ProductModel).where(ProductModel.id == product_id.value))
+        await self._commit()
+
+    async def list_all(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[Product]:
+        """Получить список всех товаров."""
+        query = select(ProductModel)
+        if project_id:
+            query = query.where(ProductModel.project_id == project_id)
+        return await self._list(self._paginate(query, ProductModel, limit, after))
+
+    async def list_low_stock(
+        self,
+        threshold: int = 10,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[Product]:
+        """Получить активные товары с остатком от 1 до threshold."""
+        query = select(ProductModel).where(
+            ProductModel.status == ProductStatus.ACTIVE,
+            ProductModel.quantity > 0,
+            ProductModel.quantity <= threshold,
+        )
+        if project_id:
+            query = query.where(ProductModel.project_id == project_id)
+        return await self._list(self._paginate(query, ProductModel, limit, after))
+
+    async def list_out_of_stock(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[Product]:
+        """Получить список товаров, которых нет в наличии."""
+        query = select(ProductModel).where(ProductModel.status == ProductStatus.OUT_OF_STOCK)
+        if project_id:
+            query = query.where(ProductModel.project_id == project_id)
+        return await self._list(self._paginate(query, ProductModel, limit, after))
+
+    async def search_by_name(
+        self, name: str, project_id: Optional[str] = None, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Product]:
+        """Поиск товаров по названию и описанию, от более релевантных к менее."""
+        terms = search_terms(name)
+        if not terms:
+            return []
+        if await self._has_fts():
+            query = (
+                select(ProductModel)
+                .join(_FTS, _FTS.c.product_id == ProductModel.id)
+                .where(text(f"{PRODUCTS_FTS} MATCH :match").bindparams(match=match_expression(name)))
+                .order_by(
+                    text(f"bm25({PRODUCTS_FTS}, {NAME_WEIGHT}, {DESCRIPTION_WEIGHT})"),
+                    ProductModel.name,
+                    ProductModel.id,
+                )
+            )
+        else:
+            # Без FTS5: каждое слово встречается в названии или описании (полный просмотр).
+            # LIKE и lower() в SQLite не различают регистр только у латиницы,
+            # поэтому кириллица сравнивается в типичных вариантах написания.
+            query = select(ProductModel).order_by(ProductModel.name, ProductModel.id)
+            for term in terms:
+                variants = {term.lower(), term.capitalize(), term.upper()}
+                query = query.where(
+                    or_(
+                        *(
+                            field.contains(variant, autoescape=True)
+                            for variant in sorted(variants)
+                            for field in (ProductModel.name, ProductModel.description)
+                        )
+                    )
+                )
+        if project_id:
+            query = query.where(ProductModel.project_id == project_id)
+        if limit is not None:
+            query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
+        return await self._list(query)
+
+    async def get_by_barcode(self, barcode: str, project_id: Optional[str] = None) -> Optional[Product]:
+        """Получить товар по штрих-коду.
+
+        Без project_id ищется товар вне проектов (project_id IS NULL): штрих-код
+        уникален только в пределах проекта, и поиск по всем проектам был бы
+        неоднозначным.
+        """
+        query = select(ProductModel).where(
+            ProductModel.project_id.is_(None) if project_id is None else ProductModel.project_id == project_id,
+            ProductModel.barcode == barcode,
+        )
+        product_model = await self._first(query)
+        return self._to_domain(product_model) if product_model else None
+
+    async def _has_fts(self) -> bool:
+        """Создан ли в БД индекс products_fts (миграциями 0004 и 0007)."""
+        bind = self.db.get_bind()
+        if bind not in _fts_available:
+            found = False
+            if self._dialect.name == "sqlite":
+                result = await self._execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": PRODUCTS_FTS}
+                )
+                found = result.first() is not None
+            _fts_available[bind] = found
+        return _fts_available[bind]
+
+    async def _first(self, query) -> Optional[ProductModel]:
+        """Выполнить запрос и вернуть первую модель."""
+        result = await self._execute(query)
+        return result.scalars().first()
+
+    async def _list(self, query) -> List[Product]:
+        """Выполнить запрос списка и преобразовать строки в сущности."""
+        result = await self._execute(query)
+        return [self._to_domain(model) for model in result.scalars().all()]
+
+    def _to_row(self, product: Product) -> dict:
+        """Преобразовать доменную сущность в значения колонок."""
+        return {
+            "id": product.id.value,
+            "name": product.name,
+            "description": product.description,
+            "quantity": product.quantity.value,
+            "category_id": product.category_id.value if product.category_id else None,
+            "photo_url": product.photo_url.value if product.photo_url else None,
+            "barcode": product.barcode.value if product.barcode else None,
+            "status": product.status,
+            "project_id": product.project_id,
+            "created_at": product.created_at,
+            "updated_at": product.updated_at,
+        }
+
+    def _to_domain(self, model: ProductModel) -> Product:
+        """Преобразовать модель БД (или строку с теми же колонками) в доменную сущность."""
+        if not model:
+            return None
+
+        return Product(
+            id=ProductId(value=model.id),
+            name=model.name,
+            quantity=Quantity(value=model.quantity),
+            description=model.description,
+            category_id=CategoryId(value=model.category_id) if model.category_id else None,
+            photo_url=PhotoUrl(value=model.photo_url) if model.photo_url else None,
+            barcode=Barcode(value=model.barcode) if model.barcode else None,
+            status=ProductStatus(model.status),
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            project_id=model.project_id,
+        )
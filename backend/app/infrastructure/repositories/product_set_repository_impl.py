@@ -0,0 +1,79 @@
+"""Реализация репозитория комплектов товаров."""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert, select
+
+from ...application.repositories.product_set_repository import ProductSetRepository
+from ...domain.task_template import ProductSet
+from ..models import ProductSetItemModel, ProductSetModel
+from .base import SqlAlchemyRepository
+
+
+class ProductSetRepositoryImpl(SqlAlchemyRepository, ProductSetRepository):
+    """Реализация репозитория комплектов товаров.
+
+    Комплект и его позиции хранятся в двух таблицах, но читаются одним
+    запросом с внешним соединением, а позиции пишутся одним executemany.
+    """
+
+    async def create(self, product_set: ProductSet) -> ProductSet:
+        """Создать комплект вместе с позициями."""
+        await self._execute(
+            insert(ProductSetModel.__table__),
+            {
+                "id": product_set.id,
+                "name": product_set.name,
+                "description": product_set.description,
+                "is_active": product_set.is_active,
+                "project_id": product_set.project_id,
+                "created_at": product_set.created_at,
+                "updated_at": product_set.updated_at,
+            },
+        )
+        if product_set.products:
+            await self._execute(
+                insert(ProductSetItemModel.__table__),
+                [
+                    {"product_set_id": product_set.id, "product_id": product_id, "quantity": quantity}
+                    for product_id, quantity in product_set.products.items()
+                ],
+            )
+        await self._commit()
+        return product_set
+
+    async def get_by_id(self, product_set_id: str) -> Optional[ProductSet]:
+        """Получить комплект с позициями по ID."""
+        product_sets = await self._list(ProductSetModel.id == product_set_id)
+        return product_sets[0] if product_sets else None
+
+    async def list_by_ids(self, product_set_ids: List[str]) -> List[ProductSet]:
+        """Получить комплекты с позициями по списку ID одним запросом."""
+        if not product_set_ids:
+            return []
+        return await self._list(ProductSetModel.id.in_(set(product_set_ids)))
+
+    async def _list(self, condition) -> List[ProductSet]:
+        """Комплекты, подходящие под условие, вместе с позициями (одним запросом)."""
+        query = (
+            select(ProductSetModel, ProductSetItemModel.product_id, ProductSetItemModel.quantity)
+            .outerjoin(ProductSetItemModel, ProductSetItemModel.product_set_id == ProductSetModel.id)
+            .where(condition)
+        )
+        product_sets: Dict[str, ProductSet] = {}
+        for model, product_id, quantity in (await self._execute(query)).all():
+            product_set = product_sets.get(model.id)
+            if product_set is None:
+                product_set = product_sets[model.id] = ProductSet(
+                    id=model.id,
+                    name=model.name,
+                    description=model.description,
+                    products={},
+                    created_at=model.created_at,
+                    updated_at=model.updated_at,
+                    is_active=model.is_active,
+                    project_id=model.project_id,
+                )
+            if product_id is not None:
+                product_set.products[product_id] = quantity
+        return list(product_sets.values())
@@ -3,53 +3,73 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select, update
 
+from ...application.pagination import Keyset
 from ...application.repositories.task_repository import TaskRepository
+from ...application.versions import EntityVersion
 from ...domain.task import Task
-from ...domain.value_objects import TaskId, UserId
+from ...domain.value_objects import Comment, PhotoUrl, TaskId, UserId
 from ...domain.enums import TaskStatus, TaskPriority
-from ..models import TaskModel
+from ..models import TASK_IS_OPEN, TaskModel
+from .base import SqlAlchemyRepository
 
 
-class TaskRepositoryImpl(TaskRepository):
+class TaskRepositoryImpl(SqlAlchemyRepository, TaskRepository):
     """Реализация репозитория задач."""
 
-    def __init__(self, db: Session):
-        self.db = db
-
     async def create(self, task: Task) -> Task:
         """Создать задачу."""
-        task_model = TaskModel(
-            id=task.id.value,
-            title=task.title,
-            description=task.description,
-            status=task.status.value,
-            priority=task.priority.value,
-            category_id=task.category_id.value if task.category_id else None,
-            assignee_id=task.assignee_id.value if task.assignee_id else None,
-            creator_id=task.creator_id.value,
-            deadline=task.deadline.value if task.deadline else None,
-            completed_at=task.completed_at,
-            completion_photos=[photo.value for photo in task.completion_photos] if task.completion_photos else None,
-            completion_comment=task.completion_comment.value if task.completion_comment else None,
-            project_id=task.project_id,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
+        task_model = TaskModel(**self._to_row(task))
         self.db.add(task_model)
-        self.db.commit()
-        self.db.refresh(task_model)
+        await self._commit()
+        await self._refresh(task_model)
         return self._to_domain(task_model)
 
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        """Создать несколько задач одним executemany в одной транзакции.
+
+        Все значения известны заранее, поэтому строки не перечитываются из БД.
+        """
+        if not tasks:
+            return []
+        await self._execute(insert(TaskModel.__table__), [self._to_row(task) for task in tasks])
+        await self._commit()
+        return tasks
+
     async def get_by_id(self, task_id: TaskId) -> Optional[Task]:
         """Получить задачу по ID."""
-        task_model = self.db.query(TaskModel).filter(TaskModel.id == task_id.value).first()
+        task_model = await self._get_model(task_id.value)
         return self._to_domain(task_model) if task_model else None
 
+    async def get_version(self, task_id: TaskId) -> Optional[EntityVersion]:
+        """Получить версию задачи, не загружая её целиком."""
+        result = await self._execute(self._version_query().where(TaskModel.id == task_id.value))
+        row = result.first()
+        return EntityVersion(row.id, row.created_at, row.updated_at) if row else None
+
+    async def list_versions(
+        self,
+        assignee_id: Optional[UserId] = None,
+        creator_id: Optional[UserId] = None,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[EntityVersion]:
+        """Получить версии задач, подходящих под все заданные фильтры, в порядке списков."""
+        query = self._version_query()
+        if assignee_id:
+            query = query.where(TaskModel.assignee_id == assignee_id.value)
+        if creator_id:
+            query = query.where(TaskModel.creator_id == creator_id.value)
+        if project_id:
+            query = query.where(TaskModel.project_id == project_id)
+        result = await self._execute(self._paginate(query, TaskModel, limit, after, descending=True))
+        return [EntityVersion(row.id, row.created_at, row.updated_at) for row in result]
+
     async def update(self, task: Task) -> Task:
         """Обновить задачу."""
-        task_model = self.db.query(TaskModel).filter(TaskModel.id == task.id.value).first()
+        task_model = await self._get_model(task.id.value)
         if not task_model:
             raise ValueError("Задача не найдена")
 
@@ -63,67 +83,149 @@ class TaskRepositoryImpl(TaskRepository):
         task_model.completed_at = task.completed_at
         task_model.completion_photos = [photo.value for photo in task.completion_photos] if task.completion_photos else None
         task_model.completion_comment = task.completion_comment.value if task.completion_comment else None
+        task_model.product_set_id = task.product_set_id
         task_model.updated_at = task.updated_at
 
-        self.db.commit()
-        self.db.refresh(task_model)
+        await self._commit()
+        await self._refresh(task_model)
         return self._to_domain(task_model)
 
+    async def complete(
+        self,
+        task_id: TaskId,
+        completed_at: datetime,
+        comment: Optional[Comment] = None,
+        photos: Optional[List[PhotoUrl]] = None,
+    ) -> Optional[Task]:
+        """Отметить задачу выполненной одним условным UPDATE.
+
+        Из нескольких одновременных запросов строку изменит только первый,
+        остальные получат None. Там, где диалект поддерживает RETURNING,
+        обновлённая строка возвращается тем же запросом.
+        """
+        values = {
+            "status": TaskStatus.COMPLETED,
+            "completed_at": completed_at,
+            "updated_at": completed_at,
+        }
+        if comment:
+            values["completion_comment"] = comment.value
+        if photos:
+            values["completion_photos"] = [photo.value for photo in photos]
+
+        statement = (
+            update(TaskModel)
+            .where(TaskModel.id == task_id.value, TASK_IS_OPEN)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if self._dialect.update_returning:
+            result = await self._execute(statement.returning(*TaskModel.__table__.columns))
+            row = result.first()
+            await self._commit()
+            return self._to_domain(row) if row else None
+
+        result = await self._execute(statement)
+        await self._commit()
+        if result.rowcount != 1:
+            return None
+        return await self.get_by_id(task_id)
+
     async def delete(self, task_id: TaskId) -> None:
         """Удалить задачу."""
-        task_model = self.db.query(TaskModel).filter(TaskModel.id == task_id.value).first()
-        if task_model:
-            self.db.delete(task_model)
-            self.db.commit()
-
-    async def list_by_assignee(self, assignee_id: UserId, project_id: Optional[str] = None) -> List[Task]:
+        await self._execute(delete(TaskModel).where(TaskModel.id == task_id.value))
+        await self._commit()
+
+    async def list_by_assignee(
+        self,
+        assignee_id: UserId,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[Task]:
         """Получить список задач по исполнителю."""
-        query = self.db.query(TaskModel).filter(TaskModel.assignee_id == assignee_id.value)
+        query = select(TaskModel).where(TaskModel.assignee_id == assignee_id.value)
         if project_id:
-            query = query.filter(TaskModel.project_id == project_id)
-        task_models = query.all()
-        return [self._to_domain(model) for model in task_models]
-
-    async def list_by_creator(self, creator_id: UserId, project_id: Optional[str] = None) -> List[Task]:
+            query = query.where(TaskModel.project_id == project_id)
+        return await self._list(query, limit, after)
+
+    async def list_by_creator(
+        self,
+        creator_id: UserId,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[Task]:
         """Получить список задач по создателю."""
-        query = self.db.query(TaskModel).filter(TaskModel.creator_id == creator_id.value)
+        query = select(TaskModel).where(TaskModel.creator_id == creator_id.value)
         if project_id:
-            query = query.filter(TaskModel.project_id == project_id)
-        task_models = query.all()
-        return [self._to_domain(model) for model in task_models]
+            query = query.where(TaskModel.project_id == project_id)
+        return await self._list(query, limit, after)
 
-    async def list_by_project(self, project_id: str) -> List[Task]:
+    async def list_by_project(
+        self, project_id: str, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[Task]:
         """Получить список всех задач проекта."""
-        task_models = self.db.query(TaskModel).filter(TaskModel.project_id == project_id).all()
-        return [self._to_domain(model) for model in task_models]
+        return await self._list(select(TaskModel).where(TaskModel.project_id == project_id), limit, after)
 
     async def list_overdue(self, project_id: Optional[str] = None) -> List[Task]:
         """Получить список просроченных задач."""
         now = datetime.utcnow()
-        query = self.db.query(TaskModel).filter(
-            TaskModel.deadline < now,
-            TaskModel.status != TaskStatus.COMPLETED.value
-        )
+        query = select(TaskModel).where(TaskModel.deadline < now, TASK_IS_OPEN)
         if project_id:
-            query = query.filter(TaskModel.project_id == project_id)
-        task_models = query.all()
-        return [self._to_domain(model) for model in task_models]
+            query = query.where(TaskModel.project_id == project_id)
+        return await self._list(query)
 
     async def list_by_date_range(
         self, start_date: datetime, end_date: datetime, project_id: Optional[str] = None
     ) -> List[Task]:
         """Получить список задач в диапазоне дат."""
-        query = self.db.query(TaskModel).filter(
+        query = select(TaskModel).where(
             TaskModel.created_at >= start_date,
             TaskModel.created_at <= end_date
         )
         if project_id:
-            query = query.filter(TaskModel.project_id == project_id)
-        task_models = query.all()
-        return [self._to_domain(model) for model in task_models]
+            query = query.where(TaskModel.project_id == project_id)
+        return await self._list(query)
+
+    @staticmethod
+    def _version_query():
+        """Запрос только колонок версии."""
+        return select(TaskModel.id, TaskModel.created_at, TaskModel.updated_at)
+
+    async def _get_model(self, task_id: str) -> Optional[TaskModel]:
+        """Загрузить модель задачи по ID."""
+        result = await self._execute(select(TaskModel).where(TaskModel.id == task_id))
+        return result.scalars().first()
+
+    async def _list(self, query, limit: Optional[int] = None, after: Optional[Keyset] = None) -> List[Task]:
+        """Выполнить запрос списка (от новых к старым) и преобразовать строки в сущности."""
+        result = await self._execute(self._paginate(query, TaskModel, limit, after, descending=True))
+        return [self._to_domain(model) for model in result.scalars().all()]
+
+    def _to_row(self, task: Task) -> dict:
+        """Преобразовать доменную сущность в значения колонок."""
+        return {
+            "id": task.id.value,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status.value,
+            "priority": task.priority.value,
+            "category_id": task.category_id.value if task.category_id else None,
+            "assignee_id": task.assignee_id.value if task.assignee_id else None,
+            "creator_id": task.creator_id.value,
+            "deadline": task.deadline.value if task.deadline else None,
+            "completed_at": task.completed_at,
+            "completion_photos": [photo.value for photo in task.completion_photos] if task.completion_photos else None,
+            "completion_comment": task.completion_comment.value if task.completion_comment else None,
+            "project_id": task.project_id,
+            "product_set_id": task.product_set_id,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
 
     def _to_domain(self, model: TaskModel) -> Task:
-        """Преобразовать модель БД в доменную сущность."""
+        """Преобразовать модель БД (или строку с теми же колонками) в доменную сущность."""
         if not model:
             return None
 
@@ -145,5 +247,5 @@ class TaskRepositoryImpl(TaskRepository):
             completion_photos=[PhotoUrl(value=photo) for photo in model.completion_photos] if model.completion_photos else [],
             completion_comment=Comment(value=model.completion_comment) if model.completion_comment else None,
             project_id=model.project_id,
+            product_set_id=model.product_set_id,
         )
-
@@ -2,23 +2,29 @@
 
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
 
+from ...application.pagination import Keyset
 from ...application.repositories.user_repository import UserRepository
+from ...application.versions import EntityVersion
 from ...domain.user import User
 from ...domain.value_objects import UserId
 from ...domain.enums import UserRole
 from ..models import UserModel
+from .base import SqlAlchemyRepository
 
 
-class UserRepositoryImpl(UserRepository):
+class UserRepositoryImpl(SqlAlchemyRepository, UserRepository):
     """Реализация репозитория пользователей."""
 
-    def __init__(self, db: Session):
-        self.db = db
-
     async def create(self, user: User) -> User:
-        """Создать пользователя."""
+        """Создать пользователя.
+
+        Raises:
+            ValueError: Пользователь с таким ID или Telegram ID уже существует
+                (например, при одновременной регистрации)
+        """
         user_model = UserModel(
             id=user.id.value,
             telegram_id=user.telegram_id,
@@ -31,23 +37,57 @@ class UserRepositoryImpl(UserRepository):
             updated_at=user.updated_at,
         )
         self.db.add(user_model)
-        self.db.commit()
-        self.db.refresh(user_model)
+        try:
+            await self._commit()
+        except IntegrityError:
+            await self._rollback()
+            raise ValueError("Пользователь с таким Telegram ID уже существует")
+        await self._refresh(user_model)
         return self._to_domain(user_model)
 
     async def get_by_id(self, user_id: UserId) -> Optional[User]:
         """Получить пользователя по ID."""
-        user_model = self.db.query(UserModel).filter(UserModel.id == user_id.value).first()
+        user_model = await self._first(select(UserModel).where(UserModel.id == user_id.value))
         return self._to_domain(user_model) if user_model else None
 
+    async def list_by_ids(self, user_ids: List[UserId]) -> List[User]:
+        """Получить пользователей по списку ID одним запросом."""
+        if not user_ids:
+            return []
+        ids = {user_id.value for user_id in user_ids}
+        result = await self._execute(select(UserModel).where(UserModel.id.in_(ids)))
+        return [self._to_domain(model) for model in result.scalars().all()]
+
     async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         """Получить пользователя по Telegram ID."""
-        user_model = self.db.query(UserModel).filter(UserModel.telegram_id == telegram_id).first()
+        user_model = await self._first(select(UserModel).where(UserModel.telegram_id == telegram_id))
         return self._to_domain(user_model) if user_model else None
 
+    async def get_version(self, user_id: UserId) -> Optional[EntityVersion]:
+        """Получить версию пользователя, не загружая его целиком."""
+        result = await self._execute(self._version_query().where(UserModel.id == user_id.value))
+        row = result.first()
+        return EntityVersion(row.id, row.created_at, row.updated_at) if row else None
+
+    async def list_versions(
+        self,
+        project_id: Optional[str] = None,
+        active_only: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[EntityVersion]:
+        """Получить версии пользователей в порядке списков."""
+        query = self._version_query()
+        if active_only:
+            query = query.where(UserModel.is_active == True)
+        if project_id:
+            query = query.where(UserModel.project_id == project_id)
+        result = await self._execute(self._paginate(query, UserModel, limit, after))
+        return [EntityVersion(row.id, row.created_at, row.updated_at) for row in result]
+
     async def update(self, user: User) -> User:
         """Обновить пользователя."""
-        user_model = self.db.query(UserModel).filter(UserModel.id == user.id.value).first()
+        user_model = await self._first(select(UserModel).where(UserModel.id == user.id.value))
         if not user_model:
             raise ValueError("Пользователь не найден")
 
@@ -58,32 +98,47 @@ class UserRepositoryImpl(UserRepository):
         user_model.project_id = user.project_id
         user_model.updated_at = user.updated_at
 
-        self.db.commit()
-        self.db.refresh(user_model)
+        await self._commit()
+        await self._refresh(user_model)
         return self._to_domain(user_model)
 
     async def delete(self, user_id: UserId) -> None:
         """Удалить пользователя."""
-        user_model = self.db.query(UserModel).filter(UserModel.id == user_id.value).first()
-        if user_model:
-            self.db.delete(user_model)
-            self.db.commit()
+        await self._execute(delete(UserModel).where(UserModel.id == user_id.value))
+        await self._commit()
 
-    async def list_all(self, project_id: Optional[str] = None) -> List[User]:
+    async def list_all(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[User]:
         """Получить список всех пользователей."""
-        query = self.db.query(UserModel)
+        query = select(UserModel)
         if project_id:
-            query = query.filter(UserModel.project_id == project_id)
-        user_models = query.all()
-        return [self._to_domain(model) for model in user_models]
+            query = query.where(UserModel.project_id == project_id)
+        return await self._list(query, limit, after)
 
-    async def list_active(self, project_id: Optional[str] = None) -> List[User]:
+    async def list_active(
+        self, project_id: Optional[str] = None, limit: Optional[int] = None, after: Optional[Keyset] = None
+    ) -> List[User]:
         """Получить список активных пользователей."""
-        query = self.db.query(UserModel).filter(UserModel.is_active == True)
+        query = select(UserModel).where(UserModel.is_active == True)
         if project_id:
-            query = query.filter(UserModel.project_id == project_id)
-        user_models = query.all()
-        return [self._to_domain(model) for model in user_models]
+            query = query.where(UserModel.project_id == project_id)
+        return await self._list(query, limit, after)
+
+    @staticmethod
+    def _version_query():
+        """Запрос только колонок версии."""
+        return select(UserModel.id, UserModel.created_at, UserModel.updated_at)
+
+    async def _first(self, query) -> Optional[UserModel]:
+        """Получить первую модель из результата запроса."""
+        result = await self._execute(query)
+        return result.scalars().first()
+
+    async def _list(self, query, limit: Optional[int] = None, after: Optional[Keyset] = None) -> List[User]:
+        """Выполнить запрос списка (в порядке регистрации) и преобразовать строки в сущности."""
+        result = await self._execute(self._paginate(query, UserModel, limit, after))
+        return [self._to_domain(model) for model in result.scalars().all()]
 
     def _to_domain(self, model: UserModel) -> User:
         """Преобразовать модель БД в доменную сущность."""
@@ -101,4 +156,3 @@ class UserRepositoryImpl(UserRepository):
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
-
@@ -0,0 +1,108 @@
+"""Короткоживущие подписанные токены сессии."""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+from ..config.settings import get_settings
+from ..domain.user import User
+
+
+@dataclass(frozen=True)
+class SessionClaims:
+    """Данные пользователя, заверенные токеном сессии."""
+
+    user_id: str
+    telegram_id: int
+    project_id: Optional[str]
+    expires_at: int
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class SessionTokenSigner:
+    """Выпуск и проверка токенов вида <данные>.<подпись> (HMAC-SHA256).
+
+    Токен проверяется без обращения к БД: всё нужное (ID и проект)
+    лежит в нём самом. Поэтому срок жизни короткий — деактивация
+    пользователя вступает в силу не позже, чем истекут выданные токены.
+    """
+
+    def __init__(self, secret: bytes, ttl_seconds: int = 3600, clock: Callable[[], float] = time.time):
+        self._secret = secret
+        self._ttl = ttl_seconds
+        self._clock = clock
+
+    def issue(self, user: User) -> Tuple[str, SessionClaims]:
+        """Выпустить токен для пользователя."""
+        claims = SessionClaims(
+            user_id=user.id.value,
+            telegram_id=user.telegram_id,
+            project_id=user.project_id,
+            expires_at=int(self._clock()) + self._ttl,
+        )
+        payload = {
+            "uid": claims.user_id,
+            "tid": claims.telegram_id,
+            "pid": claims.project_id,
+            "exp": claims.expires_at,
+        }
+        body = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+        return f"{body}.{self._sign(body)}", claims
+
+    def verify(self, token: str) -> Optional[SessionClaims]:
+        """Проверить токен.
+
+        Returns:
+            Данные токена или None, если подпись неверна или срок истёк
+        """
+        body, separator, signature = token.partition(".")
+        if not separator:
+            return None
+        try:
+            if not hmac.compare_digest(self._sign(body), signature):
+                return None
+            payload = json.loads(_b64decode(body))
+            claims = SessionClaims(
+                user_id=str(payload["uid"]),
+                telegram_id=int(payload["tid"]),
+                project_id=payload.get("pid"),
+                expires_at=int(payload["exp"]),
+            )
+        except (ValueError, TypeError, KeyError):
+            return None
+        if claims.expires_at <= self._clock():
+            return None
+        return claims
+
+    def _sign(self, body: str) -> str:
+        return _b64encode(hmac.new(self._secret, body.encode("ascii"), hashlib.sha256).digest())
+
+
+@lru_cache(maxsize=1)
+def get_session_token_signer() -> Optional[SessionTokenSigner]:
+    """Подписывающий токены процесса (None, если ключ не настроен).
+
+    Ключ берётся из SESSION_TOKEN_SECRET, иначе выводится из токена бота,
+    поэтому одинаков во всех процессах. Без того и другого токены не
+    выпускаются: случайный ключ процесса не приняли бы другие воркеры.
+    """
+    settings = get_settings()
+    if settings.session_token_secret:
+        secret = settings.session_token_secret.encode()
+    elif settings.telegram_bot_token:
+        secret = hmac.new(b"SessionToken", settings.telegram_bot_token.encode(), hashlib.sha256).digest()
+    else:
+        return None
+    return SessionTokenSigner(secret, ttl_seconds=settings.session_token_ttl_seconds)
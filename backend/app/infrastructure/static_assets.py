@@ -0,0 +1,140 @@
+"""Статика фронтенда в памяти процесса.
+
+Файлы читаются один раз при старте. Для каждого заранее считаются хэш
+содержимого и сжатые варианты (gzip с максимальным уровнем и brotli с
+максимальным качеством — сжатие выполняется один раз, а не на каждый
+запрос). Ссылки вида /static/<файл> в HTML заменяются адресами с хэшем:
+такой адрес меняется вместе с содержимым, и клиент может хранить его
+сколько угодно.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .middleware.compression import DEFAULT_CONTENT_TYPES, preferred_encoding
+
+try:
+    import brotli
+except ImportError:  # без brotli храним только gzip
+    brotli = None
+
+FRONTEND_DIR = Path(__file__).resolve().parents[3] / "frontend"
+STATIC_PREFIX = "/static/"
+INDEX_FILE = "index.html"
+
+# Ссылки на статику в атрибутах src и href
+_STATIC_REFERENCE = re.compile(r"""(?P<prefix>(?:src|href)=["'])/static/(?P<path>[^"'?#]+)""")
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """Файл фронтенда с заранее сжатыми вариантами."""
+
+    path: str
+    hashed_path: str
+    content_type: str
+    digest: str
+    # Кодировка -> тело; "identity" есть всегда
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+    def select(self, accept_encoding: str) -> Tuple[Optional[str], bytes, str]:
+        """Вариант для заголовка Accept-Encoding клиента.
+
+        Returns:
+            Кодировка (None — без сжатия), тело и ETag этого варианта
+        """
+        encoding = preferred_encoding(accept_encoding, [name for name in ("br", "gzip") if name in self.variants])
+        if encoding is not None:
+            return encoding, self.variants[encoding], f'"{self.digest}-{encoding}"'
+        return None, self.variants["identity"], f'"{self.digest}"'
+
+
+def _hashed_name(path: str, digest: str) -> str:
+    """app.js -> app.<хэш>.js"""
+    stem, dot, suffix = path.rpartition(".")
+    if not dot or "/" in suffix:
+        return f"{path}.{digest}"
+    return f"{stem}.{digest}.{suffix}"
+
+
+class StaticAssetStore:
+    """Все файлы каталога фронтенда, доступные по исходному и хэшированному пути."""
+
+    def __init__(self, root: Path = FRONTEND_DIR):
+        self.root = root
+        self._assets: Dict[str, StaticAsset] = {}
+        self._hashed: Dict[str, StaticAsset] = {}
+        if root.is_dir():
+            self._load()
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        """Файл по исходному пути относительно каталога фронтенда."""
+        return self._assets.get(path)
+
+    def lookup(self, path: str) -> Tuple[Optional[StaticAsset], bool]:
+        """Файл по пути из URL /static/...
+
+        Returns:
+            Файл (или None) и признак того, что путь содержит хэш
+        """
+        asset = self._hashed.get(path)
+        if asset is not None:
+            return asset, True
+        return self._assets.get(path), False
+
+    def url_for(self, path: str) -> str:
+        """Адрес файла с хэшем (для неизвестного файла — обычный адрес)."""
+        asset = self._assets.get(path)
+        return STATIC_PREFIX + (asset.hashed_path if asset else path)
+
+    def _load(self) -> None:
+        files = sorted(
+            file
+            for file in self.root.rglob("*")
+            if file.is_file() and not any(part.startswith(".") for part in file.relative_to(self.root).parts)
+        )
+        # HTML последним: ссылки в нём заменяются адресами уже загруженных файлов
+        for file in sorted(files, key=lambda file: file.suffix == ".html"):
+            path = file.relative_to(self.root).as_posix()
+            content = file.read_bytes()
+            if file.suffix == ".html":
+                content = self._rewrite_references(content)
+            self._add(path, content)
+
+    def _rewrite_references(self, content: bytes) -> bytes:
+        def replace(match: "re.Match") -> str:
+            return match.group("prefix") + self.url_for(match.group("path"))
+
+        return _STATIC_REFERENCE.sub(replace, content.decode("utf-8")).encode("utf-8")
+
+    def _add(self, path: str, content: bytes) -> None:
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        variants = {"identity": content}
+        if content_type in DEFAULT_CONTENT_TYPES:
+            compressed = {"gzip": gzip.compress(content, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                compressed["br"] = brotli.compress(content, quality=11)
+            # Сжатый вариант храним, только если он действительно меньше
+            variants.update((name, body) for name, body in compressed.items() if len(body) < len(content))
+        asset = StaticAsset(
+            path=path,
+            hashed_path=_hashed_name(path, digest),
+            content_type=content_type,
+            digest=digest,
+            variants=variants,
+        )
+        self._assets[path] = asset
+        self._hashed[asset.hashed_path] = asset
+
+
+@lru_cache(maxsize=1)
+def get_asset_store() -> StaticAssetStore:
+    """Статика фронтенда процесса (загружается при первом обращении)."""
+    return StaticAssetStore()
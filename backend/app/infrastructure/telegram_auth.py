@@ -2,85 +2,186 @@
 
 import hashlib
 import hmac
-from typing import Optional, Dict
-from urllib.parse import parse_qsl, urlencode
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl
 
 
-def validate_telegram_init_data(init_data: str, bot_token: str) -> bool:
-    """Проверка подписи Telegram initData.
-    
+@dataclass(frozen=True)
+class TelegramInitData:
+    """Разобранная строка initData."""
+
+    fields: Dict[str, str]
+    hash: Optional[str]
+    user: Optional[Dict]
+    auth_date: Optional[int]
+
+    @property
+    def user_id(self) -> Optional[int]:
+        """Telegram ID пользователя."""
+        return self.user.get('id') if self.user else None
+
+    @property
+    def data_check_string(self) -> str:
+        """Строка, которую подписывает Telegram: поля без hash, отсортированные по ключу."""
+        return '\n'.join(f"{k}={v}" for k, v in sorted(self.fields.items()))
+
+
+def parse_init_data(init_data: str) -> Optional[TelegramInitData]:
+    """Разобрать initData за один проход (вместе с JSON пользователя).
+
     Args:
         init_data: Строка с данными от Telegram
-        bot_token: Токен бота от Telegram
-        
+
     Returns:
-        True если подпись валидна
+        Разобранные данные или None, если строка некорректна
     """
     try:
-        # Парсим данные
-        parsed_data = dict(parse_qsl(init_data))
-        
-        # Извлекаем hash и остальные данные
-        hash_value = parsed_data.pop('hash', None)
-        if not hash_value:
-            return False
-        
-        # Сортируем данные по ключу
-        data_check_string = '\n'.join(f"{k}={v}" for k, v in sorted(parsed_data.items()))
-        
-        # Создаем секретный ключ
-        secret_key = hmac.new(
-            b"WebAppData",
-            bot_token.encode(),
-            hashlib.sha256
-        ).digest()
-        
-        # Проверяем подпись
+        fields = dict(parse_qsl(init_data))
+        hash_value = fields.pop('hash', None)
+        user_data = fields.get('user')
+        user = json.loads(user_data) if user_data else None
+        if user is not None and not isinstance(user, dict):
+            return None
+        auth_date = int(fields['auth_date']) if 'auth_date' in fields else None
+    except (ValueError, TypeError):
+        return None
+    return TelegramInitData(fields=fields, hash=hash_value, user=user, auth_date=auth_date)
+
+
+class TelegramInitDataVerifier:
+    """Проверка подписи initData с кэшем уже проверенных строк.
+
+    Секретный ключ выводится из токена бота один раз. Проверенные строки
+    хранятся в ограниченном LRU-кэше по значению hash: повторный запрос
+    с той же строкой не разбирается и не подписывается заново. Срок
+    действия auth_date проверяется при каждом вызове, в том числе из кэша.
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        max_age_seconds: Optional[int] = 86400,
+        cache_size: int = 10000,
+        cache_ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._secret_key = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+        self._max_age = max_age_seconds or None
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl_seconds
+        self._clock = clock
+        # hash -> (исходная строка, разобранные данные, момент устаревания записи)
+        self._cache: "OrderedDict[str, Tuple[str, TelegramInitData, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, init_data: str) -> Optional[TelegramInitData]:
+        """Проверить initData.
+
+        Args:
+            init_data: Строка с данными от Telegram
+
+        Returns:
+            Разобранные данные, если подпись верна и auth_date не истёк, иначе None
+        """
+        now = self._clock()
+        data = self._cached(init_data, now)
+        if data is None:
+            data = parse_init_data(init_data)
+            if data is None or not data.hash or not self._signature_matches(data):
+                return None
+            self._remember(init_data, data, now)
+        return data if self._is_fresh(data, now) else None
+
+    def _signature_matches(self, data: TelegramInitData) -> bool:
         calculated_hash = hmac.new(
-            secret_key,
-            data_check_string.encode(),
+            self._secret_key,
+            data.data_check_string.encode(),
             hashlib.sha256
         ).hexdigest()
-        
-        return calculated_hash == hash_value
-    except Exception:
-        return False
+        return hmac.compare_digest(calculated_hash, data.hash)
+
+    def _is_fresh(self, data: TelegramInitData, now: float) -> bool:
+        if self._max_age is None:
+            return True
+        return data.auth_date is not None and now - data.auth_date <= self._max_age
+
+    def _cached(self, init_data: str, now: float) -> Optional[TelegramInitData]:
+        if not self._cache_size:
+            return None
+        hash_value = _extract_hash(init_data)
+        if not hash_value:
+            return None
+        with self._lock:
+            entry = self._cache.get(hash_value)
+            if entry is None:
+                return None
+            raw, data, expires_at = entry
+            # Совпадение hash недостаточно: строка должна быть той же самой
+            if raw != init_data or expires_at <= now:
+                if expires_at <= now:
+                    del self._cache[hash_value]
+                return None
+            self._cache.move_to_end(hash_value)
+            return data
+
+    def _remember(self, init_data: str, data: TelegramInitData, now: float) -> None:
+        if not self._cache_size:
+            return
+        with self._lock:
+            self._cache[data.hash] = (init_data, data, now + self._cache_ttl)
+            self._cache.move_to_end(data.hash)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+
+def _extract_hash(init_data: str) -> Optional[str]:
+    """Найти значение параметра hash без разбора остальной строки."""
+    for part in init_data.split('&'):
+        if part.startswith('hash='):
+            return part[5:]
+    return None
+
+
+def validate_telegram_init_data(init_data: str, bot_token: str) -> bool:
+    """Проверка подписи Telegram initData.
+
+    Args:
+        init_data: Строка с данными от Telegram
+        bot_token: Токен бота от Telegram
+
+    Returns:
+        True если подпись валидна
+    """
+    verifier = TelegramInitDataVerifier(bot_token, max_age_seconds=None, cache_size=0)
+    return verifier.verify(init_data) is not None
 
 
 def parse_telegram_user(init_data: str) -> Optional[Dict]:
     """Извлечение данных пользователя из initData.
-    
+
     Args:
         init_data: Строка с данными от Telegram
-        
+
     Returns:
         Словарь с данными пользователя или None
     """
-    try:
-        parsed_data = dict(parse_qsl(init_data))
-        user_data = parsed_data.get('user')
-        if not user_data:
-            return None
-        
-        # Парсим JSON данные пользователя
-        import json
-        user = json.loads(user_data)
-        return user
-    except Exception:
-        return None
+    data = parse_init_data(init_data)
+    return data.user if data else None
 
 
 def get_telegram_user_id(init_data: str) -> Optional[int]:
     """Получить Telegram ID пользователя из initData.
-    
+
     Args:
         init_data: Строка с данными от Telegram
-        
+
     Returns:
         Telegram ID пользователя или None
     """
-    user = parse_telegram_user(init_data)
-    if user:
-        return user.get('id')
-    return None
-
+    data = parse_init_data(init_data)
+    return data.user_id if data else None
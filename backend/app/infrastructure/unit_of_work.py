@@ -0,0 +1,45 @@
+"""Реализация единицы работы на SQLAlchemy."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..application.unit_of_work import UnitOfWork
+from .cache import CachedRepository, cached_tasks, cached_users
+from .database import DbSession
+from .repositories import ProductRepositoryImpl, ProductSetRepositoryImpl, TaskRepositoryImpl, UserRepositoryImpl
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """Единица работы поверх одной сессии SQLAlchemy.
+
+    Если кэш включён, репозитории обёрнуты кэшем, а затронутые ключи
+    сбрасываются после commit().
+    """
+
+    def __init__(self, db: DbSession):
+        self.db = db
+        self._is_async = isinstance(db, AsyncSession)
+        self.tasks = cached_tasks(TaskRepositoryImpl(db, autocommit=False), defer_invalidation=True)
+        self.users = cached_users(UserRepositoryImpl(db, autocommit=False), defer_invalidation=True)
+        self.products = ProductRepositoryImpl(db, autocommit=False)
+        self.product_sets = ProductSetRepositoryImpl(db, autocommit=False)
+
+    async def commit(self) -> None:
+        """Зафиксировать транзакцию."""
+        if self._is_async:
+            await self.db.commit()
+        else:
+            self.db.commit()
+        for repository in self._cached_repositories():
+            await repository.apply_invalidations()
+
+    async def rollback(self) -> None:
+        """Откатить транзакцию (после commit() ничего не делает)."""
+        if self._is_async:
+            await self.db.rollback()
+        else:
+            self.db.rollback()
+        for repository in self._cached_repositories():
+            repository.discard_invalidations()
+
+    def _cached_repositories(self):
+        return [repository for repository in (self.tasks, self.users) if isinstance(repository, CachedRepository)]
@@ -1,32 +1,52 @@
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from pathlib import Path
 
 # Вынесение конфигурации и роутов в отдельные модули облегчает тестирование и поддержку
 from .presentation.api import include_routes
 from .config.settings import get_settings
-from .infrastructure.database import Base, engine
+from .infrastructure.init_db import run_migrations
+from .infrastructure.middleware import CompressionMiddleware
+from .infrastructure.static_assets import get_asset_store
+from .presentation.middleware.read_your_writes import ReadYourWritesMiddleware
+from .presentation.responses import DEFAULT_RESPONSE_CLASS
 
 
 def create_app() -> FastAPI:
     """Фабрика приложения для упрощения тестирования и конфигурации."""
     settings = get_settings()
     
-    # Создание таблиц при старте приложения
-    Base.metadata.create_all(bind=engine)
+    # Применение миграций схемы при старте приложения
+    run_migrations()
     
     app = FastAPI(
         title="Store Todo Miniapp API",
         version=settings.app_version,
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=DEFAULT_RESPONSE_CLASS,
     )
     
-    # Подключение статических файлов для фронтенда
-    frontend_path = Path(__file__).parent.parent.parent / "frontend"
-    if frontend_path.exists():
-        app.mount("/static", StaticFiles(directory=str(frontend_path)), name="static")
+    # Фронтенд загружается в память и сжимается один раз при старте,
+    # а не читается с диска на каждый запрос (см. routes/static.py)
+    get_asset_store()
     
+    # При чтении с реплики клиент после записи временно читает из основной БД
+    if settings.database_read_url:
+        app.add_middleware(ReadYourWritesMiddleware, max_age=settings.read_your_writes_seconds)
+
+    # Списки задач и index.html уходят на телефоны по мобильной сети
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+            content_types=[
+                content_type.strip()
+                for content_type in settings.compression_content_types.split(",")
+                if content_type.strip()
+            ],
+        )
+
     include_routes(app)
     return app
 
@@ -2,7 +2,11 @@ from fastapi import FastAPI
 from fastapi.routing import APIRouter
 
 # Разделение API по модулям позволяет масштабировать проект без смешения слоёв
+from .routes.auth import router as auth_router
 from .routes.health import router as health_router
+from .routes.metrics import router as metrics_router
+from .routes.product_sets import router as product_sets_router
+from .routes.products import router as products_router
 from .routes.tasks import router as tasks_router
 from .routes.users import router as users_router
 from .routes.static import router as static_router
@@ -16,8 +20,12 @@ def include_routes(app: FastAPI) -> None:
     # API роуты
     api_v1 = APIRouter(prefix="/api/v1")
     api_v1.include_router(health_router)
+    api_v1.include_router(metrics_router)
+    api_v1.include_router(auth_router)
     api_v1.include_router(tasks_router)
     api_v1.include_router(users_router)
+    api_v1.include_router(products_router)
+    api_v1.include_router(product_sets_router)
     app.include_router(api_v1)
 
 
@@ -0,0 +1,62 @@
+"""ETag и условные GET-запросы (If-None-Match)."""
+
+import hashlib
+from typing import Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from ..application.versions import EntityVersion
+from ..config.settings import get_settings
+
+# Клиент хранит ответ, но перед использованием сверяет ETag с сервером
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(versions: Iterable[EntityVersion], next_cursor: Optional[str] = None) -> str:
+    """Слабый ETag по ID и updated_at сущностей (и курсору следующей страницы).
+
+    Тег описывает версии данных, а не байты ответа, поэтому он слабый:
+    сжатый и несжатый ответы, а также ответ 304 несут один и тот же тег.
+    Версия приложения входит в хэш: при изменении формата ответа
+    старые ETag перестают совпадать.
+    """
+    digest = hashlib.sha256(get_settings().app_version.encode())
+    for version in versions:
+        digest.update(f"\n{version.id}:{version.updated_at.isoformat()}".encode())
+    digest.update(f"\n{next_cursor or ''}".encode())
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def wants_revalidation(request: Request) -> bool:
+    """Прислал ли клиент ETag для проверки."""
+    return "if-none-match" in request.headers
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Совпадает ли ETag с одним из переданных в If-None-Match.
+
+    Для If-None-Match используется слабое сравнение (RFC 9110): префикс W/
+    не учитывается ни у одного из тегов.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    candidates = (candidate.strip() for candidate in header.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    """Ответ 304 без тела."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Добавить ETag к ответу."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -0,0 +1,163 @@
+"""Файлы инвентаризации: потоковый разбор пересчёта и отчёт о расхождениях."""
+
+import codecs
+import csv
+import json
+import tempfile
+from typing import AsyncIterable, AsyncIterator, Optional
+
+from fastapi.responses import StreamingResponse
+
+from ..application.use_cases.inventory_use_cases import Discrepancy, InventoryCount, InventorySummary
+
+CSV = "text/csv"
+NDJSON = "application/x-ndjson"
+# Типы тела запроса и формат, в котором оно разбирается
+UPLOAD_FORMATS = {CSV: CSV, NDJSON: NDJSON, "application/jsonl": NDJSON}
+
+# Строка пересчёта — штрих-код и число; длиннее только ошибочный файл,
+# и ограничение не даёт ему занять память целиком
+MAX_LINE_LENGTH = 4096
+# Отчёт держится в памяти, пока не превысит этот размер, затем уходит во временный файл
+REPORT_MEMORY_SIZE = 1024 * 1024
+REPORT_CHUNK_SIZE = 64 * 1024
+REPORT_COLUMNS = ("line", "key", "product_id", "name", "expected", "counted", "difference")
+# Названия первого столбца, по которым первая строка CSV признаётся заголовком
+HEADER_KEYS = frozenset({"id", "product_id", "barcode", "ean", "штрих-код", "штрихкод", "код", "товар", "артикул"})
+
+
+def upload_format(content_type: str) -> Optional[str]:
+    """Формат пересчёта по Content-Type (None — не поддерживается)."""
+    return UPLOAD_FORMATS.get(content_type.split(";", 1)[0].strip().lower())
+
+
+async def parse_counts(chunks: AsyncIterable[bytes], upload: str) -> AsyncIterator[InventoryCount]:
+    """Строки пересчёта из тела запроса по мере его получения.
+
+    CSV: «ID или штрих-код, остаток», разделитель — запятая или точка
+    с запятой. Первая строка пропускается как заголовок, если в ней
+    нечисловой остаток и известное название столбца (см. HEADER_KEYS).
+    NDJSON: объекты {"product_id" или "barcode": ..., "quantity": ...}.
+    """
+    line_number = 0
+    delimiter = None
+    async for line in _lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        if upload == NDJSON:
+            yield _ndjson_line(line, line_number)
+        elif delimiter is None:
+            # Разделитель и наличие заголовка определяются по первой строке
+            delimiter = ";" if line.count(";") > line.count(",") else ","
+            count = _csv_line(line, line_number, delimiter, header=True)
+            if count is not None:
+                yield count
+        else:
+            yield _csv_line(line, line_number, delimiter)
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Строки текста UTF-8 (в том числе с BOM из Excel) из потока байтов."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        try:
+            buffer += decoder.decode(chunk)
+        except UnicodeDecodeError:
+            raise ValueError("Файл пересчёта должен быть в кодировке UTF-8")
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        if len(buffer) > MAX_LINE_LENGTH:
+            raise ValueError("Слишком длинная строка в файле пересчёта")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+def _csv_line(line: str, line_number: int, delimiter: str, header: bool = False) -> Optional[InventoryCount]:
+    """Строка CSV; None — строка заголовка (только при header=True)."""
+    fields = next(csv.reader([line], delimiter=delimiter))
+    if len(fields) < 2 or not fields[0].strip():
+        raise ValueError(f"Строка {line_number}: ожидается «ID или штрих-код{delimiter} остаток»")
+    counted = fields[1].strip()
+    if not counted.lstrip("-").isdecimal():
+        # Ошибочная первая строка данных («4601234567890;7 шт») заголовком не считается
+        if header and fields[0].strip().lower() in HEADER_KEYS:
+            return None
+        raise ValueError(f"Строка {line_number}: некорректный остаток")
+    return InventoryCount(line=line_number, key=fields[0].strip(), counted=int(counted))
+
+
+def _ndjson_line(line: str, line_number: int) -> InventoryCount:
+    """Строка NDJSON."""
+    try:
+        item = json.loads(line)
+    except ValueError:
+        raise ValueError(f"Строка {line_number}: некорректный JSON")
+    if not isinstance(item, dict):
+        raise ValueError(f"Строка {line_number}: ожидается объект")
+    key = item.get("product_id") or item.get("barcode")
+    counted = item.get("quantity")
+    if not isinstance(key, str) or not key:
+        raise ValueError(f"Строка {line_number}: не указан product_id или barcode")
+    if not isinstance(counted, int) or isinstance(counted, bool):
+        raise ValueError(f"Строка {line_number}: некорректный остаток")
+    return InventoryCount(line=line_number, key=key, counted=counted)
+
+
+class DiscrepancyReport:
+    """Отчёт о расхождениях в CSV, накапливаемый во временном файле.
+
+    Небольшой отчёт остаётся в памяти, большой уходит на диск, поэтому
+    память не зависит от числа расхождений. Файл закрывается, когда
+    ответ отправлен целиком, или вызовом close().
+    """
+
+    def __init__(self):
+        self._file = tempfile.SpooledTemporaryFile(
+            max_size=REPORT_MEMORY_SIZE, mode="w+", encoding="utf-8", newline=""
+        )
+        # BOM: Excel иначе открывает кириллицу в CSV не в той кодировке
+        self._file.write("\ufeff")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(REPORT_COLUMNS)
+
+    def write(self, discrepancy: Discrepancy) -> None:
+        """Добавить расхождение в отчёт."""
+        self._writer.writerow(
+            (
+                discrepancy.line,
+                discrepancy.key,
+                discrepancy.product_id or "",
+                discrepancy.name or "",
+                "" if discrepancy.expected is None else discrepancy.expected,
+                discrepancy.counted,
+                "" if discrepancy.difference is None else discrepancy.difference,
+            )
+        )
+
+    def close(self) -> None:
+        """Удалить временный файл отчёта."""
+        self._file.close()
+
+    def response(self, summary: InventorySummary) -> StreamingResponse:
+        """Ответ с отчётом; итоги — в заголовках X-Inventory-*."""
+        headers = {
+            "Content-Disposition": 'attachment; filename="inventory-discrepancies.csv"',
+            "X-Inventory-Rows": str(summary.rows),
+            "X-Inventory-Matched": str(summary.matched),
+            "X-Inventory-Corrected": str(summary.corrected),
+            "X-Inventory-Unknown": str(summary.unknown),
+        }
+        return StreamingResponse(self._stream(), media_type=f"{CSV}; charset=utf-8", headers=headers)
+
+    async def _stream(self) -> AsyncIterator[bytes]:
+        """Содержимое отчёта частями."""
+        try:
+            self._file.seek(0)
+            while chunk := self._file.read(REPORT_CHUNK_SIZE):
+                yield chunk.encode("utf-8")
+        finally:
+            self.close()
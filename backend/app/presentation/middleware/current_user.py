@@ -0,0 +1,17 @@
+"""Поиск текущего пользователя приложения."""
+
+from typing import Optional
+
+from ...domain.user import User
+from ...infrastructure.cache import cached_users
+from ...infrastructure.database import SessionRouter
+from ...infrastructure.repositories import UserRepositoryImpl
+
+
+async def resolve_user(telegram_id: int, router: SessionRouter) -> Optional[User]:
+    """Найти пользователя по Telegram ID: в кэше чтений (см. CACHE_BACKEND), затем в БД.
+
+    Запросы с токеном сессии в этом не нуждаются: ID и проект
+    пользователя уже заверены токеном (см. get_session_claims).
+    """
+    return await cached_users(UserRepositoryImpl(router.reader)).get_by_telegram_id(telegram_id)
@@ -0,0 +1,71 @@
+"""Middleware «чтение своих записей» и зависимости сессий БД запроса."""
+
+from typing import AsyncIterator
+
+from fastapi import Depends, Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...infrastructure.database import DbSession, SessionRouter, create_session_router
+
+# Cookie, по которой клиент после записи читает из основной БД
+READ_YOUR_WRITES_COOKIE = "db_primary"
+
+
+class ReadYourWritesMiddleware:
+    """Закрепляет чтения клиента за основной БД на несколько секунд после записи.
+
+    Реплика отстаёт от основной БД, поэтому после записи клиенту выдаётся
+    короткоживущая cookie; пока она есть, get_session_router отдаёт для
+    чтения сессию основной БД.
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 5):
+        self.app = app
+        self.max_age = max_age
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Общий словарь состояния: в него пишет request.state.db_wrote
+        state = scope.setdefault("state", {})
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.get("db_wrote"):
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{READ_YOUR_WRITES_COOKIE}=1; Max-Age={self.max_age}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+async def get_session_router(request: Request) -> AsyncIterator[SessionRouter]:
+    """Получить маршрутизатор сессий текущего запроса.
+
+    Запись в запросе отмечается в request.state для ReadYourWritesMiddleware,
+    а cookie от предыдущей записи закрепляет чтение за основной БД.
+    """
+
+    def remember_write() -> None:
+        request.state.db_wrote = True
+
+    router = create_session_router(sticky=READ_YOUR_WRITES_COOKIE in request.cookies, on_write=remember_write)
+    try:
+        yield router
+    finally:
+        await router.close()
+
+
+async def get_session(router: SessionRouter = Depends(get_session_router)) -> DbSession:
+    """Получить сессию основной БД в режиме, выбранном в настройках."""
+    return router.writer
+
+
+async def get_read_session(router: SessionRouter = Depends(get_session_router)) -> DbSession:
+    """Получить сессию для чтения."""
+    return router.reader
@@ -1,18 +1,91 @@
 """Middleware для авторизации через Telegram."""
 
+from functools import lru_cache
 from typing import Optional
 from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from ...infrastructure.telegram_auth import validate_telegram_init_data, get_telegram_user_id
+from ...infrastructure.session_tokens import SessionClaims, get_session_token_signer
+from ...infrastructure.telegram_auth import TelegramInitData, TelegramInitDataVerifier, parse_init_data
 from ...config.settings import get_settings
 
 
 security = HTTPBearer()
 
 
+@lru_cache(maxsize=1)
+def get_init_data_verifier() -> Optional[TelegramInitDataVerifier]:
+    """Проверяющий initData процесса (None, если токен бота не задан)."""
+    settings = get_settings()
+    bot_token = getattr(settings, 'telegram_bot_token', None)
+    if not bot_token:
+        return None
+    return TelegramInitDataVerifier(
+        bot_token,
+        max_age_seconds=settings.telegram_auth_max_age_seconds,
+        cache_size=settings.telegram_auth_cache_size,
+        cache_ttl_seconds=settings.telegram_auth_cache_ttl_seconds,
+    )
+
+
+def get_init_data(request: Request) -> Optional[TelegramInitData]:
+    """Получить проверенные данные initData из запроса.
+
+    Строка разбирается и проверяется один раз за запрос, результат
+    сохраняется в request.state для остальных зависимостей.
+
+    Args:
+        request: HTTP запрос
+
+    Returns:
+        Данные initData или None
+    """
+    if hasattr(request.state, 'telegram_init_data'):
+        return request.state.telegram_init_data
+
+    # Получаем initData из заголовков
+    init_data = request.headers.get('X-Telegram-Init-Data')
+    data = None
+    if init_data:
+        # В разработке пропускаем проверку подписи,
+        # в продакшене нужен bot_token
+        if get_settings().env == "development":
+            data = parse_init_data(init_data)
+        else:
+            verifier = get_init_data_verifier()
+            data = verifier.verify(init_data) if verifier else None
+
+    request.state.telegram_init_data = data
+    return data
+
+
+def get_session_claims(request: Request) -> Optional[SessionClaims]:
+    """Получить данные токена сессии из заголовка Authorization: Bearer.
+
+    Args:
+        request: HTTP запрос
+
+    Returns:
+        Данные токена или None, если токена нет или он недействителен
+    """
+    if hasattr(request.state, 'session_claims'):
+        return request.state.session_claims
+
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    signer = get_session_token_signer()
+    claims = None
+    if scheme.lower() == 'bearer' and token and signer:
+        claims = signer.verify(token.strip())
+
+    request.state.session_claims = claims
+    return claims
+
+
 async def get_current_user(request: Request) -> Optional[int]:
     """Получить текущего пользователя из запроса.
+
+    Принимается токен сессии (Authorization: Bearer) или initData
+    (X-Telegram-Init-Data). Токен проверяется без разбора JSON и БД.
     
     Args:
         request: HTTP запрос
@@ -20,29 +93,11 @@ async def get_current_user(request: Request) -> Optional[int]:
     Returns:
         Telegram ID пользователя или None
     """
-    # Получаем initData из заголовков
-    init_data = request.headers.get('X-Telegram-Init-Data')
-    if not init_data:
-        return None
-    
-    # Получаем настройки
-    settings = get_settings()
-    
-    # Проверяем подпись (для продакшена нужен bot_token)
-    # В разработке пропускаем проверку
-    if settings.env == "development":
-        telegram_id = get_telegram_user_id(init_data)
-        return telegram_id
-    else:
-        # В продакшене проверяем подпись
-        bot_token = getattr(settings, 'telegram_bot_token', None)
-        if not bot_token:
-            return None
-        
-        if validate_telegram_init_data(init_data, bot_token):
-            return get_telegram_user_id(init_data)
-    
-    return None
+    claims = get_session_claims(request)
+    if claims:
+        return claims.telegram_id
+    data = get_init_data(request)
+    return data.user_id if data else None
 
 
 async def require_auth(request: Request) -> int:
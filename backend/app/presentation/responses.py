@@ -0,0 +1,85 @@
+"""Отдача JSON-ответов: обычный и быстрый режимы.
+
+В обычном режиме роут возвращает схему Pydantic, и FastAPI ещё раз
+проверяет её по response_model перед кодированием. В быстром режиме
+(FAST_JSON=true) поля ответа собираются из доменных сущностей, которым
+мы доверяем, и сразу кодируются orjson, минуя обе проверки. Схемы
+остаются в объявлении роутов и описывают ответ в OpenAPI.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable, Optional, Type
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
+
+from ..config.settings import get_settings
+
+try:
+    import orjson
+except ImportError:  # orjson — необязательная зависимость быстрого режима
+    orjson = None
+
+
+def _json_default(value: Any):
+    """Типы, которые стандартный json не кодирует сам."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Тип {type(value).__name__} не сериализуется в JSON")
+
+
+class StdlibFastJSONResponse(JSONResponse):
+    """Быстрый режим без orjson: словарь кодируется json без jsonable_encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+FAST_JSON = get_settings().fast_json
+
+# Класс ответа по умолчанию для приложения
+FastJSONResponse = ORJSONResponse if orjson is not None else StdlibFastJSONResponse
+DEFAULT_RESPONSE_CLASS = FastJSONResponse if FAST_JSON else JSONResponse
+
+
+def render(
+    model: Type[BaseModel],
+    payload: dict,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+):
+    """Ответ по словарю с полями схемы model.
+
+    Args:
+        model: Схема ответа
+        payload: Поля ответа (вложенные схемы — тоже словарями)
+        response: Response из параметров роута, если роут задавал заголовки
+        status_code: Код ответа в быстром режиме (в обычном его задаёт декоратор роута)
+    """
+    if not FAST_JSON:
+        return model(**payload)
+    return _fast_response(payload, response, status_code)
+
+
+def render_many(
+    model: Type[BaseModel],
+    payloads: Iterable[dict],
+    response: Optional[Response] = None,
+    status_code: int = 200,
+):
+    """Ответ-список по словарям с полями схемы model."""
+    if not FAST_JSON:
+        return [model(**payload) for payload in payloads]
+    return _fast_response(list(payloads), response, status_code)
+
+
+def _fast_response(content: Any, response: Optional[Response], status_code: int) -> Response:
+    # Заголовки, выставленные через параметр response, FastAPI к
+    # возвращённому Response не добавляет — переносим их сами
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
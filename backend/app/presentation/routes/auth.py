@@ -0,0 +1,43 @@
+"""Роуты авторизации."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from ...infrastructure.database import SessionRouter
+from ...infrastructure.session_tokens import get_session_token_signer
+from ..middleware.current_user import resolve_user
+from ..middleware.read_your_writes import get_session_router
+from ..middleware.telegram_auth import get_init_data
+from ..schemas import SessionTokenResponse
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+
+@router.post("/session", response_model=SessionTokenResponse)
+async def create_session(request: Request, sessions: SessionRouter = Depends(get_session_router)):
+    """Обменять проверенный initData на короткоживущий токен сессии.
+
+    Дальше клиент передаёт токен в заголовке Authorization: Bearer
+    вместо initData в каждом запросе.
+    """
+    signer = get_session_token_signer()
+    if signer is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Токены сессии не настроены: задайте SESSION_TOKEN_SECRET или TELEGRAM_BOT_TOKEN"
+        )
+
+    init_data = get_init_data(request)
+    if not init_data or not init_data.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Требуется авторизация через Telegram"
+        )
+
+    user = await resolve_user(init_data.user_id, sessions)
+    if not user or not user.is_active:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Пользователь не найден")
+
+    token, claims = signer.issue(user)
+    return SessionTokenResponse(access_token=token, expires_at=datetime.utcfromtimestamp(claims.expires_at))
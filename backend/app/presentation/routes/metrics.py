@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ...infrastructure.metrics import CONTENT_TYPE_LATEST, REGISTRY
+
+# Метрики для Prometheus, как и healthcheck, не требуют авторизации
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Метрики приложения (в том числе пула соединений) в формате Prometheus."""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,72 @@
+"""Роуты для работы с комплектами товаров."""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from ...application.repositories import ProductRepository, ProductSetRepository
+from ...application.use_cases.product_use_cases import CreateProductSetUseCase, GetProductSetUseCase
+from ...infrastructure.database import DbSession
+from ...infrastructure.repositories import ProductSetRepositoryImpl
+from ..middleware.read_your_writes import get_read_session, get_session
+from ..middleware.telegram_auth import require_auth
+from ..responses import render
+from ..schemas import ProductSetCreate, ProductSetResponse
+from .products import get_product_repository
+
+router = APIRouter(prefix="/product-sets", tags=["product-sets"])
+
+
+async def get_product_set_repository(db: DbSession = Depends(get_session)) -> ProductSetRepository:
+    """Получить репозиторий комплектов товаров."""
+    return ProductSetRepositoryImpl(db)
+
+
+async def get_read_product_set_repository(db: DbSession = Depends(get_read_session)) -> ProductSetRepository:
+    """Получить репозиторий комплектов товаров для запросов только на чтение."""
+    return ProductSetRepositoryImpl(db)
+
+
+@router.post("/", response_model=ProductSetResponse, status_code=status.HTTP_201_CREATED)
+async def create_product_set(
+    request: Request,
+    product_set_data: ProductSetCreate,
+    product_set_repo: ProductSetRepository = Depends(get_product_set_repository),
+    product_repo: ProductRepository = Depends(get_product_repository),
+):
+    """Создать комплект товаров, списываемый при выполнении задачи."""
+    await require_auth(request)
+    try:
+        product_set = await CreateProductSetUseCase(product_set_repo, product_repo).execute(
+            name=product_set_data.name,
+            products=product_set_data.products,
+            description=product_set_data.description,
+            project_id=product_set_data.project_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return render(ProductSetResponse, _product_set_fields(product_set), status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/{product_set_id}", response_model=ProductSetResponse)
+async def get_product_set(
+    product_set_id: str,
+    product_set_repo: ProductSetRepository = Depends(get_read_product_set_repository),
+):
+    """Получить комплект товаров по ID."""
+    product_set = await GetProductSetUseCase(product_set_repo).execute(product_set_id)
+    if not product_set:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Комплект не найден")
+    return render(ProductSetResponse, _product_set_fields(product_set))
+
+
+def _product_set_fields(product_set) -> dict:
+    """Поля схемы ответа ProductSetResponse для доменного комплекта."""
+    return {
+        "id": product_set.id,
+        "name": product_set.name,
+        "description": product_set.description,
+        "products": product_set.products,
+        "is_active": product_set.is_active,
+        "project_id": product_set.project_id,
+        "created_at": product_set.created_at,
+        "updated_at": product_set.updated_at,
+    }
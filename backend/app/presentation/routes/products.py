@@ -0,0 +1,218 @@
+"""Роуты для работы с товарами."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from ...application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from ...application.repositories import ProductRepository
+from ...application.use_cases.inventory_use_cases import ReconcileInventoryUseCase
+from ...application.use_cases.product_use_cases import (
+    DEFAULT_LOW_STOCK_THRESHOLD,
+    DEFAULT_SEARCH_PAGE_SIZE,
+    CreateProductUseCase,
+    GetProductUseCase,
+    ListProductsUseCase,
+    WriteOffProductUseCase,
+)
+from ...domain.value_objects import CategoryId, ProductId
+from ...infrastructure.database import DbSession
+from ...infrastructure.repositories import ProductRepositoryImpl
+from ...infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+from ..inventory import DiscrepancyReport, parse_counts, upload_format
+from ..middleware.read_your_writes import get_read_session, get_session
+from ..middleware.telegram_auth import require_auth
+from ..responses import render
+from ..schemas import ProductCreate, ProductListResponse, ProductResponse, ProductWriteOff
+from .tasks import get_unit_of_work
+
+router = APIRouter(prefix="/products", tags=["products"])
+
+
+async def get_product_repository(db: DbSession = Depends(get_session)) -> ProductRepository:
+    """Получить репозиторий товаров."""
+    return ProductRepositoryImpl(db)
+
+
+async def get_read_product_repository(db: DbSession = Depends(get_read_session)) -> ProductRepository:
+    """Получить репозиторий товаров для запросов только на чтение."""
+    return ProductRepositoryImpl(db)
+
+
+@router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
+async def create_product(
+    request: Request,
+    product_data: ProductCreate,
+    product_repo: ProductRepository = Depends(get_product_repository),
+):
+    """Создать товар."""
+    await require_auth(request)
+    try:
+        use_case = CreateProductUseCase(product_repo)
+        product = await use_case.execute(
+            name=product_data.name,
+            quantity=product_data.quantity,
+            description=product_data.description,
+            category_id=CategoryId(value=product_data.category_id) if product_data.category_id else None,
+            photo_url=product_data.photo_url,
+            barcode=product_data.barcode,
+            project_id=product_data.project_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return render(ProductResponse, _product_fields(product), status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/{product_id}/write-off", response_model=ProductResponse)
+async def write_off_product(
+    request: Request,
+    product_id: str,
+    write_off: ProductWriteOff,
+    product_repo: ProductRepository = Depends(get_product_repository),
+):
+    """Списать товар со склада (атомарно, без потери одновременных списаний)."""
+    await require_auth(request)
+    try:
+        product = await WriteOffProductUseCase(product_repo).execute(ProductId(value=product_id), write_off.amount)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return render(ProductResponse, _product_fields(product))
+
+
+@router.post("/inventory", response_class=StreamingResponse)
+async def reconcile_inventory(
+    request: Request,
+    project_id: Optional[str] = None,
+    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+):
+    """Инвентаризация: сверить пересчёт (CSV или NDJSON в теле запроса) и исправить остатки.
+
+    Тело читается потоком, остатки исправляются одной транзакцией. В ответе —
+    CSV с расхождениями (недостачи, излишки, ненайденные товары).
+    """
+    await require_auth(request)
+    upload = upload_format(request.headers.get("content-type", ""))
+    if upload is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Пересчёт принимается в формате text/csv или application/x-ndjson",
+        )
+    report = DiscrepancyReport()
+    try:
+        summary = await ReconcileInventoryUseCase(uow).execute(
+            parse_counts(request.stream(), upload), report.write, project_id
+        )
+    except ValueError as e:
+        report.close()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return report.response(summary)
+
+
+@router.get("/", response_model=ProductListResponse)
+async def list_products(
+    project_id: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    product_repo: ProductRepository = Depends(get_read_product_repository),
+):
+    """Получить страницу списка товаров проекта (в порядке добавления)."""
+    try:
+        page = await ListProductsUseCase(product_repo).execute(project_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return render(ProductListResponse, _page_payload(page))
+
+
+@router.get("/low-stock", response_model=ProductListResponse)
+async def list_low_stock(
+    project_id: Optional[str] = None,
+    threshold: int = Query(DEFAULT_LOW_STOCK_THRESHOLD, ge=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    product_repo: ProductRepository = Depends(get_read_product_repository),
+):
+    """Получить страницу заканчивающихся товаров (остаток от 1 до threshold)."""
+    try:
+        page = await ListProductsUseCase(product_repo).low_stock(project_id, threshold, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return render(ProductListResponse, _page_payload(page))
+
+
+@router.get("/out-of-stock", response_model=ProductListResponse)
+async def list_out_of_stock(
+    project_id: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    product_repo: ProductRepository = Depends(get_read_product_repository),
+):
+    """Получить страницу товаров, которых нет в наличии."""
+    try:
+        page = await ListProductsUseCase(product_repo).out_of_stock(project_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return render(ProductListResponse, _page_payload(page))
+
+
+@router.get("/search", response_model=ProductListResponse)
+async def search_products(
+    q: str = Query(..., min_length=1, max_length=100, description="Поисковый запрос"),
+    project_id: Optional[str] = None,
+    limit: int = Query(DEFAULT_SEARCH_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    product_repo: ProductRepository = Depends(get_read_product_repository),
+):
+    """Быстрый поиск товаров по названию и описанию (последнее слово — по началу)."""
+    try:
+        page = await ListProductsUseCase(product_repo).search(q, project_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return render(ProductListResponse, _page_payload(page))
+
+
+@router.get("/barcode/{barcode}", response_model=ProductResponse)
+async def get_product_by_barcode(
+    barcode: str,
+    project_id: Optional[str] = None,
+    product_repo: ProductRepository = Depends(get_read_product_repository),
+):
+    """Найти товар проекта по штрих-коду (сканирование на кассе)."""
+    product = await GetProductUseCase(product_repo).execute_by_barcode(barcode, project_id)
+    if not product:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Товар не найден")
+    return render(ProductResponse, _product_fields(product))
+
+
+@router.get("/{product_id}", response_model=ProductResponse)
+async def get_product(
+    product_id: str,
+    product_repo: ProductRepository = Depends(get_read_product_repository),
+):
+    """Получить товар по ID."""
+    product = await GetProductUseCase(product_repo).execute(ProductId(value=product_id))
+    if not product:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Товар не найден")
+    return render(ProductResponse, _product_fields(product))
+
+
+def _product_fields(product) -> dict:
+    """Поля схемы ответа ProductResponse для доменного товара."""
+    return {
+        "id": product.id.value,
+        "name": product.name,
+        "description": product.description,
+        "quantity": product.quantity.value,
+        "category_id": product.category_id.value if product.category_id else None,
+        "photo_url": product.photo_url.value if product.photo_url else None,
+        "barcode": product.barcode.value if product.barcode else None,
+        "status": product.status,
+        "project_id": product.project_id,
+        "created_at": product.created_at,
+        "updated_at": product.updated_at,
+    }
+
+
+def _page_payload(page: Page) -> dict:
+    """Поля схемы ответа ProductListResponse для страницы товаров."""
+    return {"products": [_product_fields(product) for product in page.items], "next_cursor": page.next_cursor}
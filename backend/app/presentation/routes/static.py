@@ -1,17 +1,42 @@
-"""Роут для отдачи статического HTML."""
+"""Роуты для отдачи фронтенда из памяти процесса."""
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
-from pathlib import Path
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from ...infrastructure.static_assets import INDEX_FILE, StaticAsset, get_asset_store
+from ..etag import is_not_modified
 
 router = APIRouter()
 
+# Адрес с хэшем меняется вместе с содержимым: хранить можно сколько угодно
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Точку входа и адреса без хэша клиент сверяет по ETag при каждом открытии
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
 
 @router.get("/")
-async def index():
-    """Главная страница Mini App."""
-    frontend_path = Path(__file__).parent.parent.parent.parent / "frontend" / "index.html"
-    if frontend_path.exists():
-        return FileResponse(str(frontend_path))
-    return {"message": "Frontend not found"}
+async def index(request: Request):
+    """Главная страница Mini App (с поддержкой If-None-Match)."""
+    asset = get_asset_store().get(INDEX_FILE)
+    if asset is None:
+        return {"message": "Frontend not found"}
+    return _asset_response(request, asset, REVALIDATE_CACHE_CONTROL)
+
+
+@router.api_route("/static/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def static_asset(path: str, request: Request) -> Response:
+    """Файл фронтенда по обычному адресу или адресу с хэшем."""
+    asset, hashed = get_asset_store().lookup(path)
+    if asset is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return _asset_response(request, asset, IMMUTABLE_CACHE_CONTROL if hashed else REVALIDATE_CACHE_CONTROL)
+
 
+def _asset_response(request: Request, asset: StaticAsset, cache_control: str) -> Response:
+    """Заранее сжатый вариант файла или 304, если у клиента он уже есть."""
+    encoding, body, etag = asset.select(request.headers.get("accept-encoding", ""))
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type=asset.content_type, headers=headers)
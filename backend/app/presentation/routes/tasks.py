@@ -2,126 +2,236 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
+from ...application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ...application.queries import TaskQueries
+from ...application.repositories import ProductSetRepository, TaskRepository, UserRepository
 from ...application.use_cases.task_use_cases import (
     CompleteTaskUseCase,
+    CreateTasksBatchUseCase,
     CreateTaskUseCase,
     GetTaskUseCase,
     ListTasksUseCase,
+    NewTask,
 )
+from ...application.versions import EntityVersion
 from ...domain.enums import TaskPriority
 from ...domain.value_objects import CategoryId, TaskId, UserId
-from ...infrastructure.database import get_db
-from ...infrastructure.repositories import TaskRepositoryImpl, UserRepositoryImpl
-from ..middleware.telegram_auth import require_auth
-from ..schemas import TaskComplete, TaskCreate, TaskResponse
+from ...infrastructure.cache import cached_tasks, cached_users
+from ...infrastructure.database import DbSession, SessionRouter
+from ...infrastructure.queries import TaskQueriesImpl
+from ...infrastructure.repositories import ProductSetRepositoryImpl, TaskRepositoryImpl, UserRepositoryImpl
+from ...infrastructure.session_tokens import SessionClaims
+from ...infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+from ..etag import is_not_modified, make_etag, not_modified, set_etag, wants_revalidation
+from ..middleware.current_user import resolve_user
+from ..middleware.read_your_writes import get_read_session, get_session, get_session_router
+from ..middleware.telegram_auth import get_session_claims, require_auth
+from ..responses import render, render_many
+from ..schemas import TaskBatchCreate, TaskComplete, TaskCreate, TaskListResponse, TaskResponse
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
-async def get_task_repository(db: Session = Depends(get_db)) -> TaskRepositoryImpl:
+async def get_task_repository(db: DbSession = Depends(get_session)) -> TaskRepository:
     """Получить репозиторий задач."""
-    return TaskRepositoryImpl(db)
+    return cached_tasks(TaskRepositoryImpl(db))
 
 
-async def get_user_repository(db: Session = Depends(get_db)) -> UserRepositoryImpl:
+async def get_read_task_repository(db: DbSession = Depends(get_read_session)) -> TaskRepository:
+    """Получить репозиторий задач для запросов только на чтение."""
+    return cached_tasks(TaskRepositoryImpl(db))
+
+
+async def get_read_task_queries(db: DbSession = Depends(get_read_session)) -> TaskQueries:
+    """Получить запросы чтения задач для списков."""
+    return TaskQueriesImpl(db)
+
+
+async def get_user_repository(db: DbSession = Depends(get_session)) -> UserRepository:
     """Получить репозиторий пользователей."""
-    return UserRepositoryImpl(db)
+    return cached_users(UserRepositoryImpl(db))
+
+
+async def get_product_set_repository(db: DbSession = Depends(get_session)) -> ProductSetRepository:
+    """Получить репозиторий комплектов товаров."""
+    return ProductSetRepositoryImpl(db)
+
+
+async def get_unit_of_work(db: DbSession = Depends(get_session)) -> SqlAlchemyUnitOfWork:
+    """Получить единицу работы для use cases, пишущих в несколько репозиториев."""
+    return SqlAlchemyUnitOfWork(db)
 
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     request: Request,
     task_data: TaskCreate,
-    task_repo: TaskRepositoryImpl = Depends(get_task_repository),
-    user_repo: UserRepositoryImpl = Depends(get_user_repository),
+    task_repo: TaskRepository = Depends(get_task_repository),
+    user_repo: UserRepository = Depends(get_user_repository),
+    product_set_repo: ProductSetRepository = Depends(get_product_set_repository),
+    claims: Optional[SessionClaims] = Depends(get_session_claims),
+    sessions: SessionRouter = Depends(get_session_router),
 ):
-    """Создать новую задачу."""
+    """Создать новую задачу в проекте создателя."""
     try:
         # Получаем Telegram ID из авторизации
         telegram_id = await require_auth(request)
         creator_id = UserId(value=str(telegram_id))
+        # Токен сессии уже заверяет создателя и его проект, в БД за ними не ходим
+        creator = None if claims else await resolve_user(telegram_id, sessions)
 
-        use_case = CreateTaskUseCase(task_repo, user_repo)
+        use_case = CreateTaskUseCase(task_repo, user_repo, product_set_repo)
         task = await use_case.execute(
             title=task_data.title,
             creator_id=creator_id,
             description=task_data.description,
-            priority=task_data.priority,
+            priority=TaskPriority(task_data.priority),
             category_id=CategoryId(value=task_data.category_id) if task_data.category_id else None,
             assignee_id=UserId(value=task_data.assignee_id) if task_data.assignee_id else None,
             deadline=None,  # TODO: Добавить поддержку deadline
+            project_id=claims.project_id if claims else None,
+            product_set_id=task_data.product_set_id,
+            creator=creator,
+            creator_verified=claims is not None,
+        )
+        return render(TaskResponse, _task_fields(task), status_code=status.HTTP_201_CREATED)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/batch", response_model=List[TaskResponse], status_code=status.HTTP_201_CREATED)
+async def create_tasks_batch(
+    request: Request,
+    batch: TaskBatchCreate,
+    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    claims: Optional[SessionClaims] = Depends(get_session_claims),
+):
+    """Создать несколько задач одним запросом в проекте создателя."""
+    try:
+        telegram_id = await require_auth(request)
+        creator_id = UserId(value=str(telegram_id))
+
+        use_case = CreateTasksBatchUseCase(uow)
+        tasks = await use_case.execute(
+            creator_id=creator_id,
+            items=[
+                NewTask(
+                    title=item.title,
+                    description=item.description,
+                    priority=TaskPriority(item.priority),
+                    category_id=CategoryId(value=item.category_id) if item.category_id else None,
+                    assignee_id=UserId(value=item.assignee_id) if item.assignee_id else None,
+                    product_set_id=item.product_set_id,
+                )
+                for item in batch.tasks
+            ],
+            project_id=batch.project_id,
+            # Как и для одной задачи: проект из токена сессии, иначе — из профиля создателя
+            creator_project_id=claims.project_id if claims else None,
+            creator_verified=claims is not None,
         )
-        return _task_to_response(task)
+        return render_many(TaskResponse, (_task_fields(task) for task in tasks), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: str, task_repo: TaskRepositoryImpl = Depends(get_task_repository)):
-    """Получить задачу по ID."""
+async def get_task(
+    task_id: str,
+    request: Request,
+    response: Response,
+    task_repo: TaskRepository = Depends(get_read_task_repository),
+):
+    """Получить задачу по ID (с поддержкой If-None-Match)."""
     use_case = GetTaskUseCase(task_repo)
+    # Сначала сверяем только версию: при совпадении задачу не загружаем
+    if wants_revalidation(request):
+        version = await use_case.version(TaskId(value=task_id))
+        if version and is_not_modified(request, make_etag([version])):
+            return not_modified(make_etag([version]))
+
     task = await use_case.execute(TaskId(value=task_id))
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задача не найдена")
-    return _task_to_response(task)
+    set_etag(response, make_etag([EntityVersion.of(task)]))
+    return render(TaskResponse, _task_fields(task), response)
 
 
 @router.post("/{task_id}/complete", response_model=TaskResponse)
 async def complete_task(
     task_id: str,
     complete_data: TaskComplete,
-    task_repo: TaskRepositoryImpl = Depends(get_task_repository),
+    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
     """Отметить задачу как выполненную."""
     try:
-        use_case = CompleteTaskUseCase(task_repo)
+        use_case = CompleteTaskUseCase(uow)
         task = await use_case.execute(
             TaskId(value=task_id),
             comment=complete_data.comment,
             photos=complete_data.photos,
         )
-        return _task_to_response(task)
+        return render(TaskResponse, _task_fields(task))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=List[TaskResponse])
+@router.get("/", response_model=TaskListResponse)
 async def list_tasks(
+    request: Request,
+    response: Response,
     assignee_id: Optional[str] = None,
     creator_id: Optional[str] = None,
     project_id: Optional[str] = None,
-    task_repo: TaskRepositoryImpl = Depends(get_task_repository),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    task_repo: TaskRepository = Depends(get_read_task_repository),
+    task_queries: TaskQueries = Depends(get_read_task_queries),
 ):
-    """Получить список задач."""
-    use_case = ListTasksUseCase(task_repo)
-    tasks = await use_case.execute(
+    """Получить страницу списка задач (от новых к старым, с поддержкой If-None-Match)."""
+    use_case = ListTasksUseCase(task_repo, task_queries)
+    filters = dict(
         assignee_id=UserId(value=assignee_id) if assignee_id else None,
         creator_id=UserId(value=creator_id) if creator_id else None,
         project_id=project_id,
+        limit=limit,
+        cursor=cursor,
     )
-    return [_task_to_response(task) for task in tasks]
-
-
-def _task_to_response(task) -> TaskResponse:
-    """Преобразовать доменную задачу в схему ответа."""
-    return TaskResponse(
-        id=task.id.value,
-        title=task.title,
-        description=task.description,
-        priority=task.priority,
-        category_id=task.category_id.value if task.category_id else None,
-        assignee_id=task.assignee_id.value if task.assignee_id else None,
-        deadline=None,  # TODO: Добавить поддержку deadline
-        status=task.status,
-        creator_id=task.creator_id.value,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        completed_at=task.completed_at,
-        completion_photos=[photo.value for photo in task.completion_photos] if task.completion_photos else None,
-        completion_comment=task.completion_comment.value if task.completion_comment else None,
-        project_id=task.project_id,
-    )
-
+    try:
+        # Сначала сверяем только версии строк страницы
+        if wants_revalidation(request):
+            versions = await use_case.versions(**filters)
+            etag = make_etag(versions.items, versions.next_cursor)
+            if is_not_modified(request, etag):
+                return not_modified(etag)
+        # Строки read model уже имеют поля ответа: сущности не собираются
+        page = await use_case.rows(**filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_etag(response, make_etag([EntityVersion.of_row(row) for row in page.items], page.next_cursor))
+    payload = {"tasks": page.items, "next_cursor": page.next_cursor}
+    return render(TaskListResponse, payload, response)
+
+
+def _task_fields(task) -> dict:
+    """Поля схемы ответа TaskResponse для доменной задачи."""
+    return {
+        "id": task.id.value,
+        "title": task.title,
+        "description": task.description,
+        "priority": task.priority,
+        "category_id": task.category_id.value if task.category_id else None,
+        "assignee_id": task.assignee_id.value if task.assignee_id else None,
+        "deadline": None,  # TODO: Добавить поддержку deadline
+        "status": task.status,
+        "creator_id": task.creator_id.value,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+        "completed_at": task.completed_at,
+        "completion_photos": [photo.value for photo in task.completion_photos] if task.completion_photos else None,
+        "completion_comment": task.completion_comment.value if task.completion_comment else None,
+        "project_id": task.project_id,
+        "product_set_id": task.product_set_id,
+    }
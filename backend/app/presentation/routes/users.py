@@ -1,37 +1,56 @@
 """Роуты для работы с пользователями."""
 
-from typing import List, Optional
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
+from ...application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ...application.repositories import UserRepository
 from ...application.use_cases.user_use_cases import CreateUserUseCase, GetUserUseCase, ListUsersUseCase
+from ...application.versions import EntityVersion
 from ...domain.enums import UserRole
 from ...domain.value_objects import UserId
-from ...infrastructure.database import get_db
+from ...infrastructure.cache import cached_users
+from ...infrastructure.database import DbSession, SessionRouter
 from ...infrastructure.repositories import UserRepositoryImpl
-from ..middleware.telegram_auth import get_current_user, require_auth
-from ..schemas import UserCreate, UserResponse
+from ...infrastructure.session_tokens import SessionClaims
+from ..etag import is_not_modified, make_etag, not_modified, set_etag, wants_revalidation
+from ..middleware.current_user import resolve_user
+from ..middleware.read_your_writes import get_read_session, get_session, get_session_router
+from ..middleware.telegram_auth import get_current_user, get_session_claims, require_auth
+from ..responses import render
+from ..schemas import UserCreate, UserListResponse, UserResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-async def get_user_repository(db: Session = Depends(get_db)) -> UserRepositoryImpl:
+async def get_user_repository(db: DbSession = Depends(get_session)) -> UserRepository:
     """Получить репозиторий пользователей."""
-    return UserRepositoryImpl(db)
+    return cached_users(UserRepositoryImpl(db))
+
+
+async def get_read_user_repository(db: DbSession = Depends(get_read_session)) -> UserRepository:
+    """Получить репозиторий пользователей для запросов только на чтение."""
+    return cached_users(UserRepositoryImpl(db))
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     request: Request,
     user_data: UserCreate,
-    user_repo: UserRepositoryImpl = Depends(get_user_repository),
+    user_repo: UserRepository = Depends(get_user_repository),
+    claims: Optional[SessionClaims] = Depends(get_session_claims),
+    sessions: SessionRouter = Depends(get_session_router),
 ):
     """Создать нового пользователя."""
     try:
         # Получаем Telegram ID из авторизации
         telegram_id = await require_auth(request)
-        
+        # Токен сессии выдаётся только зарегистрированным, иначе ищем в кэше
+        # и на реплике. Если реплика отстала, дубликат отсечёт уникальный индекс
+        if claims or await resolve_user(telegram_id, sessions):
+            raise ValueError("Пользователь с таким Telegram ID уже существует")
+
         # Используем данные из запроса или из авторизации
         use_case = CreateUserUseCase(user_repo)
         user = await use_case.execute(
@@ -40,57 +59,85 @@ async def create_user(
             full_name=user_data.full_name,
             role=user_data.role,
             project_id=user_data.project_id,
+            known_new=True,
         )
-        return _user_to_response(user)
+        return render(UserResponse, _user_fields(user), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: str, user_repo: UserRepositoryImpl = Depends(get_user_repository)):
-    """Получить пользователя по ID."""
+async def get_user(
+    user_id: str,
+    request: Request,
+    response: Response,
+    user_repo: UserRepository = Depends(get_read_user_repository),
+):
+    """Получить пользователя по ID (с поддержкой If-None-Match)."""
     use_case = GetUserUseCase(user_repo)
+    # Сначала сверяем только версию: при совпадении пользователя не загружаем
+    if wants_revalidation(request):
+        version = await use_case.version(UserId(value=user_id))
+        if version and is_not_modified(request, make_etag([version])):
+            return not_modified(make_etag([version]))
+
     user = await use_case.execute(UserId(value=user_id))
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Пользователь не найден")
-    return _user_to_response(user)
+    set_etag(response, make_etag([EntityVersion.of(user)]))
+    return render(UserResponse, _user_fields(user), response)
 
 
-@router.get("/", response_model=List[UserResponse])
+@router.get("/", response_model=UserListResponse)
 async def list_users(
+    request: Request,
+    response: Response,
     project_id: Optional[str] = None,
     active_only: bool = False,
-    user_repo: UserRepositoryImpl = Depends(get_user_repository),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    user_repo: UserRepository = Depends(get_read_user_repository),
 ):
-    """Получить список пользователей."""
+    """Получить страницу списка пользователей (с поддержкой If-None-Match)."""
     use_case = ListUsersUseCase(user_repo)
-    users = await use_case.execute(project_id=project_id, active_only=active_only)
-    return [_user_to_response(user) for user in users]
+    filters = dict(project_id=project_id, active_only=active_only, limit=limit, cursor=cursor)
+    try:
+        # Сначала сверяем только версии строк страницы
+        if wants_revalidation(request):
+            versions = await use_case.versions(**filters)
+            etag = make_etag(versions.items, versions.next_cursor)
+            if is_not_modified(request, etag):
+                return not_modified(etag)
+        page = await use_case.execute(**filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_etag(response, make_etag([EntityVersion.of(user) for user in page.items], page.next_cursor))
+    payload = {"users": [_user_fields(user) for user in page.items], "next_cursor": page.next_cursor}
+    return render(UserListResponse, payload, response)
 
 
 @router.get("/telegram/{telegram_id}", response_model=UserResponse)
 async def get_user_by_telegram_id(
-    telegram_id: int, user_repo: UserRepositoryImpl = Depends(get_user_repository)
+    telegram_id: int, user_repo: UserRepository = Depends(get_read_user_repository)
 ):
     """Получить пользователя по Telegram ID."""
     use_case = GetUserUseCase(user_repo)
     user = await use_case.execute_by_telegram_id(telegram_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Пользователь не найден")
-    return _user_to_response(user)
-
-
-def _user_to_response(user) -> UserResponse:
-    """Преобразовать доменного пользователя в схему ответа."""
-    return UserResponse(
-        id=user.id.value,
-        telegram_id=user.telegram_id,
-        username=user.username,
-        full_name=user.full_name,
-        role=user.role,
-        is_active=user.is_active,
-        project_id=user.project_id,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
-
+    return render(UserResponse, _user_fields(user))
+
+
+def _user_fields(user) -> dict:
+    """Поля схемы ответа UserResponse для доменного пользователя."""
+    return {
+        "id": user.id.value,
+        "telegram_id": user.telegram_id,
+        "username": user.username,
+        "full_name": user.full_name,
+        "role": user.role,
+        "is_active": user.is_active,
+        "project_id": user.project_id,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+    }
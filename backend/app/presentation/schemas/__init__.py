@@ -1,10 +1,28 @@
 """Pydantic схемы для API."""
 
-from .task_schemas import TaskComplete, TaskCreate, TaskListResponse, TaskResponse, TaskUpdate
+from .auth_schemas import SessionTokenResponse
+from .product_schemas import (
+    ProductCreate,
+    ProductListResponse,
+    ProductResponse,
+    ProductSetCreate,
+    ProductSetResponse,
+    ProductWriteOff,
+)
+from .task_schemas import (
+    TaskBatchCreate,
+    TaskComplete,
+    TaskCreate,
+    TaskListResponse,
+    TaskResponse,
+    TaskUpdate,
+)
 from .user_schemas import UserCreate, UserListResponse, UserResponse, UserUpdate
 
 __all__ = [
+    "SessionTokenResponse",
     "TaskCreate",
+    "TaskBatchCreate",
     "TaskUpdate",
     "TaskComplete",
     "TaskResponse",
@@ -13,5 +31,11 @@ __all__ = [
     "UserUpdate",
     "UserResponse",
     "UserListResponse",
+    "ProductCreate",
+    "ProductResponse",
+    "ProductListResponse",
+    "ProductWriteOff",
+    "ProductSetCreate",
+    "ProductSetResponse",
 ]
 
@@ -0,0 +1,13 @@
+"""Pydantic схемы для авторизации."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class SessionTokenResponse(BaseModel):
+    """Схема ответа с токеном сессии."""
+
+    access_token: str = Field(..., description="Токен для заголовка Authorization: Bearer")
+    token_type: str = Field("bearer", description="Тип токена")
+    expires_at: datetime = Field(..., description="Момент истечения токена (UTC)")
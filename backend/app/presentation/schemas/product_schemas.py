@@ -0,0 +1,71 @@
+"""Pydantic схемы для товаров."""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProductBase(BaseModel):
+    """Базовая схема товара."""
+
+    name: str = Field(..., min_length=1, max_length=200, description="Название товара")
+    description: Optional[str] = Field(None, description="Описание товара")
+    quantity: int = Field(0, ge=0, description="Остаток")
+    category_id: Optional[str] = Field(None, description="ID категории")
+    photo_url: Optional[str] = Field(None, description="URL фотографии")
+    barcode: Optional[str] = Field(None, min_length=1, max_length=64, description="Штрих-код")
+
+
+class ProductCreate(ProductBase):
+    """Схема для создания товара."""
+
+    project_id: Optional[str] = Field(None, description="ID проекта")
+
+
+class ProductWriteOff(BaseModel):
+    """Схема списания товара."""
+
+    amount: int = Field(..., ge=1, description="Сколько единиц списать")
+
+
+class ProductResponse(ProductBase):
+    """Схема ответа с товаром."""
+
+    id: str
+    status: str
+    project_id: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ProductListResponse(BaseModel):
+    """Схема списка товаров."""
+
+    products: List[ProductResponse]
+    next_cursor: Optional[str] = Field(None, description="Курсор следующей страницы; null на последней")
+
+
+class ProductSetCreate(BaseModel):
+    """Схема для создания комплекта товаров."""
+
+    name: str = Field(..., min_length=1, max_length=200, description="Название комплекта")
+    description: Optional[str] = Field(None, description="Описание комплекта")
+    products: Dict[str, int] = Field(..., min_length=1, description="ID товара -> сколько единиц списывать")
+    project_id: Optional[str] = Field(None, description="ID проекта")
+
+
+class ProductSetResponse(BaseModel):
+    """Схема ответа с комплектом товаров."""
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    products: Dict[str, int]
+    is_active: bool
+    project_id: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
@@ -33,6 +33,7 @@ class TaskBase(BaseModel):
     category_id: Optional[str] = Field(None, description="ID категории")
     assignee_id: Optional[str] = Field(None, description="ID исполнителя")
     deadline: Optional[datetime] = Field(None, description="Срок выполнения")
+    product_set_id: Optional[str] = Field(None, description="Комплект товаров, списываемый при выполнении")
 
 
 class TaskCreate(TaskBase):
@@ -41,6 +42,19 @@ class TaskCreate(TaskBase):
     pass
 
 
+# Ограничение размера пакета: одна транзакция не должна держать запись слишком долго
+MAX_TASK_BATCH_SIZE = 200
+
+
+class TaskBatchCreate(BaseModel):
+    """Схема для пакетного создания задач."""
+
+    tasks: List[TaskCreate] = Field(..., min_length=1, max_length=MAX_TASK_BATCH_SIZE, description="Задачи")
+    project_id: Optional[str] = Field(
+        None, description="ID проекта для всех задач пакета (только проект создателя, по умолчанию — он же)"
+    )
+
+
 class TaskUpdate(BaseModel):
     """Схема для обновления задачи."""
 
@@ -77,8 +91,8 @@ class TaskResponse(TaskBase):
 
 
 class TaskListResponse(BaseModel):
-    """Схема списка задач."""
+    """Схема страницы списка задач."""
 
     tasks: List[TaskResponse]
-    total: int
+    next_cursor: Optional[str] = Field(None, description="Курсор следующей страницы; null на последней")
 
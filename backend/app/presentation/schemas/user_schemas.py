@@ -54,8 +54,8 @@ class UserResponse(UserBase):
 
 
 class UserListResponse(BaseModel):
-    """Схема списка пользователей."""
+    """Схема страницы списка пользователей."""
 
     users: List[UserResponse]
-    total: int
+    next_cursor: Optional[str] = Field(None, description="Курсор следующей страницы; null на последней")
 
@@ -0,0 +1,101 @@
+"""Бенчмарк памяти и скорости создания доменных задач: обычные dataclass против slots.
+
+Запуск из каталога backend:
+
+    python -m benchmarks.bench_domain_memory --tasks 100000
+
+Задачи собираются так же, как их собирает репозиторий: с ID, исполнителем,
+создателем, а у половины — с комментарием и фотографией. Для сравнения
+строятся копии тех же классов без slots. Для каждого варианта выводятся
+байты на задачу (tracemalloc) и время создания всего списка.
+"""
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+
+from app.domain.enums import TaskPriority, TaskStatus
+from app.domain.task import Task
+from app.domain.value_objects import Comment, PhotoUrl, TaskId, UserId
+
+SLOTTED = {cls.__name__: cls for cls in (Task, TaskId, UserId, Comment, PhotoUrl)}
+
+
+def _plain_twin(cls):
+    """Копия dataclass без slots: те же поля, валидация и заморозка."""
+    fields = []
+    for item in dataclasses.fields(cls):
+        if item.default_factory is not dataclasses.MISSING:
+            fields.append((item.name, item.type, dataclasses.field(default_factory=item.default_factory)))
+        elif item.default is not dataclasses.MISSING:
+            fields.append((item.name, item.type, dataclasses.field(default=item.default)))
+        else:
+            fields.append((item.name, item.type))
+    namespace = {"__post_init__": cls.__post_init__} if hasattr(cls, "__post_init__") else {}
+    return dataclasses.make_dataclass(
+        cls.__name__, fields, namespace=namespace, frozen=cls.__dataclass_params__.frozen
+    )
+
+
+def _build(classes: dict, count: int) -> list:
+    task_cls, task_id, user_id = classes["Task"], classes["TaskId"], classes["UserId"]
+    comment, photo_url = classes["Comment"], classes["PhotoUrl"]
+    now = datetime.utcnow()
+    tasks = []
+    for i in range(count):
+        done = i % 2 == 0
+        tasks.append(
+            task_cls(
+                id=task_id(f"01J{i:023d}"),
+                title=f"Задача {i}",
+                description=None,
+                status=TaskStatus.COMPLETED if done else TaskStatus.PENDING,
+                priority=TaskPriority.MEDIUM,
+                category_id=None,
+                assignee_id=user_id(str(i % 50)),
+                creator_id=user_id("1"),
+                deadline=None,
+                created_at=now,
+                updated_at=now,
+                completed_at=now if done else None,
+                completion_photos=[photo_url(f"https://example.com/{i}.jpg")] if done else [],
+                completion_comment=comment("Готово") if done else None,
+                project_id="shop",
+            )
+        )
+    return tasks
+
+
+def _measure(classes: dict, count: int):
+    gc.collect()
+    started = time.perf_counter()
+    tasks = _build(classes, count)
+    elapsed = time.perf_counter() - started
+    del tasks
+    gc.collect()
+
+    tracemalloc.start()
+    tasks = _build(classes, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return size / count, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100_000, help="задач в списке")
+    args = parser.parse_args()
+
+    plain = {name: _plain_twin(cls) for name, cls in SLOTTED.items()}
+    print(f"{args.tasks} задач")
+    for name, classes in (("dataclass", plain), ("slots", SLOTTED)):
+        per_task, elapsed = _measure(classes, args.tasks)
+        print(f"  {name:10} {per_task:8.0f} байт/задачу  {elapsed:6.3f} с на создание")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Бенчмарк инвентаризации: сверка порциями против запроса на каждый товар.
+
+Запуск из каталога backend:
+
+    python -m benchmarks.bench_inventory --products 20000 --discrepancy 0.1
+
+Пересчёт всего склада (каждый товар по штрих-коду) сверяется двумя
+способами в файловой SQLite: поиском и исправлением товара по одному и
+ReconcileInventoryUseCase (IN-запрос и executemany на порцию). Для каждого
+способа печатается время и число запросов, для второго ещё и пик памяти
+Python во время сверки (отдельным прогоном).
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.application.use_cases import InventoryCount, ReconcileInventoryUseCase
+from app.domain.enums import ProductStatus
+from app.infrastructure.database import Base
+from app.infrastructure.models import ProductModel
+from app.infrastructure.repositories import ProductRepositoryImpl
+from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def _seed(engine, products: int) -> None:
+    Base.metadata.create_all(engine)
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        connection.execute(
+            insert(ProductModel.__table__),
+            [
+                {
+                    "id": f"p{i}",
+                    "name": f"Товар {i}",
+                    "quantity": 10,
+                    "barcode": f"46{i:011d}",
+                    "status": ProductStatus.ACTIVE,
+                    "project_id": "shop",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(products)
+            ],
+        )
+
+
+async def _counts(products: int, discrepancy: float):
+    step = max(1, round(1 / discrepancy)) if discrepancy else products + 1
+    for i in range(products):
+        yield InventoryCount(line=i + 1, key=f"46{i:011d}", counted=7 if i % step == 0 else 10)
+
+
+async def _one_by_one(db, products: int, discrepancy: float) -> None:
+    repository = ProductRepositoryImpl(db, autocommit=False)
+    async for count in _counts(products, discrepancy):
+        product = await repository.get_by_barcode(count.key, "shop")
+        if product and product.quantity.value != count.counted:
+            await repository.set_quantities({product.id: count.counted}, datetime.utcnow())
+    db.commit()
+
+
+async def _chunked(db, products: int, discrepancy: float) -> None:
+    use_case = ReconcileInventoryUseCase(SqlAlchemyUnitOfWork(db))
+    await use_case.execute(_counts(products, discrepancy), lambda discrepancy: None, "shop")
+
+
+def _measure(name: str, run, products: int, discrepancy: float, trace: bool = False) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'inventory.db')}")
+        _seed(engine, products)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(None))
+        db = sessionmaker(bind=engine)()
+        if trace:
+            tracemalloc.start()
+        started = time.perf_counter()
+        asyncio.run(run(db, products, discrepancy))
+        elapsed = time.perf_counter() - started
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        db.close()
+        engine.dispose()
+    if trace:
+        print(f"{name:<14} пик памяти {peak / 1024 / 1024:.1f} МБ")
+    else:
+        print(f"{name:<14} {elapsed:7.2f} с, запросов: {len(statements)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=20000)
+    parser.add_argument("--discrepancy", type=float, default=0.1, help="доля товаров с расхождением")
+    args = parser.parse_args()
+
+    _measure("по одному", _one_by_one, args.products, args.discrepancy)
+    _measure("порциями", _chunked, args.products, args.discrepancy)
+    # Отдельным прогоном: tracemalloc заметно замедляет выполнение
+    _measure("порциями", _chunked, args.products, args.discrepancy, trace=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Бенчмарк сериализации ответа списка задач: обычный режим против FAST_JSON.
+
+Запуск из каталога backend:
+
+    python -m benchmarks.bench_json_responses --tasks 200 --rounds 200
+
+Обычный режим повторяет путь FastAPI: схемы Pydantic строятся с проверкой,
+затем serialize_response проверяет их по response_model ещё раз и кодирует
+JSONResponse. Для сравнения выводятся также варианты с model_construct
+(без проверки, но через схемы) и быстрый режим приложения: словари полей
+и FastJSONResponse. Для каждого варианта печатается время на один ответ
+и совпадение тела с обычным режимом.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.domain.enums import TaskPriority, TaskStatus
+from app.presentation.responses import FastJSONResponse
+from app.presentation.schemas import TaskListResponse, TaskResponse
+
+
+def _rows(count: int) -> list:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": f"01J{i:023d}",
+            "title": f"Задача {i}",
+            "description": "Описание задачи",
+            "priority": TaskPriority.MEDIUM,
+            "category_id": None,
+            "assignee_id": "42",
+            "deadline": None,
+            "status": TaskStatus.PENDING,
+            "creator_id": "42",
+            "created_at": now,
+            "updated_at": now,
+            "completed_at": None,
+            "completion_photos": None,
+            "completion_comment": None,
+            "project_id": "shop",
+            "product_set_id": None,
+        }
+        for i in range(count)
+    ]
+
+
+def _variants(rows: list, loop: asyncio.AbstractEventLoop) -> dict:
+    field = create_model_field(name="response", type_=TaskListResponse, mode="serialization")
+
+    def validated() -> bytes:
+        model = TaskListResponse(tasks=[TaskResponse(**row) for row in rows], next_cursor=None)
+        content = loop.run_until_complete(serialize_response(field=field, response_content=model))
+        return JSONResponse(content).body
+
+    def constructed() -> bytes:
+        model = TaskListResponse.model_construct(
+            tasks=[TaskResponse.model_construct(**row) for row in rows], next_cursor=None
+        )
+        return Response(model.model_dump_json(), media_type="application/json").body
+
+    def fast() -> bytes:
+        return FastJSONResponse({"tasks": rows, "next_cursor": None}).body
+
+    return {"validated": validated, "model_construct": constructed, "fast_json": fast}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=200, help="задач в ответе")
+    parser.add_argument("--rounds", type=int, default=200, help="повторов каждого варианта")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    variants = _variants(_rows(args.tasks), loop)
+    reference = json.loads(variants["validated"]())
+    print(f"{args.tasks} задач в ответе, {args.rounds} повторов, класс ответа {FastJSONResponse.__name__}")
+    for name, variant in variants.items():
+        same = json.loads(variant()) == reference
+        started = time.perf_counter()
+        for _ in range(args.rounds):
+            variant()
+        elapsed = (time.perf_counter() - started) / args.rounds * 1000
+        print(f"  {name:16} {elapsed:8.3f} мс/ответ  совпадает: {'да' if same else 'НЕТ'}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
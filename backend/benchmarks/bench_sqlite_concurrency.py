@@ -0,0 +1,157 @@
+"""Бенчмарк конкурентных чтений и записей SQLite: профиль по умолчанию против настроенного.
+
+Запуск из каталога backend:
+
+    python -m benchmarks.bench_sqlite_concurrency --seconds 5 --readers 8 --writers 2
+
+Читатели выбирают задачи проекта, писатели создают и завершают задачи, каждая
+операция в своей транзакции, как в API. Для каждого профиля выводится число
+операций в секунду и количество ошибок «database is locked».
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.exc import OperationalError
+
+from app.config.settings import Settings
+from app.domain.enums import TaskPriority, TaskStatus
+from app.infrastructure.database import Base, install_sqlite_pragmas, sqlite_pragmas
+from app.infrastructure.models import TaskModel
+
+# Профиль «до»: стандартный журнал отката SQLite и таймаут pysqlite
+BASELINE = Settings(
+    sqlite_journal_mode="",
+    sqlite_synchronous="",
+    sqlite_busy_timeout_ms=None,
+    sqlite_cache_size=None,
+    sqlite_mmap_size=None,
+    sqlite_temp_store="",
+)
+# Профиль «после»: значения по умолчанию из настроек приложения
+TUNED = Settings()
+
+
+def _make_engine(path: str, profile: Settings):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 1})
+    install_sqlite_pragmas(engine, sqlite_pragmas(profile))
+    return engine
+
+
+def _seed(engine, rows: int) -> None:
+    Base.metadata.create_all(engine)
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        connection.execute(
+            insert(TaskModel),
+            [
+                {
+                    "id": f"seed-{i}",
+                    "title": f"Задача {i}",
+                    "status": TaskStatus.PENDING,
+                    "priority": TaskPriority.MEDIUM,
+                    "creator_id": "1",
+                    "project_id": f"p{i % 10}",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(rows)
+            ],
+        )
+
+
+def _run(profile: Settings, seconds: float, readers: int, writers: int, rows: int) -> dict:
+    directory = tempfile.mkdtemp(prefix="bench_sqlite_")
+    path = os.path.join(directory, "bench.db")
+    engine = _make_engine(path, profile)
+    _seed(engine, rows)
+
+    stop = threading.Event()
+    counters = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def count(key: str) -> None:
+        with lock:
+            counters[key] += 1
+
+    def reader(number: int) -> None:
+        query = select(TaskModel.id, TaskModel.title).where(TaskModel.project_id == f"p{number % 10}")
+        while not stop.is_set():
+            try:
+                with engine.connect() as connection:
+                    connection.execute(query).all()
+                count("reads")
+            except OperationalError:
+                count("locked")
+
+    def writer(number: int) -> None:
+        sequence = 0
+        while not stop.is_set():
+            sequence += 1
+            task_id = f"w{number}-{sequence}"
+            now = datetime.utcnow()
+            try:
+                with engine.begin() as connection:
+                    connection.execute(
+                        insert(TaskModel).values(
+                            id=task_id,
+                            title="Новая задача",
+                            status=TaskStatus.PENDING,
+                            priority=TaskPriority.HIGH,
+                            creator_id="1",
+                            project_id=f"p{sequence % 10}",
+                            created_at=now,
+                            updated_at=now,
+                        )
+                    )
+                with engine.begin() as connection:
+                    connection.execute(
+                        update(TaskModel)
+                        .where(TaskModel.id == task_id)
+                        .values(status=TaskStatus.COMPLETED, completed_at=now, updated_at=now)
+                    )
+                count("writes")
+            except OperationalError:
+                count("locked")
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    return {
+        "reads_per_sec": counters["reads"] / seconds,
+        "writes_per_sec": counters["writes"] / seconds,
+        "locked_errors": counters["locked"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    for name, profile in (("default", BASELINE), ("tuned", TUNED)):
+        result = _run(profile, args.seconds, args.readers, args.writers, args.rows)
+        print(
+            f"{name:>8}: {result['reads_per_sec']:9.1f} reads/s "
+            f"{result['writes_per_sec']:8.1f} writes/s "
+            f"{result['locked_errors']:5d} locked errors  ({'; '.join(sqlite_pragmas(profile)) or 'no pragmas'})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+import os
+import tempfile
+
+# Тесты работают с временной БД, чтобы не трогать рабочий store_todo.db
+_db_dir = tempfile.mkdtemp(prefix="store_todo_tests_")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_db_dir, 'test.db')}")
+# Ключ токенов сессии: без него (и без токена бота) токены не выпускаются
+os.environ.setdefault("SESSION_TOKEN_SECRET", "test-session-secret")
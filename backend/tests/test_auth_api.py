@@ -0,0 +1,61 @@
+import json
+from urllib.parse import quote
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def _init_data(telegram_id: int) -> dict:
+    return {"X-Telegram-Init-Data": f"user={quote(json.dumps({'id': telegram_id}))}"}
+
+
+def test_session_token_replaces_init_data() -> None:
+    client.post(
+        "/api/v1/users/",
+        json={"telegram_id": 1301, "username": "token", "full_name": "Токен", "role": "admin", "project_id": "auth"},
+        headers=_init_data(1301),
+    )
+
+    response = client.post("/api/v1/auth/session", headers=_init_data(1301))
+    assert response.status_code == 200
+    token = response.json()["access_token"]
+
+    response = client.post("/api/v1/tasks/", json={"title": "По токену"}, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 201
+    # Создатель и проект взяты из токена
+    assert (response.json()["creator_id"], response.json()["project_id"]) == ("1301", "auth")
+    batch = client.post(
+        "/api/v1/tasks/batch",
+        json={"project_id": "other", "tasks": [{"title": "Чужой проект"}]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert batch.status_code == 400
+
+    body, signature = token.split(".")
+    forged = client.post(
+        "/api/v1/tasks/", json={"title": "Подделка"}, headers={"Authorization": f"Bearer {body}x.{signature}"}
+    )
+    assert forged.status_code == 401
+
+
+def test_session_requires_registered_user() -> None:
+    assert client.post("/api/v1/auth/session").status_code == 401
+    assert client.post("/api/v1/auth/session", headers=_init_data(1399)).status_code == 404
+
+
+def test_session_tokens_require_configured_secret(monkeypatch) -> None:
+    from app.infrastructure import session_tokens
+
+    monkeypatch.setattr(session_tokens, "get_settings", lambda: type(
+        "Settings", (), {"session_token_secret": "", "telegram_bot_token": "", "session_token_ttl_seconds": 60}
+    )())
+    session_tokens.get_session_token_signer.cache_clear()
+    try:
+        # Случайный ключ процесса не приняли бы другие воркеры
+        assert session_tokens.get_session_token_signer() is None
+        assert client.post("/api/v1/auth/session", headers=_init_data(1301)).status_code == 503
+    finally:
+        session_tokens.get_session_token_signer.cache_clear()
@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime
+
+from app.domain.enums import UserRole
+from app.domain.user import User
+from app.domain.value_objects import UserId
+from app.infrastructure.cache import CachedUserRepository, InMemoryCacheBackend, RedisCacheBackend
+
+
+class _Users:
+    """Исходный репозиторий, считающий обращения."""
+
+    def __init__(self, *users: User):
+        self.users = {user.id.value: user for user in users}
+        self.calls = []
+
+    async def get_by_id(self, user_id):
+        self.calls.append("get_by_id")
+        return self.users.get(user_id.value)
+
+    async def get_by_telegram_id(self, telegram_id):
+        self.calls.append("get_by_telegram_id")
+        return next((user for user in self.users.values() if user.telegram_id == telegram_id), None)
+
+    async def update(self, user):
+        self.users[user.id.value] = user
+        return user
+
+    async def list_all(self, project_id=None, limit=None, after=None):
+        self.calls.append("list_all")
+        return [user for user in self.users.values() if user.project_id == project_id]
+
+
+def _user(telegram_id: int, full_name: str = "Кассир") -> User:
+    now = datetime(2024, 1, 1)
+    return User(
+        id=UserId(value=str(telegram_id)),
+        telegram_id=telegram_id,
+        username=f"user{telegram_id}",
+        full_name=full_name,
+        role=UserRole.EMPLOYEE,
+        created_at=now,
+        updated_at=now,
+        project_id="shop",
+    )
+
+
+async def _exercise(backend) -> None:
+    inner = _Users(_user(1), _user(2))
+    users = CachedUserRepository(inner, backend, ttl_seconds=30)
+
+    assert (await users.get_by_telegram_id(1)).full_name == "Кассир"
+    assert (await users.get_by_id(UserId(value="1"))).telegram_id == 1
+    assert len(await users.list_all("shop")) == 2
+    assert len(await users.list_all("shop")) == 2
+    assert inner.calls == ["get_by_telegram_id", "list_all"]
+
+    # Запись сбрасывает запись пользователя и все списки
+    await users.update(_user(1, full_name="Старший кассир"))
+    assert (await users.get_by_telegram_id(1)).full_name == "Старший кассир"
+    await users.list_all("shop")
+    assert inner.calls[2:] == ["get_by_id", "list_all"]
+
+    # В единице работы сброс откладывается до фиксации
+    assert (await users.get_by_id(UserId(value="2"))).full_name == "Кассир"
+    in_uow = CachedUserRepository(inner, backend, ttl_seconds=30, defer_invalidation=True)
+    await in_uow.update(_user(2, full_name="Грузчик"))
+    assert (await users.get_by_id(UserId(value="2"))).full_name == "Кассир"
+    await in_uow.apply_invalidations()
+    assert (await users.get_by_id(UserId(value="2"))).full_name == "Грузчик"
+
+
+def test_cached_repository_in_memory() -> None:
+    asyncio.run(_exercise(InMemoryCacheBackend(max_entries=100)))
+
+
+class _RespStandIn:
+    """Минимальный сервер RESP (GET/SET/DEL/INCR) вместо Redis."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def handle(self, reader, writer):
+        while True:
+            header = await reader.readline()
+            if not header:
+                break
+            args = []
+            for _ in range(int(header[1:])):
+                length = int((await reader.readline())[1:])
+                args.append((await reader.readexactly(length + 2))[:-2])
+            command = args[0].upper()
+            if command == b"GET":
+                value = self.data.get(args[1])
+                writer.write(b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value))
+            elif command == b"SET":
+                self.data[args[1]] = args[2]
+                writer.write(b"+OK\r\n")
+            elif command == b"DEL":
+                removed = sum(self.data.pop(key, None) is not None for key in args[1:])
+                writer.write(b":%d\r\n" % removed)
+            elif command == b"INCR":
+                value = int(self.data.get(args[1], b"0")) + 1
+                self.data[args[1]] = str(value).encode()
+                writer.write(b":%d\r\n" % value)
+            else:
+                writer.write(b"-ERR unknown command\r\n")
+            await writer.drain()
+        writer.close()
+
+
+def test_cached_repository_with_redis_protocol() -> None:
+    async def run():
+        stand_in = _RespStandIn()
+        server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        backend = RedisCacheBackend(f"redis://127.0.0.1:{port}/0")
+        try:
+            await _exercise(backend)
+            assert b"v1:user:1" in stand_in.data
+        finally:
+            await backend.close()
+            server.close()
+            await server.wait_closed()
+
+        # Недоступный сервер — промах, а не ошибка запроса
+        assert await backend.get("v1:user:1") is None
+
+    asyncio.run(run())
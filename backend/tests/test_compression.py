@@ -0,0 +1,82 @@
+import gzip
+import json
+
+import brotli
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app.infrastructure.middleware import CompressionMiddleware
+from app.main import app
+from tests.test_tasks_api import _auth, _create_user
+
+BODY = json.dumps([{"id": i, "title": f"Задача {i}", "status": "pending"} for i in range(100)]).encode()
+
+
+def _client() -> TestClient:
+    async def json_list(request):
+        return Response(BODY, media_type="application/json", headers={"ETag": '"v1"'})
+
+    async def small(request):
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    async def photo(request):
+        return Response(b"\xff\xd8" + bytes(2000), media_type="image/jpeg")
+
+    async def stream(request):
+        async def chunks():
+            for line in BODY.split(b","):
+                yield line + b",\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    routes = [Route(path, endpoint) for path, endpoint in [("/json", json_list), ("/small", small), ("/photo", photo), ("/stream", stream)]]
+    return TestClient(CompressionMiddleware(Starlette(routes=routes), minimum_size=500))
+
+
+def _raw(client: TestClient, path: str, accept_encoding: str):
+    # Читаем тело без автоматической распаковки httpx
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_compresses_text_with_brotli_or_gzip() -> None:
+    client = _client()
+
+    response, body = _raw(client, "/json", "gzip, br")
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) == len(body)
+    assert brotli.decompress(body) == BODY
+
+    for accept_encoding in ["gzip;q=1, br;q=0", "br;q=0.1, gzip;q=1", "*, br;q=0.5"]:
+        response, body = _raw(client, "/json", accept_encoding)
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(body) == BODY
+
+    response, body = _raw(client, "/stream", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(body) == b"".join(line + b",\n" for line in BODY.split(b","))
+
+
+def test_skips_small_bodies_media_and_identity_clients() -> None:
+    client = _client()
+    for path, accept_encoding in [("/small", "gzip"), ("/photo", "gzip, br"), ("/json", "identity")]:
+        response, _ = _raw(client, path, accept_encoding)
+        assert "content-encoding" not in response.headers
+    assert "vary" not in _raw(client, "/photo", "gzip")[0].headers
+
+
+def test_task_list_shrinks_several_times() -> None:
+    client = TestClient(app)
+    _create_user(1040, "compressed")
+    for number in range(50):
+        client.post("/api/v1/tasks/", json={"title": f"Проверить ценники, ряд {number}"}, headers=_auth(1040))
+
+    response = client.get("/api/v1/tasks/", params={"creator_id": "1040"}, headers={"Accept-Encoding": "br"})
+    assert response.headers["content-encoding"] == "br"
+    assert len(response.json()["tasks"]) == 50
+    assert len(response.content) / response.num_bytes_downloaded >= 5
@@ -0,0 +1,27 @@
+import threading
+
+from app.domain.identifiers import IdGenerator, new_id
+
+
+def test_ids_are_monotonic_within_process() -> None:
+    ids = [new_id() for _ in range(10000)]
+    assert all(len(value) == 26 for value in ids)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_ids_are_unique_across_threads() -> None:
+    generator = IdGenerator()
+    results = []
+
+    def worker() -> None:
+        results.append([generator.new_id() for _ in range(2000)])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [value for chunk in results for value in chunk]
+    assert len(set(ids)) == len(ids)
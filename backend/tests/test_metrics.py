@@ -0,0 +1,34 @@
+from fastapi.testclient import TestClient
+
+from app.infrastructure.database import engine
+from app.infrastructure.metrics import MetricsRegistry
+from app.main import app
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("wait_seconds", "Ожидание", ["pool"], buckets=[0.1, 1.0])
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, pool="write")
+
+    lines = registry.render().splitlines()
+
+    assert 'wait_seconds_bucket{pool="write",le="0.1"} 1' in lines
+    assert 'wait_seconds_bucket{pool="write",le="1"} 2' in lines
+    assert 'wait_seconds_bucket{pool="write",le="+Inf"} 3' in lines
+    assert 'wait_seconds_count{pool="write"} 3' in lines
+
+
+def test_pool_metrics_exported() -> None:
+    client = TestClient(app)
+    with engine.connect():
+        response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert 'db_pool_connections_in_use{pool="write"} 1' in lines
+    assert 'db_pool_size{pool="write"} 5' in lines
+    checkouts = next(line for line in lines if line.startswith('db_pool_checkouts_total{pool="write"}'))
+    assert int(checkouts.split()[-1]) >= 1
+    assert 'db_pool_checkout_seconds_count{pool="write"}' in response.text
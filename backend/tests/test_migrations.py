@@ -0,0 +1,73 @@
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, select, text
+
+from app.infrastructure.database import Base
+from app.infrastructure.fts import include_name
+from app.infrastructure.init_db import _alembic_config, run_migrations
+from app.domain.enums import ProductStatus
+from app.infrastructure.models import TASK_IS_OPEN, ProductModel, TaskModel
+
+
+def test_migrations_match_models(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    run_migrations(engine)
+
+    with engine.connect() as connection:
+        context = MigrationContext.configure(connection, opts={"include_name": include_name})
+        diff = compare_metadata(context, Base.metadata)
+    assert diff == []
+
+
+def test_legacy_database_is_upgraded(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    # Исходная схема без таблицы alembic_version, как её создавал create_all
+    # до появления миграций
+    config = _alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "0001")
+        connection.execute(text("DROP TABLE alembic_version"))
+        connection.execute(
+            text("INSERT INTO products (id, name, quantity, barcode, status) VALUES ('p1', 'Молоко', 3, '460', 'ACTIVE')")
+        )
+
+    run_migrations(engine)
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("tasks")}
+    assert {"ix_tasks_project_assignee_status", "ix_tasks_open_deadline"} <= indexes
+    unique = {constraint["name"] for constraint in inspect(engine).get_unique_constraints("products")}
+    assert unique == {"uq_products_project_barcode"}
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT barcode FROM products")).scalar_one() == "460"
+
+
+def _plan(engine, query) -> str:
+    compiled = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        return " ".join(row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+
+
+def test_overdue_query_uses_partial_index(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'plan.db'}")
+    run_migrations(engine)
+
+    query = select(TaskModel.id).where(TaskModel.deadline < text("'2030-01-01'"), TASK_IS_OPEN)
+    assert "ix_tasks_open_deadline" in _plan(engine, query)
+
+
+def test_product_queries_use_project_indexes(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'products.db'}")
+    run_migrations(engine)
+
+    barcode = select(ProductModel.id).where(ProductModel.project_id == "p1", ProductModel.barcode == "460")
+    # Индекс уникального ограничения SQLite называет sqlite_autoindex_*
+    assert "USING INDEX sqlite_autoindex_products_2 (project_id=? AND barcode=?)" in _plan(engine, barcode)
+    low_stock = select(ProductModel.id).where(
+        ProductModel.project_id == "p1",
+        ProductModel.status == ProductStatus.ACTIVE,
+        ProductModel.quantity > 0,
+        ProductModel.quantity <= 10,
+    )
+    assert "ix_products_project_status_quantity" in _plan(engine, low_stock)
@@ -0,0 +1,180 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from tests.test_tasks_api import _auth
+
+client = TestClient(app)
+
+
+def _create(name: str, quantity: int, project_id: str, barcode: str = None):
+    return client.post(
+        "/api/v1/products/",
+        json={"name": name, "quantity": quantity, "barcode": barcode, "project_id": project_id},
+        headers=_auth(2001),
+    )
+
+
+def test_barcode_is_unique_per_project() -> None:
+    assert _create("Молоко 1 л", 12, "shop-a", "4601234567890").status_code == 201
+    # Тот же товар в другом магазине — допустимо
+    assert _create("Молоко 1 л", 3, "shop-b", "4601234567890").status_code == 201
+    assert _create("Молоко 1 л", 1, "shop-a", "4601234567890").status_code == 400
+
+    found = client.get("/api/v1/products/barcode/4601234567890", params={"project_id": "shop-b"})
+    assert found.status_code == 200
+    assert found.json()["quantity"] == 3
+    assert client.get("/api/v1/products/barcode/4601234567890", params={"project_id": "shop-c"}).status_code == 404
+    assert client.get(f"/api/v1/products/{found.json()['id']}").json() == found.json()
+
+
+def test_stock_listings() -> None:
+    for name, quantity in [("Хлеб", 2), ("Соль", 0), ("Сахар", 40), ("Чай", 7)]:
+        _create(name, quantity, "shop-stock")
+
+    low = client.get("/api/v1/products/low-stock", params={"project_id": "shop-stock"}).json()["products"]
+    assert [product["name"] for product in low] == ["Хлеб", "Чай"]
+    out = client.get("/api/v1/products/out-of-stock", params={"project_id": "shop-stock"}).json()["products"]
+    assert [(product["name"], product["status"]) for product in out] == [("Соль", "out_of_stock")]
+
+    # Списки постраничные, в порядке добавления
+    first = client.get("/api/v1/products/", params={"project_id": "shop-stock", "limit": 3}).json()
+    second = client.get(
+        "/api/v1/products/", params={"project_id": "shop-stock", "limit": 3, "cursor": first["next_cursor"]}
+    ).json()
+    assert [product["name"] for product in first["products"] + second["products"]] == ["Хлеб", "Соль", "Сахар", "Чай"]
+    assert second["next_cursor"] is None
+    assert client.get("/api/v1/products/out-of-stock", params={"cursor": "испорчен"}).status_code == 400
+
+
+def test_search_ranks_prefix_matches_and_paginates() -> None:
+    _create("Кефир 2,5%", 5, "shop-search")
+    _create("Молоко топлёное", 5, "shop-search")
+    _create("Молоко 3,2%", 5, "shop-search")
+    client.post(
+        "/api/v1/products/",
+        json={"name": "Творог", "description": "Из цельного молока", "quantity": 5, "project_id": "shop-search"},
+        headers=_auth(2001),
+    )
+
+    first = client.get("/api/v1/products/search", params={"q": "мол", "project_id": "shop-search", "limit": 2}).json()
+    # Совпадения в названии выше совпадений в описании
+    assert {product["name"] for product in first["products"]} == {"Молоко топлёное", "Молоко 3,2%"}
+    second = client.get(
+        "/api/v1/products/search",
+        params={"q": "мол", "project_id": "shop-search", "limit": 2, "cursor": first["next_cursor"]},
+    ).json()
+    assert [product["name"] for product in second["products"]] == ["Творог"]
+    assert second["next_cursor"] is None
+
+    narrowed = client.get("/api/v1/products/search", params={"q": "молоко топ", "project_id": "shop-search"}).json()
+    assert [product["name"] for product in narrowed["products"]] == ["Молоко топлёное"]
+    # Синтаксис FTS5 во вводе не ломает запрос
+    assert client.get("/api/v1/products/search", params={"q": '"мол* OR', "project_id": "shop-search"}).status_code == 200
+
+
+def test_write_off_updates_stock_and_status() -> None:
+    product_id = _create("Йогурт", 3, "shop-write-off").json()["id"]
+
+    def write_off(amount: int):
+        return client.post(f"/api/v1/products/{product_id}/write-off", json={"amount": amount}, headers=_auth(2001))
+
+    assert write_off(2).json()["quantity"] == 1
+    assert write_off(2).json()["detail"] == "Недостаточно товара на складе"
+    emptied = write_off(1).json()
+    assert (emptied["quantity"], emptied["status"]) == (0, "out_of_stock")
+    missing = client.post("/api/v1/products/missing/write-off", json={"amount": 1}, headers=_auth(2001))
+    assert missing.json()["detail"] == "Товар не найден"
+
+
+def test_completing_task_writes_off_product_set() -> None:
+    from tests.test_tasks_api import _create_user
+
+    _create_user(2101, "shop-kit")
+    gloves = _create("Перчатки", 4, "shop-kit").json()["id"]
+    bags = _create("Мешки для мусора", 1, "shop-kit").json()["id"]
+    kit = client.post(
+        "/api/v1/product-sets/",
+        json={"name": "Уборка", "products": {gloves: 2, bags: 1}, "project_id": "shop-kit"},
+        headers=_auth(2101),
+    ).json()
+    assert client.get(f"/api/v1/product-sets/{kit['id']}").json()["products"] == {gloves: 2, bags: 1}
+
+    def task() -> str:
+        response = client.post("/api/v1/tasks/", json={"title": "Уборка зала", "product_set_id": kit["id"]}, headers=_auth(2101))
+        return response.json()["id"]
+
+    # Неизвестный комплект и комплект чужого проекта отклоняются сразу, а не при выполнении
+    _create_user(2102, "shop-other")
+    for telegram_id, product_set_id in [(2101, "missing"), (2102, kit["id"])]:
+        response = client.post(
+            "/api/v1/tasks/", json={"title": "Уборка", "product_set_id": product_set_id}, headers=_auth(telegram_id)
+        )
+        assert (response.status_code, response.json()["detail"]) == (400, f"Комплект товаров не найден: {product_set_id}")
+    batch = client.post(
+        "/api/v1/tasks/batch",
+        json={"project_id": "shop-other", "tasks": [{"title": "Уборка", "product_set_id": kit["id"]}]},
+        headers=_auth(2102),
+    )
+    assert batch.status_code == 400
+
+    first = client.post(f"/api/v1/tasks/{task()}/complete", json={})
+    assert first.json()["product_set_id"] == kit["id"]
+    assert client.get(f"/api/v1/products/{gloves}").json()["quantity"] == 2
+    assert client.get(f"/api/v1/products/{bags}").json()["status"] == "out_of_stock"
+
+    # Мешков не осталось: комплект не списывается целиком, задача не выполняется
+    second_id = task()
+    second = client.post(f"/api/v1/tasks/{second_id}/complete", json={})
+    assert (second.status_code, second.json()["detail"]) == (400, "Недостаточно товара на складе: Мешки для мусора")
+    assert client.get(f"/api/v1/products/{gloves}").json()["quantity"] == 2
+    assert client.get(f"/api/v1/tasks/{second_id}").json()["status"] == "pending"
+
+
+def test_inventory_reconciliation_corrects_stock_and_reports_discrepancies() -> None:
+    milk = _create("Молоко", 10, "shop-count", "460001").json()["id"]
+    bread = _create("Хлеб", 5, "shop-count", "460002").json()["id"]
+    _create("Соль", 0, "shop-count", "460003")
+
+    upload = "\ufeffШтрих-код;Количество\r\n460001;7\r\n460002;5\r\n460003;4\r\n999999;1\r\n".encode()
+    response = client.post(
+        "/api/v1/products/inventory",
+        params={"project_id": "shop-count"},
+        content=(upload[i : i + 7] for i in range(0, len(upload), 7)),
+        headers={**_auth(2001), "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+    assert (response.headers["x-inventory-rows"], response.headers["x-inventory-corrected"]) == ("4", "2")
+    report = response.content.decode("utf-8-sig").splitlines()
+    assert report == [
+        "line,key,product_id,name,expected,counted,difference",
+        f"2,460001,{milk},Молоко,10,7,-3",
+        f"4,460003,{_find('460003')},Соль,0,4,4",
+        "5,999999,,,,1,",
+    ]
+    assert client.get(f"/api/v1/products/{milk}").json()["quantity"] == 7
+    assert client.get("/api/v1/products/barcode/460003", params={"project_id": "shop-count"}).json()["status"] == "active"
+
+    # Ошибка в любой строке откатывает всю инвентаризацию
+    broken = f'{{"product_id": "{bread}", "quantity": 1}}\n{{"barcode": "460001", "quantity": -2}}\n'
+    response = client.post(
+        "/api/v1/products/inventory",
+        params={"project_id": "shop-count"},
+        content=broken.encode(),
+        headers={**_auth(2001), "Content-Type": "application/x-ndjson"},
+    )
+    assert (response.status_code, response.json()["detail"]) == (400, "Строка 2: остаток не может быть отрицательным")
+    assert client.get(f"/api/v1/products/{bread}").json()["quantity"] == 5
+
+    # Ошибочная первая строка данных не принимается за заголовок
+    response = client.post(
+        "/api/v1/products/inventory",
+        params={"project_id": "shop-count"},
+        content="460002;7 шт\r\n460001;3\r\n".encode(),
+        headers={**_auth(2001), "Content-Type": "text/csv"},
+    )
+    assert (response.status_code, response.json()["detail"]) == (400, "Строка 1: некорректный остаток")
+    assert client.get(f"/api/v1/products/{milk}").json()["quantity"] == 7
+
+
+def _find(barcode: str) -> str:
+    return client.get(f"/api/v1/products/barcode/{barcode}", params={"project_id": "shop-count"}).json()["id"]
@@ -0,0 +1,455 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.enums import TaskPriority, TaskStatus, UserRole
+from app.domain.task import Task
+from app.domain.user import User
+from app.domain.value_objects import PhotoUrl, TaskId, UserId
+from app.infrastructure.database import Base
+from app.infrastructure.queries import TaskQueriesImpl
+from app.infrastructure.repositories import TaskRepositoryImpl, UserRepositoryImpl
+
+
+def _user(user_id: str) -> User:
+    now = datetime.utcnow()
+    return User(
+        id=UserId(user_id),
+        telegram_id=int(user_id),
+        username=f"user{user_id}",
+        full_name="Тестовый Пользователь",
+        role=UserRole.MANAGER,
+        created_at=now,
+        updated_at=now,
+        project_id="p1",
+    )
+
+
+def _task(task_id: str, creator_id: str) -> Task:
+    now = datetime.utcnow()
+    return Task(
+        id=TaskId(task_id),
+        title=f"Задача {task_id}",
+        description=None,
+        status=TaskStatus.PENDING,
+        priority=TaskPriority.MEDIUM,
+        category_id=None,
+        assignee_id=UserId(creator_id),
+        creator_id=UserId(creator_id),
+        deadline=None,
+        created_at=now,
+        updated_at=now,
+        project_id="p1",
+    )
+
+
+async def _exercise(db) -> None:
+    users = UserRepositoryImpl(db)
+    tasks = TaskRepositoryImpl(db)
+
+    await users.create(_user("1"))
+    assert (await users.get_by_telegram_id(1)).username == "user1"
+
+    # Одновременная регистрация: проверку прошли оба запроса, вставку — один
+    error = None
+    try:
+        await users.create(_user("1"))
+    except ValueError as raised:
+        error = str(raised)
+    assert error == "Пользователь с таким Telegram ID уже существует"
+
+    await tasks.create(_task("t1", "1"))
+    await tasks.create(_task("t2", "1"))
+    assert {task.id.value for task in await tasks.list_by_assignee(UserId("1"), "p1")} == {"t1", "t2"}
+
+    task = await tasks.get_by_id(TaskId("t1"))
+    task.mark_as_completed(comment="Готово")
+    updated = await tasks.update(task)
+    assert updated.status == TaskStatus.COMPLETED
+    assert updated.completion_comment.value == "Готово"
+
+    completed = await tasks.complete(TaskId("t2"), datetime.utcnow(), photos=[PhotoUrl("https://example.com/1.jpg")])
+    assert completed.status == TaskStatus.COMPLETED
+    assert [photo.value for photo in completed.completion_photos] == ["https://example.com/1.jpg"]
+    assert await tasks.complete(TaskId("t2"), datetime.utcnow()) is None
+    assert await tasks.complete(TaskId("missing"), datetime.utcnow()) is None
+
+    await tasks.delete(TaskId("t2"))
+    assert await tasks.get_by_id(TaskId("t2")) is None
+
+
+def test_repositories_with_sync_session() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        asyncio.run(_exercise(db))
+    finally:
+        db.close()
+
+
+def test_repositories_with_async_session() -> None:
+    async def run() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            await _exercise(db)
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_task_list_keyset_pagination() -> None:
+    from datetime import timedelta
+
+    from app.application.use_cases import ListTasksUseCase
+
+    async def run(db) -> None:
+        tasks = TaskRepositoryImpl(db)
+        base = datetime(2026, 1, 1)
+        # Две задачи с одинаковым created_at проверяют вторую часть ключа (id)
+        for number, offset in enumerate([0, 1, 1, 2, 3]):
+            task = _task(f"t{number}", "1")
+            task.created_at = base + timedelta(minutes=offset)
+            await tasks.create(task)
+
+        use_case = ListTasksUseCase(tasks, TaskQueriesImpl(db))
+        seen, cursor = [], None
+        while True:
+            page = await use_case.execute(project_id="p1", limit=2, cursor=cursor)
+            # Строки read model совпадают с сущностями той же страницы
+            rows = await use_case.rows(project_id="p1", limit=2, cursor=cursor)
+            assert rows.next_cursor == page.next_cursor
+            assert [(row["id"], row["status"], row["created_at"]) for row in rows.items] == [
+                (task.id.value, task.status, task.created_at) for task in page.items
+            ]
+            seen.extend(task.id.value for task in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == ["t4", "t3", "t2", "t1", "t0"]
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        asyncio.run(run(db))
+    finally:
+        db.close()
+
+
+def test_unit_of_work_commits_once_or_rolls_back() -> None:
+    from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+    async def run(db) -> None:
+        await UserRepositoryImpl(db).create(_user("1"))
+
+        async with SqlAlchemyUnitOfWork(db) as uow:
+            await uow.tasks.create_many([_task("kept-1", "1"), _task("kept-2", "1")])
+            await uow.tasks.complete(TaskId("kept-1"), datetime.utcnow())
+            await uow.commit()
+
+        async with SqlAlchemyUnitOfWork(db) as uow:
+            await uow.tasks.create(_task("discarded", "1"))
+            await uow.tasks.complete(TaskId("kept-2"), datetime.utcnow())
+            # Выход без commit(): обе записи откатываются
+
+        tasks = TaskRepositoryImpl(db)
+        assert (await tasks.get_by_id(TaskId("kept-1"))).status == TaskStatus.COMPLETED
+        assert (await tasks.get_by_id(TaskId("kept-2"))).status == TaskStatus.PENDING
+        assert await tasks.get_by_id(TaskId("discarded")) is None
+
+        # Повторная регистрация внутри единицы работы: откатывает её единица работы, а не репозиторий
+        error = None
+        try:
+            async with SqlAlchemyUnitOfWork(db) as uow:
+                await uow.tasks.create(_task("with-duplicate-user", "1"))
+                await uow.users.create(_user("1"))
+        except ValueError as raised:
+            error = str(raised)
+        assert error == "Пользователь с таким Telegram ID уже существует"
+        assert await tasks.get_by_id(TaskId("with-duplicate-user")) is None
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        asyncio.run(run(db))
+    finally:
+        db.close()
+
+
+def test_session_router_reads_own_writes() -> None:
+    from app.infrastructure.database import SessionRouter
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    router = SessionRouter(factory, factory)
+
+    async def run() -> None:
+        assert router.reader is not router.writer
+        await UserRepositoryImpl(router.writer).create(_user("7"))
+        assert router.wrote
+        assert router.reader is router.writer
+
+    try:
+        asyncio.run(run())
+    finally:
+        asyncio.run(router.close())
+
+
+def test_duplicate_barcodes_are_rejected_on_insert() -> None:
+    from app.domain.enums import ProductStatus
+    from app.domain.product import Product
+    from app.domain.value_objects import Barcode, ProductId, Quantity
+    from app.infrastructure.repositories import ProductRepositoryImpl
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    def product(product_id: str, project_id) -> Product:
+        now = datetime.utcnow()
+        return Product(
+            id=ProductId(product_id),
+            name="Молоко",
+            quantity=Quantity(1),
+            barcode=Barcode("4601234567890"),
+            status=ProductStatus.ACTIVE,
+            created_at=now,
+            updated_at=now,
+            project_id=project_id,
+        )
+
+    async def run(db) -> None:
+        products = ProductRepositoryImpl(db)
+        # Проверку в use case оба запроса прошли одновременно: дубликат отсекает индекс,
+        # в том числе у товаров вне проектов, где NULL != NULL
+        for project_id in ("shop", None):
+            await products.create(product(f"{project_id}-1", project_id))
+            error = None
+            try:
+                await products.create(product(f"{project_id}-2", project_id))
+            except ValueError as raised:
+                error = str(raised)
+            assert error == "Товар с таким штрих-кодом уже существует"
+        assert (await products.get_by_barcode("4601234567890")).id.value == "None-1"
+
+    db = sessionmaker(bind=engine)()
+    try:
+        asyncio.run(run(db))
+    finally:
+        db.close()
+
+
+def test_product_search_with_and_without_fts(tmp_path) -> None:
+    from app.domain.enums import ProductStatus
+    from app.domain.product import Product
+    from app.domain.value_objects import ProductId, Quantity
+    from app.infrastructure.init_db import run_migrations
+    from app.infrastructure.repositories import ProductRepositoryImpl
+
+    def product(product_id: str, name: str, description=None) -> Product:
+        now = datetime.utcnow()
+        return Product(
+            id=ProductId(product_id),
+            name=name,
+            quantity=Quantity(5),
+            description=description,
+            status=ProductStatus.ACTIVE,
+            created_at=now,
+            updated_at=now,
+            project_id="p1",
+        )
+
+    async def run(db) -> None:
+        products = ProductRepositoryImpl(db)
+        await products.create(product("a", "Сыр", "Молочный продукт"))
+        await products.create(product("b", "Молоко"))
+        await products.create(product("c", "Хлеб"))
+        assert [p.id.value for p in await products.search_by_name("мол", "p1")] == ["b", "a"]
+
+        renamed = await products.get_by_id(ProductId("c"))
+        renamed.name = "Хлеб молочный"
+        await products.update(renamed)
+        await products.delete(ProductId("b"))
+        assert {p.id.value for p in await products.search_by_name("молоч", "p1")} == {"a", "c"}
+        assert await products.search_by_name("молоко", "p1") == []
+        assert await products.search_by_name("!!!", "p1") == []
+
+    # Индекс FTS5 из миграции: название весомее описания, триггеры ведут индекс
+    migrated = create_engine(f"sqlite:///{tmp_path / 'fts.db'}")
+    run_migrations(migrated)
+    db = sessionmaker(bind=migrated)()
+    try:
+        asyncio.run(run(db))
+        assert [p.id.value for p in asyncio.run(ProductRepositoryImpl(db).search_by_name("хлеб мол", "p1"))] == ["c"]
+    finally:
+        db.close()
+    # Неявный rowid товаров не постоянен (его может перенумеровать VACUUM), индекс связан с товарами по ID
+    with migrated.begin() as connection:
+        connection.execute(text("UPDATE products SET rowid = rowid + 100"))
+    db = sessionmaker(bind=migrated)()
+    try:
+        assert [p.id.value for p in asyncio.run(ProductRepositoryImpl(db).search_by_name("хлеб мол", "p1"))] == ["c"]
+    finally:
+        db.close()
+
+    # Без индекса поиск идёт через LIKE
+    plain = create_engine("sqlite://")
+    Base.metadata.create_all(plain)
+    db = sessionmaker(bind=plain)()
+    try:
+        asyncio.run(run(db))
+    finally:
+        db.close()
+
+
+def test_concurrent_write_offs_do_not_lose_updates(tmp_path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.domain.enums import ProductStatus
+    from app.domain.product import Product
+    from app.domain.value_objects import ProductId, Quantity
+    from app.infrastructure.repositories import ProductRepositoryImpl
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'stock.db'}", connect_args={"timeout": 30})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    product_id = ProductId("p")
+    with factory() as db:
+        asyncio.run(ProductRepositoryImpl(db).create(Product(id=product_id, name="Молоко", quantity=Quantity(10))))
+
+    def write_off(_) -> bool:
+        # У каждого сотрудника своё соединение, как у параллельных запросов
+        with factory() as db:
+            product = asyncio.run(ProductRepositoryImpl(db).adjust_quantity(product_id, -1, datetime.utcnow()))
+            return product is not None
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(write_off, range(16)))
+
+    assert results.count(True) == 10
+    with factory() as db:
+        product = asyncio.run(ProductRepositoryImpl(db).get_by_id(product_id))
+    assert (product.quantity.value, product.status) == (0, ProductStatus.OUT_OF_STOCK)
+
+
+def test_product_set_write_off_query_count() -> None:
+    from sqlalchemy import event
+
+    from app.application.use_cases import CompleteTaskUseCase
+    from app.domain.enums import ProductStatus
+    from app.domain.product import Product
+    from app.domain.task_template import ProductSet
+    from app.domain.value_objects import ProductId, Quantity
+    from app.infrastructure.repositories import ProductRepositoryImpl, ProductSetRepositoryImpl
+    from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements = []
+
+    async def run(db) -> None:
+        await UserRepositoryImpl(db).create(_user("1"))
+        products = ProductRepositoryImpl(db)
+        kit = ProductSet(id="kit", name="Набор для уборки", project_id="p1")
+        for i in range(40):
+            await products.create(Product(id=ProductId(f"p{i}"), name=f"Товар {i}", quantity=Quantity(3), project_id="p1"))
+            kit.add_product(f"p{i}", 1 if i else 3)
+        await ProductSetRepositoryImpl(db).create(kit)
+        for task_id in ("first", "second"):
+            task = _task(task_id, "1")
+            task.product_set_id = "kit"
+            await TaskRepositoryImpl(db).create(task)
+
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        await CompleteTaskUseCase(SqlAlchemyUnitOfWork(db)).execute(TaskId("first"))
+        # Задача, комплект, остатки одним IN и одно пакетное списание
+        assert len(statements) == 4
+
+        listed = {product.id.value: product for product in await products.list_by_ids([ProductId("p0"), ProductId("p1")])}
+        assert (listed["p0"].quantity.value, listed["p0"].status) == (0, ProductStatus.OUT_OF_STOCK)
+        assert listed["p1"].quantity.value == 2
+
+        # Товара p0 не осталось: ничего не списывается, задача не выполняется
+        error = None
+        try:
+            await CompleteTaskUseCase(SqlAlchemyUnitOfWork(db)).execute(TaskId("second"))
+        except ValueError as raised:
+            error = str(raised)
+        assert error == "Недостаточно товара на складе: Товар 0"
+        assert (await products.get_by_id(ProductId("p1"))).quantity.value == 2
+        assert (await TaskRepositoryImpl(db).get_by_id(TaskId("second"))).status == TaskStatus.PENDING
+
+        # Товар другого проекта комплектом задачи не списывается
+        await products.create(Product(id=ProductId("alien"), name="Чужой", quantity=Quantity(3), project_id="other"))
+        await ProductSetRepositoryImpl(db).create(ProductSet(id="alien-kit", name="Чужой набор", products={"alien": 1}, project_id="p1"))
+        task = _task("third", "1")
+        task.product_set_id = "alien-kit"
+        await TaskRepositoryImpl(db).create(task)
+        error = None
+        try:
+            await CompleteTaskUseCase(SqlAlchemyUnitOfWork(db)).execute(TaskId("third"))
+        except ValueError as raised:
+            error = str(raised)
+        assert error == "Товар комплекта не найден: alien"
+        assert await products.subtract_many({ProductId("alien"): 1}, datetime.utcnow(), "p1") == 0
+        assert (await products.get_by_id(ProductId("alien"))).quantity.value == 3
+
+    db = sessionmaker(bind=engine)()
+    try:
+        asyncio.run(run(db))
+    finally:
+        db.close()
+
+
+def test_inventory_reconciliation_in_chunks() -> None:
+    from sqlalchemy import event
+
+    from app.application.use_cases import InventoryCount, ReconcileInventoryUseCase
+    from app.domain.product import Product
+    from app.domain.value_objects import Barcode, ProductId, Quantity
+    from app.infrastructure.repositories import ProductRepositoryImpl
+    from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements = []
+
+    async def counts():
+        rows = [("p0", 5), ("b1", 0), ("p0", 1), ("missing", 1), ("p2", 9), ("b1", 5)]
+        for line, (key, counted) in enumerate(rows, start=1):
+            yield InventoryCount(line=line, key=key, counted=counted)
+
+    async def run(db) -> None:
+        products = ProductRepositoryImpl(db)
+        for i in range(3):
+            await products.create(
+                Product(id=ProductId(f"p{i}"), name=f"Товар {i}", quantity=Quantity(i + 1), barcode=Barcode(f"b{i}"))
+            )
+
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2].split()[0]))
+        discrepancies = []
+        summary = await ReconcileInventoryUseCase(SqlAlchemyUnitOfWork(db), chunk_size=2).execute(
+            counts(), discrepancies.append
+        )
+        # По одному запросу с IN на порцию и один пакетный UPDATE в конце
+        assert statements == ["SELECT", "SELECT", "SELECT", "UPDATE"]
+        assert (summary.rows, summary.matched, summary.corrected, summary.unknown) == (6, 5, 2, 1)
+        # Повторы в другой порции: строка 3 отменила исправление строки 1,
+        # строка 6 заменила строку 2 и сверена с учётным остатком, а не со строкой 2
+        assert [(d.line, d.expected, d.difference) for d in discrepancies] == [(4, None, None), (5, 3, 6), (6, 2, 3)]
+
+        stock = {p.id.value: p.quantity.value for p in await products.list_by_ids([ProductId(f"p{i}") for i in range(3)])}
+        assert stock == {"p0": 1, "p1": 5, "p2": 9}
+
+    db = sessionmaker(bind=engine)()
+    try:
+        asyncio.run(run(db))
+    finally:
+        db.close()
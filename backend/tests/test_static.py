@@ -0,0 +1,43 @@
+import brotli
+from fastapi.testclient import TestClient
+
+from app.infrastructure.static_assets import StaticAssetStore, get_asset_store
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_store_fingerprints_and_precompresses(tmp_path) -> None:
+    script = b"console.log('mini app');\n" * 100
+    (tmp_path / "app.js").write_bytes(script)
+    (tmp_path / "index.html").write_text('<script src="/static/app.js"></script><img src="/static/missing.png">')
+
+    store = StaticAssetStore(tmp_path)
+    asset, hashed = store.lookup(store.url_for("app.js").removeprefix("/static/"))
+    assert hashed and asset.path == "app.js"
+    assert store.lookup("app.js") == (asset, False)
+    assert store.get("index.html").variants["identity"] == (
+        f'<script src="{store.url_for("app.js")}"></script><img src="/static/missing.png">'.encode()
+    )
+
+    encoding, body, etag = asset.select("gzip, br")
+    assert encoding == "br" and brotli.decompress(body) == script
+    assert asset.select("identity")[1:] == (script, f'"{asset.digest}"')
+
+
+def test_index_revalidates_and_hashed_assets_are_immutable() -> None:
+    first = client.get("/", headers={"Accept-Encoding": "br"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "br"
+    assert first.headers["cache-control"] == "no-cache"
+
+    repeat = client.get("/", headers={"Accept-Encoding": "br", "If-None-Match": first.headers["etag"]})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+
+    hashed = client.get(f"/static/{get_asset_store().get('index.html').hashed_path}")
+    assert hashed.status_code == 200
+    assert hashed.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert hashed.text == first.text
+    assert client.get("/static/missing.js").status_code == 404
+
@@ -0,0 +1,192 @@
+import json
+from urllib.parse import quote
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def _auth(telegram_id: int) -> dict:
+    return {"X-Telegram-Init-Data": f"user={quote(json.dumps({'id': telegram_id}))}"}
+
+
+def _create_user(telegram_id: int, project_id: str) -> None:
+    client.post(
+        "/api/v1/users/",
+        json={
+            "telegram_id": telegram_id,
+            "username": f"user{telegram_id}",
+            "full_name": "Тестовый Пользователь",
+            "role": "manager",
+            "project_id": project_id,
+        },
+        headers=_auth(telegram_id),
+    )
+
+
+def test_batch_create_tasks() -> None:
+    _create_user(1001, "batch")
+    _create_user(1002, "batch")
+
+    response = client.post(
+        "/api/v1/tasks/batch",
+        json={
+            "project_id": "batch",
+            "tasks": [{"title": f"Открытие смены {i}", "assignee_id": "1002"} for i in range(3)],
+        },
+        headers=_auth(1001),
+    )
+    assert response.status_code == 201
+    created = response.json()
+    assert [task["title"] for task in created] == [f"Открытие смены {i}" for i in range(3)]
+    assert len({task["id"] for task in created}) == 3
+
+    listed = client.get("/api/v1/tasks/", params={"project_id": "batch"}).json()
+    assert len(listed["tasks"]) == 3
+
+    # Без project_id задачи попадают в проект создателя, в чужой проект — не попадают
+    response = client.post("/api/v1/tasks/batch", json={"tasks": [{"title": "Закрытие смены"}]}, headers=_auth(1001))
+    assert [task["project_id"] for task in response.json()] == ["batch"]
+    response = client.post(
+        "/api/v1/tasks/batch",
+        json={"project_id": "batch-missing", "tasks": [{"title": "Чужая смена"}]},
+        headers=_auth(1001),
+    )
+    assert (response.status_code, response.json()["detail"]) == (400, "Нельзя создавать задачи в чужом проекте")
+
+
+def test_batch_with_unknown_assignee_creates_nothing() -> None:
+    _create_user(1003, "batch-missing")
+
+    response = client.post(
+        "/api/v1/tasks/batch",
+        json={
+            "project_id": "batch-missing",
+            "tasks": [{"title": "Есть исполнитель", "assignee_id": "1003"}, {"title": "Нет", "assignee_id": "404"}],
+        },
+        headers=_auth(1003),
+    )
+    assert response.status_code == 400
+    assert client.get("/api/v1/tasks/", params={"project_id": "batch-missing"}).json()["tasks"] == []
+
+
+def test_complete_task_only_once() -> None:
+    _create_user(1004, "complete")
+    task = client.post("/api/v1/tasks/", json={"title": "Пересчитать кассу"}, headers=_auth(1004)).json()
+    # Задача попадает в кэш чтений
+    assert client.get(f"/api/v1/tasks/{task['id']}").json()["status"] == "pending"
+
+    first = client.post(f"/api/v1/tasks/{task['id']}/complete", json={"comment": "Готово"})
+    assert first.status_code == 200
+    assert first.json()["status"] == "completed"
+
+    # Выполнение через единицу работы сбрасывает кэш задачи
+    assert client.get(f"/api/v1/tasks/{task['id']}").json()["status"] == "completed"
+
+    second = client.post(f"/api/v1/tasks/{task['id']}/complete", json={})
+    assert second.status_code == 400
+    assert client.post("/api/v1/tasks/missing/complete", json={}).status_code == 400
+
+
+def test_current_user_is_cached_between_requests() -> None:
+    from sqlalchemy import event
+
+    from app.infrastructure import database
+
+    _create_user(1201, "cache")
+    response = client.post("/api/v1/users/", json={
+        "telegram_id": 1201, "username": "dup", "full_name": "Повтор", "role": "manager",
+    }, headers=_auth(1201))
+    assert response.status_code == 400
+
+    statements = []
+
+    def remember(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engines = [database.engine, database.read_engine]
+    for target in engines:
+        event.listen(target, "before_cursor_execute", remember)
+    try:
+        response = client.post("/api/v1/tasks/", json={"title": "Пересчёт"}, headers=_auth(1201))
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", remember)
+    assert response.status_code == 201
+    assert not any("FROM users" in statement for statement in statements)
+
+    # Изменение пользователя через репозиторий сбрасывает запись кэша
+    import asyncio
+    from app.infrastructure.cache import cached_users
+    from app.infrastructure.repositories import UserRepositoryImpl
+
+    with database.SessionLocal() as session:
+        user_repo = cached_users(UserRepositoryImpl(session))
+        user = asyncio.run(user_repo.get_by_telegram_id(1201))
+        user.full_name = "Переименован"
+        asyncio.run(user_repo.update(user))
+        assert asyncio.run(user_repo.get_by_telegram_id(1201)).full_name == "Переименован"
+
+
+def test_conditional_get_answers_not_modified() -> None:
+    from sqlalchemy import event
+
+    from app.infrastructure import database
+
+    _create_user(1401, "etag")
+    task = client.post(
+        "/api/v1/tasks/", json={"title": "Выкладка", "assignee_id": "1401"}, headers=_auth(1401)
+    ).json()
+    listing = client.get("/api/v1/tasks/", params={"assignee_id": "1401"})
+    etag = listing.headers["etag"]
+    single_etag = client.get(f"/api/v1/tasks/{task['id']}").headers["etag"]
+
+    statements = []
+
+    def remember(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engines = [database.engine, database.read_engine]
+    for target in engines:
+        event.listen(target, "before_cursor_execute", remember)
+    try:
+        unchanged = client.get("/api/v1/tasks/", params={"assignee_id": "1401"}, headers={"If-None-Match": etag})
+        single = client.get(f"/api/v1/tasks/{task['id']}", headers={"If-None-Match": single_etag.removeprefix("W/")})
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", remember)
+    assert unchanged.status_code == 304 and unchanged.content == b""
+    # Ответ 304 несёт тот же тег, что и ответ 200
+    assert unchanged.headers["etag"] == etag and etag.startswith("W/")
+    assert single.status_code == 304
+    # Проверялись только версии, сами задачи не загружались
+    assert not any("tasks.title" in statement for statement in statements)
+
+    client.post(f"/api/v1/tasks/{task['id']}/complete", json={})
+    changed = client.get("/api/v1/tasks/", params={"assignee_id": "1401"}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["tasks"][0]["status"] == "completed"
+
+
+def test_fast_json_matches_validated_responses(monkeypatch) -> None:
+    from app.presentation import responses
+
+    _create_user(1030, "fast-json")
+    created = client.post(
+        "/api/v1/tasks/", json={"title": "Выкладка", "assignee_id": "1030"}, headers=_auth(1030)
+    ).json()
+    urls = [f"/api/v1/tasks/{created['id']}", "/api/v1/tasks/?project_id=fast-json", "/api/v1/users/1030"]
+    validated = [client.get(url) for url in urls]
+
+    monkeypatch.setattr(responses, "FAST_JSON", True)
+    fast = [client.get(url) for url in urls]
+    for slow_response, fast_response in zip(validated, fast):
+        assert fast_response.json() == slow_response.json()
+        assert fast_response.headers["etag"] == slow_response.headers["etag"]
+
+    response = client.post("/api/v1/tasks/", json={"title": "Приёмка"}, headers=_auth(1030))
+    assert response.status_code == 201
+    assert response.json()["title"] == "Приёмка"
@@ -0,0 +1,55 @@
+import hashlib
+import hmac
+import json
+from urllib.parse import urlencode
+
+from app.infrastructure import telegram_auth
+from app.infrastructure.telegram_auth import TelegramInitDataVerifier, validate_telegram_init_data
+
+BOT_TOKEN = "123456:TEST"
+
+
+def _sign(fields: dict) -> str:
+    data_check_string = "\n".join(f"{k}={v}" for k, v in sorted(fields.items()))
+    secret_key = hmac.new(b"WebAppData", BOT_TOKEN.encode(), hashlib.sha256).digest()
+    hash_value = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
+    return urlencode({**fields, "hash": hash_value})
+
+
+def _init_data(telegram_id: int = 42, auth_date: int = 1_000_000) -> str:
+    return _sign({"auth_date": str(auth_date), "user": json.dumps({"id": telegram_id})})
+
+
+def test_verifier_checks_signature_and_auth_date() -> None:
+    now = [1_000_100.0]
+    verifier = TelegramInitDataVerifier(BOT_TOKEN, max_age_seconds=3600, clock=lambda: now[0])
+    init_data = _init_data()
+
+    assert verifier.verify(init_data).user_id == 42
+    assert validate_telegram_init_data(init_data, BOT_TOKEN)
+    assert not validate_telegram_init_data(init_data, "other:TOKEN")
+
+    # Подмена поля при сохранённом hash не проходит, даже если hash уже в кэше
+    assert verifier.verify(init_data.replace("42", "43")) is None
+
+    # Истёкший auth_date отклоняется и для строки из кэша
+    now[0] += 3600
+    assert verifier.verify(init_data) is None
+
+
+def test_verifier_caches_verified_init_data(monkeypatch) -> None:
+    verifier = TelegramInitDataVerifier(BOT_TOKEN, max_age_seconds=None, cache_size=2)
+    first, second, third = (_init_data(telegram_id) for telegram_id in (1, 2, 3))
+    assert verifier.verify(first) and verifier.verify(second)
+
+    parses = []
+    monkeypatch.setattr(telegram_auth, "parse_init_data", lambda raw: parses.append(raw))
+    assert verifier.verify(first).user_id == 1
+    assert parses == []
+
+    # Кэш ограничен: третья строка вытесняет самую старую
+    monkeypatch.undo()
+    assert verifier.verify(third)
+    monkeypatch.setattr(telegram_auth, "parse_init_data", lambda raw: parses.append(raw))
+    assert verifier.verify(second) is None
+    assert parses == [second]